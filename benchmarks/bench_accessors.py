@@ -0,0 +1,66 @@
+"""
+Measure the cost of reading and assigning the properties of bindable
+classes.
+
+`get` and `set` access a property nobody subscribed to, `set/observed`
+assigns a property which has a subscriber, and `set/suppressed` assigns
+an unchanged value to a property which suppresses those. `plain` does
+the same with a plain dataclass, for reference.
+
+    python -m benchmarks.bench_accessors
+"""
+
+import timeit
+from dataclasses import dataclass
+
+import coil
+from coil._core import add_subscription
+
+NUMBER = 20_000
+
+
+@dataclass
+class Plain:
+    value: int
+
+
+@coil.bindableclass
+class Box:
+    value: int
+
+
+@coil.bindableclass(slots=True)
+class SlottedBox:
+    value: int
+
+
+@coil.bindableclass(suppress="equality")
+class SuppressedBox:
+    value: int
+
+
+def bench(statement: str, obj: object) -> float:
+    best = min(
+        timeit.repeat(statement, globals={"obj": obj}, number=NUMBER, repeat=5)
+    )
+    return best / NUMBER
+
+
+def main() -> None:
+    observed = Box(0)
+    add_subscription(observed, "value", lambda event: None)
+
+    for name, statement, obj in [
+        ("plain/get", "obj.value", Plain(0)),
+        ("plain/set", "obj.value = 1", Plain(0)),
+        ("get", "obj.value", Box(0)),
+        ("set", "obj.value = 1", Box(0)),
+        ("set/slots", "obj.value = 1", SlottedBox(0)),
+        ("set/observed", "obj.value = 1", observed),
+        ("set/suppressed", "obj.value = 0", SuppressedBox(0)),
+    ]:
+        print(f"{name + ' (ns)':<24} {bench(statement, obj) * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
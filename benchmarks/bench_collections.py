@@ -0,0 +1,62 @@
+"""
+Measure the cost of forwarding changes of a large list through a tail.
+
+Grows a list of `SIZE` items by `APPENDS` items, one at a time, while an
+eager [coil.tail][] forwards it into another property. `replace` assigns
+a new list for each item (as is required of plain lists), and `append`
+appends to a [coil.BindableList][], whose changes the tail applies in
+place.
+
+    python -m benchmarks.bench_collections
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from coil import BindableList, bind, bindableclass, tail
+
+SIZE = 10_000
+APPENDS = 1_000
+
+
+@bindableclass
+class Box:
+    value: Any
+
+
+def replace(box: Box, item: int) -> None:
+    box.value = [*box.value, item]
+
+
+def append(box: Box, item: int) -> None:
+    box.value.append(item)
+
+
+async def bench(change: Callable[[Box, int], None]) -> float:
+    source = Box(BindableList(range(SIZE)))
+    target = Box(BindableList())
+    forwarding = tail(
+        bind((source, "value")),
+        into=bind((target, "value"), readonly=False),
+        eager=True,
+    )
+
+    start = time.perf_counter()
+    for i in range(APPENDS):
+        change(source, i)
+    elapsed = time.perf_counter() - start
+
+    assert len(target.value) == SIZE + APPENDS
+    forwarding.cancel()
+    return elapsed / APPENDS
+
+
+def main() -> None:
+    for name, change in [("replace", replace), ("append", append)]:
+        per_change = min(asyncio.run(bench(change)) for _ in range(3))
+        print(f"{name + ' (us)':<18} {per_change * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure the cost of propagating a write through a chain of bindings.
+
+Each link of the chain forwards the event it receives into the next box
+with `TwoWayBinding.set(..., source_event=event)`, which is what
+[coil.tail][] does, minus the asyncio scheduling. This isolates the cost
+of `notify_subscribers` (and its cycle check) as a function of how deep
+the event lineage has become.
+
+    python -m benchmarks.bench_cycle_detection
+"""
+
+import sys
+import timeit
+from typing import Any, Coroutine, List
+
+from coil import bind, bindableclass
+from coil._core import add_subscription
+from coil.types import DataEvent
+
+DEPTHS = (1, 10, 100, 500)
+
+
+@bindableclass
+class Box:
+    value: int
+
+
+def drive(coro: Coroutine[Any, Any, None]) -> None:
+    # TwoWayBinding.set never suspends, so it can be run inline.
+    try:
+        coro.send(None)
+    except StopIteration:
+        pass
+
+
+def make_chain(depth: int) -> List[Box]:
+    boxes = [Box(0) for _ in range(depth + 1)]
+
+    for box, next_box in zip(boxes, boxes[1:]):
+        into = bind((next_box, "value"), readonly=False)
+
+        def forward(event: DataEvent, into: Any = into) -> None:
+            if "value" in event:
+                drive(into.set(event["value"], source_event=event))
+
+        add_subscription(box, "value", forward)
+
+    return boxes
+
+
+def main() -> None:
+    # every hop nests a few frames deeper
+    sys.setrecursionlimit(20 * max(DEPTHS))
+    print(f"{'depth':>8} {'per write (us)':>16} {'per hop (ns)':>14}")
+
+    for depth in DEPTHS:
+        head = bind((make_chain(depth)[0], "value"), readonly=False)
+        number = max(1, 20_000 // depth)
+        best = min(
+            timeit.repeat(
+                "drive(head.set(1))",
+                globals={"drive": drive, "head": head},
+                number=number,
+                repeat=5,
+            )
+        )
+        per_write = best / number
+        print(
+            f"{depth:>8} {per_write * 1e6:>16.1f} "
+            f"{per_write / depth * 1e9:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Measure how many events per second coil can generate and deliver.
+
+`type guards` times the predicates from `coil.types` on an update event.
+`stream` times assignments to a bound property, and then draining the
+events they produced from a [coil.protocols.Bound.events][] stream.
+`burst` does the same for bursts of `BURST` assignments, with streams
+that queue every event, and with streams that keep only the latest one.
+`fan-out` delivers bursts to `READERS` streams of the same property,
+each with its own queue, and `fan-out/shared` with broadcast streams
+(counting each event once per reader).
+
+    python -m benchmarks.bench_events
+"""
+
+import asyncio
+import timeit
+from typing import Any
+
+from coil import bind, bindableclass
+from coil.types import (
+    DataUpdatedEvent,
+    is_data_event,
+    is_delete_event,
+    is_update_event,
+)
+
+EVENTS = 100_000
+BURST = 10_000
+READERS = 500
+
+
+@bindableclass
+class Box:
+    value: int
+
+
+def bench_type_guards() -> float:
+    event = DataUpdatedEvent(
+        source_event=None, source=bind((Box(0), "value")), value=1
+    )
+    number = EVENTS
+    best = min(
+        timeit.repeat(
+            "is_data_event(event);"
+            "is_update_event(event);"
+            "is_delete_event(event)",
+            globals={
+                "event": event,
+                "is_data_event": is_data_event,
+                "is_update_event": is_update_event,
+                "is_delete_event": is_delete_event,
+            },
+            number=number,
+            repeat=5,
+        )
+    )
+    return number / best
+
+
+async def bench_stream() -> float:
+    box = Box(0)
+    binding = bind((box, "value"), readonly=False)
+    events = binding.events().__aiter__()
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for i in range(EVENTS):
+        await binding.set(i)
+    for i in range(EVENTS):
+        await events.__anext__()
+    return EVENTS / (loop.time() - start)
+
+
+async def bench_burst(maxsize: int) -> float:
+    box = Box(0)
+    binding = bind((box, "value"), readonly=False)
+    events = binding.events(maxsize=maxsize).__aiter__()
+    loop = asyncio.get_running_loop()
+
+    async def consume() -> None:
+        async for event in events:
+            if event["value"] == BURST - 1:
+                break
+
+    start = loop.time()
+    for _ in range(10):
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        for i in range(BURST):
+            await binding.set(i)
+        await consumer
+    return 10 * BURST / (loop.time() - start)
+
+
+async def bench_fan_out(broadcast: bool) -> float:
+    box = Box(0)
+    binding = bind((box, "value"), broadcast=broadcast)
+    loop = asyncio.get_running_loop()
+    streams = [binding.events().__aiter__() for _ in range(READERS)]
+
+    async def consume(events: Any) -> None:
+        async for event in events:
+            if event["value"] == BURST // 10 - 1:
+                break
+
+    start = loop.time()
+    for _ in range(10):
+        consumers = [asyncio.create_task(consume(s)) for s in streams]
+        await asyncio.sleep(0)
+        for i in range(BURST // 10):
+            box.value = i
+        await asyncio.gather(*consumers)
+    return READERS * BURST / (loop.time() - start)
+
+
+def main() -> None:
+    print(f"{'benchmark':>14} {'events/s':>12}")
+    print(f"{'type guards':>14} {bench_type_guards():>12,.0f}")
+    stream = max(asyncio.run(bench_stream()) for _ in range(3))
+    print(f"{'stream':>14} {stream:>12,.0f}")
+    for name, maxsize in [("burst", 0), ("burst/latest", 1)]:
+        burst = max(asyncio.run(bench_burst(maxsize)) for _ in range(3))
+        print(f"{name:>14} {burst:>12,.0f}")
+    for name, broadcast in [("fan-out", False), ("fan-out/shared", True)]:
+        fan_out = max(asyncio.run(bench_fan_out(broadcast)) for _ in range(3))
+        print(f"{name:>14} {fan_out:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
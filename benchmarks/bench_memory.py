@@ -0,0 +1,76 @@
+"""
+Measure how much memory each instance of a bindable class takes.
+
+Allocates `N` records with three properties, and reports the bytes
+allocated per record, for a plain dataclass, a bindable class, and a
+bindable class with `slots=True`; `subscribed` adds a subscription to
+each record first.
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import coil
+from coil._core import add_subscription
+
+N = 10_000
+
+
+@dataclass
+class Plain:
+    x: float
+    y: float
+    label: str
+
+
+@coil.bindableclass
+class Record:
+    x: float
+    y: float
+    label: str
+
+
+@coil.bindableclass(slots=True)
+class SlottedRecord:
+    x: float
+    y: float
+    label: str
+
+
+def per_instance(make: Callable[[int], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    records = [make(i) for i in range(N)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    # the list of records isn't part of the instances
+    return size / N - 8
+
+
+def subscribed(cls: Any) -> Callable[[int], Any]:
+    def make(i: int) -> Any:
+        record = cls(0.0, 1.0, "label")
+        add_subscription(record, "x", print)
+        return record
+
+    return make
+
+
+def main() -> None:
+    for name, make in [
+        ("dataclass", lambda i: Plain(0.0, 1.0, "label")),
+        ("bindable", lambda i: Record(0.0, 1.0, "label")),
+        ("slots", lambda i: SlottedRecord(0.0, 1.0, "label")),
+        ("bindable/subscribed", subscribed(Record)),
+        ("slots/subscribed", subscribed(SlottedRecord)),
+    ]:
+        print(f"{name + ' (B)':<24} {per_instance(make):>6.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measure the cost of the events of a path binding.
+
+Subscribes to `customer.address.city` of an order, and times updates of
+the city (`leaf`), and replacements of the customer (`relink`), which
+resubscribe the links that follow it and compare the cities; `unchanged`
+replaces the customer with one in the same city, which notifies nobody.
+
+    python -m benchmarks.bench_paths
+"""
+
+import timeit
+
+from coil import BindableValue, bind, bindableclass
+from coil._core import add_subscription
+
+NUMBER = 20_000
+
+
+@bindableclass
+class Address:
+    city: BindableValue[str]
+
+
+@bindableclass
+class Customer:
+    address: BindableValue[Address]
+
+
+@bindableclass
+class Order:
+    customer: BindableValue[Customer]
+
+
+def main() -> None:
+    order = Order(Customer(Address("Paris")))
+    path = bind((order, "customer.address.city"))
+    add_subscription(path.host, path.prop, lambda event: None)
+    customers = [Customer(Address(str(i % 2))) for i in range(2)]
+    same = [Customer(Address("Paris")) for _ in range(2)]
+    names = {
+        "leaf": "order.customer.address.city = str(i % 2)",
+        "relink": "order.customer = customers[i % 2]",
+        "unchanged": "order.customer = same[i % 2]",
+    }
+
+    for name, statement in names.items():
+        best = min(
+            timeit.repeat(
+                f"for i in range({NUMBER}): {statement}",
+                globals=dict(order=order, customers=customers, same=same),
+                number=1,
+                repeat=5,
+            )
+        )
+        print(f"{name + ' (ns)':<18} {best / NUMBER * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measure the cost of registering and evicting runtime tasks.
+
+`rebind` assigns a bound value to the property of each of `N` boxes, and
+then assigns another bound value to each of them, which evicts (and
+replaces) the binding tasks of the first assignment. `evict` registers a
+task for each of `N` boxes with the runtime directly, and then evicts
+them one by one. `teardown` times the exit of a runtime which has `n`
+registered tasks left, and an eviction of a tenth of them still pending.
+
+    python -m benchmarks.bench_runtime
+"""
+
+import asyncio
+
+import coil
+
+N = 2_000
+TEARDOWN_COUNTS = [1_000, 10_000, 100_000]
+
+
+@coil.bindableclass
+class Box:
+    value: int
+
+
+async def bench_rebind() -> float:
+    source = Box(0)
+    boxes = [Box(0) for _ in range(N)]
+    loop = asyncio.get_running_loop()
+
+    async with coil.runtime():
+        for box in boxes:
+            box.value = coil.bind((source, "value"))
+
+        start = loop.time()
+        for box in boxes:
+            box.value = coil.bind((source, "value"))
+        elapsed = loop.time() - start
+
+    return elapsed / N
+
+
+async def bench_evict() -> float:
+    boxes = [Box(0) for _ in range(N)]
+    loop = asyncio.get_running_loop()
+
+    async with coil.runtime() as rt:
+        for box in boxes:
+            rt.register(loop.create_future(), "task", source=(box, "value"))
+
+        start = loop.time()
+        for box in boxes:
+            rt.evict("task", source=(box, "value"))
+        elapsed = loop.time() - start
+
+    return elapsed / N
+
+
+async def bench_teardown(count: int) -> float:
+    loop = asyncio.get_running_loop()
+    rt = coil.runtime()
+
+    async with rt:
+        for i in range(count):
+            rt.register(asyncio.create_task(asyncio.sleep(3600)), f"{i}")
+
+        # let the tasks start
+        await asyncio.sleep(0)
+
+        for i in range(0, count, 10):
+            rt.evict(f"{i}")
+
+        start = loop.time()
+
+    return loop.time() - start
+
+
+def main() -> None:
+    for name, bench in [("rebind", bench_rebind), ("evict", bench_evict)]:
+        best = min(asyncio.run(bench()) for _ in range(3))
+        print(f"{name + ' (us)':<16} {best * 1e6:>6.1f}")
+
+    for count in TEARDOWN_COUNTS:
+        best = min(asyncio.run(bench_teardown(count)) for _ in range(3))
+        print(f"{f'teardown/{count} (ms)':<24} {best * 1e3:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
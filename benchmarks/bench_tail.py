@@ -0,0 +1,88 @@
+"""
+Measure the latency of [coil.tail][] tasks, and the import time of coil.
+
+`per hop` is the time it takes for a write to travel through a chain of
+`DEPTH` boxes linked by tail tasks, divided by the number of links; the
+write is awaited by polling the last box, or with `per hop/sync`, by
+awaiting [coil.Runtime.synchronise][].
+`import` is the cumulative import time of coil reported by
+`python -X importtime`, with the standard library modules that coil
+uses imported beforehand.
+
+    python -m benchmarks.bench_tail
+"""
+
+import asyncio
+import re
+import subprocess
+import sys
+from typing import List
+
+from coil import bind, bindableclass, runtime, tail
+
+DEPTH = 100
+WRITES = 200
+
+
+@bindableclass
+class Box:
+    value: int
+
+
+async def bench_per_hop(synchronise: bool = False) -> float:
+    async with runtime() as rt:
+        boxes = [Box(0) for _ in range(DEPTH + 1)]
+        tasks: List[asyncio.Future[None]] = [
+            tail(
+                bind((box, "value")),
+                into=bind((next_box, "value"), readonly=False),
+            )
+            for box, next_box in zip(boxes, boxes[1:])
+        ]
+        head, last = boxes[0], boxes[-1]
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(0)
+
+        start = loop.time()
+        for i in range(1, WRITES + 1):
+            head.value = i
+            if synchronise:
+                await rt.synchronise()
+            while last.value != i:
+                await asyncio.sleep(0)
+        elapsed = loop.time() - start
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return elapsed / WRITES / DEPTH
+
+
+def bench_import() -> float:
+    statement = "import asyncio, contextvars, logging, pprint; import coil"
+    best = float("inf")
+    for _ in range(10):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        match = re.search(r"\|\s*(\d+) \| coil$", result.stderr, re.M)
+        assert match is not None
+        best = min(best, int(match.group(1)) / 1e6)
+    return best
+
+
+def main() -> None:
+    per_hop = min(asyncio.run(bench_per_hop()) for _ in range(3))
+    per_hop_sync = min(asyncio.run(bench_per_hop(True)) for _ in range(3))
+    imports = bench_import()
+    print(f"{'per hop (us)':<18} {per_hop * 1e6:>8.1f}")
+    print(f"{'per hop/sync (us)':<18} {per_hop_sync * 1e6:>8.1f}")
+    print(f"{'import (ms)':<18} {imports * 1e3:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
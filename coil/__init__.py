@@ -1,14 +1,28 @@
-from ._bindableclass import BindableValue, bindableclass
+from ._batch import Batch, batch
+from ._bindableclass import BindableValue, bindableclass, field
 from ._bindings import Binding, bind
-from ._core import tail
+from ._collections import BindableDict, BindableList
+from ._computed import Computed, computed
 from ._runtime import Runtime, runtime
+from ._tail import tail
+from ._timing import debounce, sample, throttle
 
 __all__ = [
+    "batch",
+    "Batch",
     "bind",
     "bindableclass",
+    "BindableDict",
+    "BindableList",
     "BindableValue",
     "Binding",
+    "computed",
+    "Computed",
+    "debounce",
+    "field",
     "runtime",
     "Runtime",
+    "sample",
     "tail",
+    "throttle",
 ]
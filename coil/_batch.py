@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from contextvars import Token
+from typing import Any, Dict, Tuple, Type
+
+from ._core import active_batches, current_batch, notify_subscribers
+from .protocols import Bindable
+from .types import DataEvent, DataUpdatedEvent, is_change_event
+
+
+class Batch:
+    """
+    A context manager which defers change notifications.
+
+    While a batch is active, notifications raised in the current context
+    (by assigning or deleting bindable properties, or by setting two-way
+    bindings) are collected instead of being sent to subscribers. When
+    the outermost batch exits, at most one event is sent per property:
+    the last one that was raised for it, which carries the final value
+    (or the deletion) of the property. Several changes made in place to
+    a [bindable collection][coil.BindableList] are announced as an
+    update with its final value.
+
+    Batches can be used both as synchronous and as asynchronous context
+    managers, and can be nested; nested batches are merged into the
+    outermost one. Values are assigned as soon as they are set, even
+    inside a batch, so notifications are sent when the batch exits
+    regardless of whether it exits with an exception.
+
+    Use [coil.batch][] to create one.
+    """
+
+    active: bool
+
+    def __init__(self) -> None:
+        self.active = False
+        self.__pending: Dict[
+            Tuple[int, str], Tuple[Bindable, str, DataEvent]
+        ] = {}
+        self.__token: Token[Batch | None] | None = None
+
+    def __enter__(self) -> Batch:
+        outer = current_batch.get()
+
+        if outer is None or not outer.active:
+            self.active = True
+            self.__token = current_batch.set(self)
+
+            with active_batches.lock:
+                active_batches.count += 1
+
+        return self
+
+    def __exit__(
+        self,
+        __exc_type: Type[BaseException] | None,
+        __exc_value: BaseException | None,
+        __traceback: Any,
+    ) -> None:
+        if self.__token is None:
+            # nested batch; the outermost one sends the notifications
+            return
+
+        current_batch.reset(self.__token)
+        self.__token = None
+        self.active = False
+
+        with active_batches.lock:
+            active_batches.count -= 1
+
+        pending, self.__pending = self.__pending, {}
+
+        for (bindable, prop, event) in pending.values():
+            notify_subscribers(bindable, prop, event)
+
+    async def __aenter__(self) -> Batch:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        __exc_type: Type[BaseException] | None,
+        __exc_value: BaseException | None,
+        __traceback: Any,
+    ) -> None:
+        self.__exit__(__exc_type, __exc_value, __traceback)
+
+    def defer(self, bindable: Bindable, prop: str, event: DataEvent) -> None:
+        """Collect a notification, replacing any earlier one which was
+        collected for the same property."""
+        key = (id(bindable), prop)
+
+        if key in self.__pending and is_change_event(event):
+            # the changes of a collection don't add up to the last one;
+            # its final value replaces them
+            event = DataUpdatedEvent(
+                source_event=event.source_event,
+                source=event.source,
+                value=event.value,
+                propagation=event.propagation,
+            )
+
+        self.__pending[key] = (bindable, prop, event)
+
+
+def batch() -> Batch:
+    """Defer change notifications until the end of a block.
+
+    Changes made inside the block are only announced once it exits,
+    and only the final state of each changed property is announced.
+    This avoids waking up streams and [coil.tail][] tasks for
+    intermediate states:
+
+        @coil.bindableclass
+        class Rect:
+            width: int
+            height: int
+
+        rect = Rect(1, 1)
+
+        with coil.batch():
+            for i in range(100):
+                rect.width = i
+                rect.height = i
+
+        # subscribers of rect.width and rect.height are notified
+        # once each, with the value 99
+
+    Returns a [coil.Batch][], which can also be used with `async with`.
+    """
+    return Batch()
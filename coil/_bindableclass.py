@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass, fields
-from typing import Any, Generic, Literal, NamedTuple, TypeVar, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Literal,
+    Mapping,
+    TypeVar,
+    overload,
+)
 
 from coil.protocols._bound import Bound, TwoWayBound
 
 from ._bindings import bind
-from ._core import bound_attr_name, notify_subscribers, tail
+from ._collections import BindableCollection
+from ._core import (
+    NO_SUBSCRIBERS,
+    Assignment,
+    active_batches,
+    bound_attr_name,
+    current_batch,
+    is_unchanged,
+    notify_subscribers,
+    unchanged_predicate,
+)
 from ._runtime import runtime
+from ._scheduler import raise_rank, rank_of
+from ._tail import tail
 from .protocols import Bindable
-from .types import DataDeletedEvent, DataUpdatedEvent
+from .types import (
+    Comparator,
+    DataDeletedEvent,
+    DataUpdatedEvent,
+    OverflowPolicy,
+)
 
 T = TypeVar("T", bound=type)
 V = TypeVar("V")
@@ -17,19 +45,191 @@ V = TypeVar("V")
 
 TAIL_BINDING_TASK_ID = "_coil.tail"
 REVERSE_TAIL_BINDING_TASK_ID = "_coil.reverse-tail"
+SUPPRESS_METADATA_KEY = "coil.suppress"
 
+# values of these types are neither bound values nor bindable collections,
+# so assigning them skips checking for either
+_PLAIN_TYPES = frozenset({bool, bytes, complex, float, int, str, type(None)})
 
-def override_init(cls: T) -> None:
+
+def _init_slots(cls: T) -> None:
     old_init = cls.__init__  # type: ignore
 
-    def __init__(obj: Bindable, *args: Any, **kwargs: Any) -> None:
-        obj.__coil_bindings__ = {}  # type: ignore
+    def __init__(obj: Any, *args: Any, **kwargs: Any) -> None:
+        # a shared table; nothing is allocated until the first subscription
+        obj.__coil_bindings__ = NO_SUBSCRIBERS
         old_init(obj, *args, **kwargs)
 
     cls.__init__ = __init__  # type: ignore
 
 
+def _with_slots(cls: type, private_names: Iterable[str]) -> type:
+    # like dataclass(slots=True), but the slots back the private values
+    # of the properties rather than the properties themselves
+    private_names = tuple(private_names)
+    inherited = {name for base in cls.__mro__[1:] for name in vars(base)}
+    slots = tuple(
+        name
+        for name in (*private_names, "__coil_bindings__", "__weakref__")
+        if name not in inherited
+    )
+    namespace = dict(vars(cls))
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = slots
+
+    # the subscribers of an object aren't copied (nor pickled) along with
+    # its values
+    def __getstate__(obj: Any) -> Dict[str, Any]:
+        return {
+            name: getattr(obj, name)
+            for name in private_names
+            if hasattr(obj, name)
+        }
+
+    def __setstate__(obj: Any, state: Dict[str, Any]) -> None:
+        obj.__coil_bindings__ = NO_SUBSCRIBERS
+
+        for name, value in state.items():
+            setattr(obj, name, value)
+
+    namespace.setdefault("__getstate__", __getstate__)
+    namespace.setdefault("__setstate__", __setstate__)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__  # for pickling nested classes
+
+    for value in namespace.values():
+        _rebind_class_cell(value, cls, slotted)
+
+    return slotted
+
+
+def _rebind_class_cell(value: Any, old: type, new: type) -> None:
+    # methods which call super() without arguments refer to their class
+    # through a closure cell, which still holds the class that was replaced
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    elif isinstance(value, property):
+        for accessor in (value.fget, value.fset, value.fdel):
+            _rebind_class_cell(accessor, old, new)
+        return
+
+    code = getattr(value, "__code__", None)
+
+    if code is None or value.__closure__ is None:
+        return
+
+    for name, cell in zip(code.co_freevars, value.__closure__):
+        if name == "__class__" and cell.cell_contents is old:
+            cell.cell_contents = new
+
+
+def _comparison(suppress: Comparator | None) -> str | None:
+    if suppress is None:
+        return None
+    elif suppress == "identity":
+        return "old is value"
+    elif suppress == "equality":
+        return "old == value"
+    else:
+        return "unchanged(old, value)"
+
+
+def _field_accessors(
+    name: str, suppress: Comparator | None
+) -> type[BindableValue[Any]]:
+    """Return a subclass of [BindableValue][coil.BindableValue] with
+    `__get__` and `__set__` generated for a field (the way `dataclasses`
+    generates `__init__`), which access the private value directly, and
+    skip building an event when the field has no subscribers."""
+    private_name = bound_attr_name(name)
+    comparison = _comparison(suppress)
+    lines = [
+        "def __get__(self, obj, owner):",
+        "    if obj is None:",
+        "        return self",
+        f"    return obj.{private_name}",
+        "def __set__(self, obj, value):",
+        "    if type(value) not in PLAIN_TYPES:",
+        "        if hasattr(value, 'events') and isinstance(",
+        "            value, BOUND_TYPES",
+        "        ):",
+        "            self._assign_bound_value(obj, value)",
+        "            return",
+        "        if hasattr(value, '_attach') and isinstance(",
+        "            value, BindableCollection",
+        "        ):",
+        f"            value = value._attach(obj, {name!r})",
+    ]
+
+    if comparison is not None:
+        lines += [
+            "    try:",
+            f"        old = obj.{private_name}",
+            "    except AttributeError:",
+            "        pass",
+            "    else:",
+            f"        if {comparison}:",
+            f"            obj.{private_name} = value",
+            "            return",
+        ]
+
+    lines += [
+        f"    obj.{private_name} = value",
+        # a batch defers the event, until there may be subscribers
+        f"    if ({name!r} in obj.__coil_bindings__ or (",
+        "        active_batches.count and current_batch.get() is not None",
+        "    )):",
+        "        notify_subscribers(",
+        f"            obj, {name!r}, DataUpdatedEvent(",
+        "                source_event=None,",
+        "                value=value,",
+        f"                source=Assignment(obj, {name!r}),",
+        "            ),",
+        "        )",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec(
+        "\n".join(lines),
+        {
+            "Assignment": Assignment,
+            "BOUND_TYPES": (Bound, TwoWayBound),
+            "BindableCollection": BindableCollection,
+            "DataUpdatedEvent": DataUpdatedEvent,
+            "PLAIN_TYPES": _PLAIN_TYPES,
+            "active_batches": active_batches,
+            "current_batch": current_batch,
+            "notify_subscribers": notify_subscribers,
+            "unchanged": unchanged_predicate(suppress),
+        },
+        namespace,
+    )
+
+    for fn in namespace.values():
+        fn.__qualname__ = f"BindableValue.{fn.__name__}"
+
+    return type("BindableValue", (BindableValue,), namespace)
+
+
+@overload
 def bindableclass(cls: T) -> T:
+    pass
+
+
+@overload
+def bindableclass(
+    *, suppress: Comparator | None = None, slots: bool = False
+) -> Callable[[T], T]:
+    pass
+
+
+def bindableclass(
+    cls: T | None = None,
+    *,
+    suppress: Comparator | None = None,
+    slots: bool = False,
+) -> Any:
     """Decorate a class as [coil.protocols.Bindable][].
 
     This enables to bind to the classes' declared properties
@@ -42,14 +242,82 @@ def bindableclass(cls: T) -> T:
             value: Any
 
     Classes generated by this decorator are also dataclasses.
+
+    Args:
+        suppress: The default [`Comparator`][coil.types.Comparator] of
+            the properties of the class, which tells the assignments
+            that don't change their value (and shouldn't notify their
+            subscribers). By default, every assignment notifies
+            subscribers. Properties can override the default with
+            [coil.field][]:
+
+                @coil.bindableclass(suppress="equality")
+                class Reading:
+                    value: float
+                    samples: List[float] = coil.field(
+                        default_factory=list, suppress="identity"
+                    )
+        slots: Whether to store the values of the properties in slots,
+            rather than in a `__dict__` of each instance (which instances
+            of slotted classes don't have, unless a base class which
+            isn't slotted gives them one). Like
+            [`dataclass(slots=True)`][dataclasses.dataclass], this
+            creates a new class. Instances can be pickled and copied;
+            their copies start without subscribers.
+
+    Instances only get a table of subscribers when they are first
+    subscribed to, so bindable objects which are never bound cost no
+    more than plain dataclasses.
     """
-    data_cls: Any = dataclass(cls)
-    override_init(data_cls)
 
-    for field in fields(data_cls):
-        setattr(data_cls, field.name, BindableValue(field.name))
+    def decorate(cls: T) -> T:
+        data_cls: Any = dataclass(cls)
 
-    return data_cls  # type: ignore
+        if slots:
+            data_cls = _with_slots(
+                data_cls, (bound_attr_name(f.name) for f in fields(data_cls))
+            )
+            _init_slots(data_cls)
+        else:
+            data_cls.__coil_bindings__ = NO_SUBSCRIBERS
+
+        for field in fields(data_cls):
+            field_suppress = field.metadata.get(
+                SUPPRESS_METADATA_KEY, suppress
+            )
+            accessors = _field_accessors(field.name, field_suppress)
+            setattr(
+                data_cls,
+                field.name,
+                accessors(field.name, suppress=field_suppress),
+            )
+
+        return data_cls  # type: ignore
+
+    return decorate if cls is None else decorate(cls)
+
+
+def field(
+    *,
+    suppress: Comparator | None,
+    metadata: Mapping[Any, Any] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Declare a property of a [bindable class][coil.bindableclass] with
+    its own settings.
+
+    This is a [`dataclasses.field`][dataclasses.field] (which receives
+    any other arguments), with these additional settings:
+
+    Args:
+        suppress: The [`Comparator`][coil.types.Comparator] of the
+            property, overriding the default of the class; `None`
+            means that every assignment notifies subscribers.
+    """
+    return dataclasses.field(
+        metadata={**(metadata or {}), SUPPRESS_METADATA_KEY: suppress},
+        **kwargs,
+    )
 
 
 class BindableValue(Generic[V]):
@@ -76,12 +344,16 @@ class BindableValue(Generic[V]):
 
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, *, suppress: Comparator | None = None):
         self.name = name
+        self.private_name = bound_attr_name(name)
+        self.suppress = suppress
+        self._unchanged = unchanged_predicate(suppress)
 
     def __set_name__(self, obj: Bindable, name: str) -> None:
         # use this to register mutation events on object
         self.name = name
+        self.private_name = bound_attr_name(name)
 
     @overload
     def __get__(self, obj: None, owner: Any) -> BindableValue[V]:
@@ -99,10 +371,28 @@ class BindableValue(Generic[V]):
         return getattr(obj, self.private_name)
 
     def __set__(self, obj: Bindable, value: V | Bound | TwoWayBound) -> None:
-        if isinstance(value, (Bound, TwoWayBound)):
+        # checking for a protocol member first avoids a (much slower)
+        # structural check on plain values; likewise for the (abstract)
+        # base class of collections
+        if hasattr(value, "events") and isinstance(
+            value, (Bound, TwoWayBound)
+        ):
             self._assign_bound_value(obj, value)
         else:
+            if hasattr(value, "_attach") and isinstance(
+                value, BindableCollection
+            ):
+                value = value._attach(obj, self.name)  # type: ignore
+
+            # checked before anything is allocated for the notification
+            unchanged = is_unchanged(
+                self._unchanged, obj, self.private_name, value
+            )
             setattr(obj, self.private_name, value)
+
+            if unchanged:
+                return
+
             notify_subscribers(
                 obj,
                 self.name,
@@ -127,12 +417,17 @@ class BindableValue(Generic[V]):
         self, obj: Bindable, assigned_bound_value: Bound | TwoWayBound
     ) -> None:
         rt = runtime(ensure=False)
-        self_bound_value = self.bind(obj, readonly=False)
+
+        # the tail tasks are owned by the runtime; they must not keep obj
+        # alive, so that the runtime can evict them once obj is collected
+        self_bound_value = self.bind(obj, readonly=False, weak=True)
         rt_source = (obj, self.name)
 
         # evict any previously existing tail tasks
-        rt.evict(TAIL_BINDING_TASK_ID, source=rt_source)
-        rt.evict(REVERSE_TAIL_BINDING_TASK_ID, source=rt_source)
+        rt.evict_many(
+            (TAIL_BINDING_TASK_ID, REVERSE_TAIL_BINDING_TASK_ID),
+            source=rt_source,
+        )
 
         # if this is binding from and into the same property
         # important to do this after above evictions, because assigning a
@@ -145,13 +440,20 @@ class BindableValue(Generic[V]):
 
         # setup a tail task to copy changes from the assigned bound
         # value into the attribute controlled by the descriptor.
-        tail_task = tail(assigned_bound_value, into=self_bound_value)
+        tail_task = tail(
+            assigned_bound_value, into=self_bound_value, eager=rt.eager
+        )
         rt.register(tail_task, TAIL_BINDING_TASK_ID, source=rt_source)
+        raise_rank(
+            obj,
+            self.name,
+            1 + rank_of(assigned_bound_value.host, assigned_bound_value.prop),
+        )
 
         if isinstance(assigned_bound_value, TwoWayBound):
             # tail task in opposite direction
             reverse_tail_task = tail(
-                self_bound_value, into=assigned_bound_value
+                self_bound_value, into=assigned_bound_value, eager=rt.eager
             )
             rt.register(
                 reverse_tail_task,
@@ -164,18 +466,48 @@ class BindableValue(Generic[V]):
         setattr(obj, self.name, assigned_bound_value.current)
 
     @overload
-    def bind(self, obj: Bindable, *, readonly: Literal[True] = True) -> Bound:
+    def bind(
+        self,
+        obj: Bindable,
+        path: str = "",
+        *,
+        readonly: Literal[True] = True,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+        weak: bool = False,
+        broadcast: bool = False,
+    ) -> Bound:
         pass
 
     @overload
-    def bind(self, obj: Bindable, *, readonly: Literal[False]) -> TwoWayBound:
+    def bind(
+        self,
+        obj: Bindable,
+        path: str = "",
+        *,
+        readonly: Literal[False],
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+        weak: bool = False,
+        broadcast: bool = False,
+    ) -> TwoWayBound:
         pass
 
-    def bind(self, obj: Bindable, *, readonly: bool = True) -> Any:
+    def bind(
+        self,
+        obj: Bindable,
+        path: str = "",
+        *,
+        readonly: bool = True,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+        weak: bool = False,
+        broadcast: bool = False,
+    ) -> Any:
         """Get a binding for this value on a given object.
 
         Short hand for
-        [`bind((obj, attr), readonly=readonly)`][coil.bind]
+        [`bind((obj, attr), readonly=readonly, ...)`][coil.bind]
 
             from coil import bind, bindableclass
 
@@ -189,8 +521,18 @@ class BindableValue(Generic[V]):
             bind((box, "value"))
             Box.value.bind(box) # this is more type safe
 
+        With a `path`, the binding follows it from the value of this
+        property: `Order.customer.bind(order, "address.city")` is short
+        for `bind((order, "customer.address.city"))`.
         """
-        return bind((obj, self.name), readonly=readonly)  # type: ignore
+        return bind(  # type: ignore
+            (obj, f"{self.name}.{path}" if path else self.name),
+            readonly=readonly,
+            maxsize=maxsize,
+            overflow=overflow,
+            weak=weak,
+            broadcast=broadcast,
+        )
 
     def clear_last_binding(self, *, assigned_to: Bindable) -> None:
         """Clear an an ongoing binding that was assigned to a bindable.
@@ -249,16 +591,3 @@ class BindableValue(Generic[V]):
 
     def _assignment_source(self, obj: Bindable) -> "Assignment":
         return Assignment(obj, self.name)
-
-    @property
-    def private_name(self) -> str:
-        return bound_attr_name(self.name)
-
-
-class Assignment(NamedTuple):
-    host: Bindable
-    prop: str
-
-    @property
-    def current(self) -> Any:
-        return getattr(self.host, self.prop)
@@ -1,38 +1,111 @@
 import asyncio
+import sys
+import warnings
+import weakref
+from collections import deque
+from contextlib import suppress
 from logging import getLogger
-from typing import Any, AsyncIterable, Literal, Tuple, overload
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Protocol,
+    Tuple,
+    overload,
+)
 
+from ._collections import BindableCollection
 from ._core import (
+    _MISSING,
+    SubscriptionHandle,
     add_subscription,
     bound_attr_name,
     drop_subscription,
+    is_unchanged,
+    lineage_for,
     notify_subscribers,
+    propagation_for,
 )
-from .protocols import Bindable, Bound, TwoWayBound
+from ._scheduler import add_feed, raise_rank, rank_of
+from .protocols import Bindable, Bound, DataEventHandler, TwoWayBound
 from .types import (
+    DataChangedEvent,
     DataDeletedEvent,
     DataEvent,
     DataUpdatedEvent,
+    OverflowPolicy,
+    is_change_event,
     is_update_event,
 )
 
 LOG = getLogger("coil")
 
+COMPACT_THRESHOLD = 64
+# the buffers are keyed by the identity of their host, since bindable
+# classes (as dataclasses) are unhashable
+_broadcasts: Dict[Tuple[int, str], "BroadcastBuffer"] = {}
+
 
 class Binding(Bound):
-    def __init__(self, host: Bindable, prop: str) -> None:
-        self.__host = host
+    def __init__(
+        self,
+        host: Bindable,
+        prop: str,
+        *,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+        weak: bool = False,
+        broadcast: bool = False,
+    ) -> None:
+        self.__host = None if weak else host
+        self.__host_ref = weakref.ref(host) if weak else None
         self.__prop = prop
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.broadcast = broadcast
+
+    def events(
+        self,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> "BindingEventStream":
+        maxsize = self.maxsize if maxsize is None else maxsize
+        overflow = self.overflow if overflow is None else overflow
 
-    def events(self) -> AsyncIterable[DataUpdatedEvent]:
-        return BindingEventStream(self)
+        if self.broadcast:
+            return BroadcastEventStream(
+                self, maxsize=maxsize, overflow=overflow
+            )
+        elif maxsize == 1 and overflow in ("drop-oldest", "keep-latest"):
+            return ConflatingEventStream(self)
+        else:
+            return BindingEventStream(self, maxsize=maxsize, overflow=overflow)
 
     def __repr__(self) -> str:
-        return f"Binding({repr(self.host)}, {repr(self.prop)})"
+        return f"Binding({self._host_repr()}, {repr(self.prop)})"
 
     @property
     def host(self) -> Bindable:
-        return self.__host
+        host = self.__host if self.__host_ref is None else self.__host_ref()
+
+        if host is None:
+            raise ReferenceError("The bound host no longer exists.")
+
+        return host
+
+    @property
+    def weak(self) -> bool:
+        return self.__host_ref is not None
+
+    def _host_repr(self) -> str:
+        try:
+            return repr(self.host)
+        except ReferenceError:
+            return "<collected>"
 
     @property
     def prop(self) -> str:
@@ -40,87 +113,925 @@ class Binding(Bound):
 
 
 class TwoWayBinding(Binding, TwoWayBound):
+    def __init__(self, host: Bindable, prop: str, **kwargs: Any) -> None:
+        super().__init__(host, prop, **kwargs)
+
+        # suppress unchanged values like the descriptor of the property
+        descriptor = getattr(type(host), prop, None)
+        self.__unchanged = getattr(descriptor, "_unchanged", None)
+        self.__attr_name = bound_attr_name(prop)
+
     async def set(
         self, value: Any, source_event: DataEvent | None = None
     ) -> None:
-        setattr(self.host, bound_attr_name(self.prop), value)
+        self.set_nowait(value, source_event)
+
+    def set_nowait(
+        self, value: Any, source_event: DataEvent | None = None
+    ) -> None:
+        """Set the bound value synchronously."""
+        host = self.host
+        attr_name = self.__attr_name
+
+        if hasattr(value, "_attach") and isinstance(value, BindableCollection):
+            value = value._attach(host, self.prop)
+
+        unchanged = is_unchanged(self.__unchanged, host, attr_name, value)
+        setattr(host, attr_name, value)
+
+        if unchanged:
+            return
+
         event = DataUpdatedEvent(
-            source_event=source_event, value=value, source=self
+            source_event=lineage_for(source_event),
+            value=value,
+            source=self,
+            propagation=propagation_for(self, "update", source_event),
         )
-        notify_subscribers(self.host, self.prop, event)
+        notify_subscribers(host, self.prop, event)
 
     async def unset(self, source_event: DataEvent | None = None) -> None:
-        delattr(self.host, bound_attr_name(self.prop))
-        event = DataDeletedEvent(source_event=source_event, source=self)
+        delattr(self.host, self.__attr_name)
+        event = DataDeletedEvent(
+            source_event=lineage_for(source_event),
+            source=self,
+            propagation=propagation_for(self, "delete", source_event),
+        )
         notify_subscribers(self.host, self.prop, event)
 
 
 class BindingEventStream:
+    """An [`EventStream`][coil.protocols.EventStream] of a binding.
+
+    The stream subscribes to the binding as soon as it is created, and
+    keeps its subscription until it is closed, or until the bound value
+    is deleted. Received events are queued until they are consumed; if
+    the queue is bounded (`maxsize`), then `overflow` decides which events
+    are discarded when it is full, and `dropped` counts them.
+
+    Streams which are never closed hold on to their subscription until
+    they are garbage collected (the subscription itself doesn't keep the
+    stream alive). In debug mode (when either the event loop or the
+    interpreter is in debug mode), a `ResourceWarning` is emitted when
+    that happens.
+    """
+
     binding: Binding
 
-    def __init__(self, binding: Binding):
+    def __init__(
+        self,
+        binding: Binding,
+        *,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+    ):
         self.binding = binding
-        self.new_data = asyncio.Queue[DataEvent]()
+        self.new_data = asyncio.Queue[DataEvent | None](maxsize)
+        self.overflow = overflow
+        self._subscribe()
+
+    def _subscribe(self) -> None:
+        self.dropped = 0
+        self.closed = False
+        self._overflow_error: asyncio.QueueFull | None = None
+        self._debug = _debug_enabled()
+        self._received: Callable[[], None] | None = None
         self.subsciption_handle = add_subscription(
-            binding.host, binding.prop, self._handle_event
+            self.binding.host, self.binding.prop, _weak_handler(self)
         )
-        LOG.debug(f"initialized binding event stream: {self}")
+        LOG.debug("initialized binding event stream: %s", self)
 
     def __del__(self) -> None:
-        LOG.debug(f"finalizing binding event stream: {self}")
-        drop_subscription(self.binding.host, self.subsciption_handle)
+        if self.closed or not hasattr(self, "subsciption_handle"):
+            return
+
+        if self._debug:
+            warnings.warn(
+                f"unclosed event stream {self!r}", ResourceWarning, source=self
+            )
 
-    def __aiter__(self) -> Any:
+        LOG.debug("finalizing binding event stream: %s", self)
+        self._close()
+
+    async def __aenter__(self) -> "BindingEventStream":
         return self
 
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop receiving events, and end the stream."""
+        self._close()
+        self._overflow_error = None
+
+        # wake up a consumer that is waiting for the next event
+        self.new_data.put_nowait(None)
+
+    def __aiter__(self) -> "BindingEventStream":
+        return self
+
+    def on_received(self, callback: Callable[[], None]) -> None:
+        """Call `callback` whenever the stream receives an event, before
+        it is queued (or dropped), so that the events which are in
+        flight can be counted without subscribing to the bound value
+        again."""
+        self._received = callback
+
     async def __anext__(self) -> DataUpdatedEvent:
-        LOG.debug("getting next event from queue")
+        if self.closed and self.new_data.empty():
+            if self._overflow_error is not None:
+                raise self._overflow_error
+            raise StopAsyncIteration
+
         event = await self.new_data.get()
 
         if is_update_event(event):
             return event
 
         else:
+            self._close()
             raise StopAsyncIteration
 
     def __repr__(self) -> str:
         return (
             "<BindingEventStream "
-            f"bindable={repr(self.binding.host)}, "
+            f"bindable={self.binding._host_repr()}, "
+            f"prop={repr(self.binding.prop)}>"
+        )
+
+    def _close(self) -> None:
+        self._unsubscribe()
+        self._discard_queue()
+
+    def _unsubscribe(self) -> None:
+        if not self.closed:
+            self.closed = True
+
+            # a collected host takes its subscriptions along with it
+            with suppress(ReferenceError):
+                drop_subscription(self.binding.host, self.subsciption_handle)
+
+    def _discard_queue(self) -> None:
+        # release events which will never be consumed
+        while not self.new_data.empty():
+            self.new_data.get_nowait()
+
+    def _handle_event(self, data_event: DataEvent) -> None:
+        if self._received is not None:
+            self._received()
+
+        try:
+            self.new_data.put_nowait(data_event)
+        except asyncio.QueueFull:
+            self._handle_overflow(data_event)
+
+    def _handle_overflow(self, data_event: DataEvent) -> None:
+        queue = self.new_data
+
+        if self.overflow == "drop-oldest" or not is_update_event(data_event):
+            self.dropped += 1
+            queue.get_nowait()
+            queue.put_nowait(data_event)
+
+        elif self.overflow == "drop-newest":
+            self.dropped += 1
+
+        elif self.overflow == "keep-latest":
+            self.dropped += queue.qsize()
+            self._discard_queue()
+            queue.put_nowait(data_event)
+
+        else:
+            self.dropped += 1
+            self._unsubscribe()
+            self._overflow_error = asyncio.QueueFull(
+                f"{self!r} overflowed its queue of {queue.maxsize} events"
+            )
+
+
+class ConflatingEventStream(BindingEventStream):
+    """A [`BindingEventStream`][coil._bindings.BindingEventStream] which
+    only delivers the latest event.
+
+    Instead of a queue, the stream keeps a single slot for the latest
+    event which hasn't been consumed yet. A burst of updates overwrites
+    the slot (counting every overwritten event as `dropped`), and wakes
+    up the consumer only once. A deletion overwrites any pending update,
+    and ends the stream.
+
+    This is the stream returned for `maxsize=1`, with either the
+    `"drop-oldest"` or the `"keep-latest"` overflow policy.
+    """
+
+    def __init__(self, binding: Binding):
+        self.binding = binding
+        self.overflow = "keep-latest"
+        self._latest: DataEvent | None = None
+        self._waiter: asyncio.Future[None] | None = None
+        self._subscribe()
+
+    async def aclose(self) -> None:
+        """Stop receiving events, and end the stream."""
+        self._close()
+        self._wake()
+
+    async def __anext__(self) -> DataUpdatedEvent:
+        while self._latest is None:
+            if self.closed:
+                raise StopAsyncIteration
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        event, self._latest = self._latest, None
+
+        if is_update_event(event):
+            return event
+
+        else:
+            self._close()
+            raise StopAsyncIteration
+
+    def __repr__(self) -> str:
+        return (
+            "<ConflatingEventStream "
+            f"bindable={self.binding._host_repr()}, "
+            f"prop={repr(self.binding.prop)}>"
+        )
+
+    def _discard_queue(self) -> None:
+        self._latest = None
+
+    def _handle_event(self, data_event: DataEvent) -> None:
+        if self._received is not None:
+            self._received()
+
+        if self._latest is not None:
+            self.dropped += 1
+
+        self._latest = data_event
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class BroadcastBuffer:
+    """The events of a bindable property, shared by all of its
+    [broadcast streams][coil._bindings.BroadcastEventStream].
+
+    The buffer subscribes to the property once, and appends its events
+    to a log which each stream reads at its own cursor (the sequence
+    number of the next event it reads). Waiting streams are woken up
+    together, in one pass. Events are released once every
+    stream has read or skipped them: the log is compacted whenever it
+    has doubled in size, at which point streams which lag behind by
+    more than their `maxsize` apply their overflow policy.
+    """
+
+    def __init__(self, binding: Binding) -> None:
+        self.binding = binding
+        self.key = (id(binding.host), binding.prop)
+        self.events: List[DataEvent] = []
+        self.start = 0
+        self.streams: weakref.WeakSet[BroadcastEventStream] = weakref.WeakSet()
+        self.receivers: weakref.WeakKeyDictionary[
+            BroadcastEventStream, Callable[[], None]
+        ] = weakref.WeakKeyDictionary()
+        self._compact_at = COMPACT_THRESHOLD
+        self._waiters: List[asyncio.Future[None]] = []
+        self.subscription_handle = add_subscription(
+            binding.host, binding.prop, _weak_handler(self)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            "<BroadcastBuffer "
+            f"bindable={self.binding._host_repr()}, "
+            f"prop={repr(self.binding.prop)}, "
+            f"streams={len(self.streams)}>"
+        )
+
+    @property
+    def end(self) -> int:
+        """The sequence number of the next event."""
+        return self.start + len(self.events)
+
+    def add_stream(self, stream: "BroadcastEventStream") -> int:
+        """Add a stream, and return the cursor it starts at."""
+        self.streams.add(stream)
+        return self.end
+
+    def remove_stream(self, stream: "BroadcastEventStream") -> None:
+        """Remove a stream, and unsubscribe once the last one is gone."""
+        self.streams.discard(stream)
+        self.receivers.pop(stream, None)
+
+        if self.streams:
+            return
+
+        self.events.clear()
+
+        if _broadcasts.get(self.key) is self:
+            del _broadcasts[self.key]
+
+        # a collected host takes its subscriptions along with it
+        with suppress(ReferenceError):
+            drop_subscription(self.binding.host, self.subscription_handle)
+
+    async def wait(self) -> None:
+        """Wait for the next event (or for any of the streams to close)."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        await waiter
+
+    def wake(self) -> None:
+        """Wake up all the streams which are waiting, in one pass."""
+        waiters, self._waiters = self._waiters, []
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def compact(self) -> None:
+        """Release the events which no stream will read anymore."""
+        for stream in list(self.streams):
+            stream._catch_up()
+
+        needed = min(
+            (stream._cursor for stream in self.streams), default=self.end
+        )
+        del self.events[: needed - self.start]
+        self.start = needed
+        self._compact_at = max(COMPACT_THRESHOLD, 2 * len(self.events))
+
+    def _handle_event(self, data_event: DataEvent) -> None:
+        for received in list(self.receivers.values()):
+            received()
+
+        self.events.append(data_event)
+
+        if len(self.events) >= self._compact_at:
+            self.compact()
+
+        self.wake()
+
+
+def _broadcast_buffer(binding: Binding) -> BroadcastBuffer:
+    host = binding.host
+    buffer = _broadcasts.get((id(host), binding.prop))
+
+    try:
+        if buffer is not None and buffer.binding.host is host:
+            return buffer
+    except ReferenceError:  # the id of a collected host was reused
+        pass
+
+    buffer = BroadcastBuffer(binding)
+    _broadcasts[buffer.key] = buffer
+    return buffer
+
+
+class BroadcastEventStream(BindingEventStream):
+    """A [`BindingEventStream`][coil._bindings.BindingEventStream] which
+    reads the events of a [shared buffer][coil._bindings.BroadcastBuffer],
+    rather than queueing them for itself.
+
+    All the broadcast streams of a property (those of the bindings made
+    with `broadcast=True`) share one subscription, and one copy of each
+    event, however many there are. Instead of overflowing a queue, a
+    stream which falls behind by more than `maxsize` events applies its
+    `overflow` policy when it next reads, or when the buffer is
+    compacted; up to that point, it may still catch up with the events
+    that it would have dropped if they were queued.
+    """
+
+    def __init__(
+        self,
+        binding: Binding,
+        *,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+    ):
+        self.binding = binding
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._pending: Deque[DataEvent] = deque()
+        self._subscribe()
+
+    def _subscribe(self) -> None:
+        self.dropped = 0
+        self.closed = False
+        self._overflow_error: asyncio.QueueFull | None = None
+        self._debug = _debug_enabled()
+        self.buffer = _broadcast_buffer(self.binding)
+        self.subsciption_handle = self.buffer.subscription_handle
+        self._cursor = self.buffer.add_stream(self)
+        LOG.debug("initialized broadcast event stream: %s", self)
+
+    async def aclose(self) -> None:
+        """Stop receiving events, and end the stream."""
+        self._close()
+        self._overflow_error = None
+        self.buffer.wake()
+
+    def on_received(self, callback: Callable[[], None]) -> None:
+        """Call `callback` whenever the shared buffer receives an event,
+        while the stream is open."""
+        if not self.closed:
+            self.buffer.receivers[self] = callback
+
+    async def __anext__(self) -> DataUpdatedEvent:
+        event = self._next_event()
+
+        while event is None:
+            if self.closed:
+                if self._overflow_error is not None:
+                    raise self._overflow_error
+                raise StopAsyncIteration
+
+            await self.buffer.wait()
+            event = self._next_event()
+
+        if is_update_event(event):
+            return event
+
+        else:
+            self._close()
+            raise StopAsyncIteration
+
+    def __repr__(self) -> str:
+        return (
+            "<BroadcastEventStream "
+            f"bindable={self.binding._host_repr()}, "
             f"prop={repr(self.binding.prop)}>"
         )
 
+    @property
+    def lag(self) -> int:
+        """The number of events which the stream hasn't read yet."""
+        return len(self._pending) + (
+            0 if self.closed else self.buffer.end - self._cursor
+        )
+
+    def _next_event(self) -> DataEvent | None:
+        if not self.closed:
+            self._catch_up()
+
+        if self._pending:
+            return self._pending.popleft()
+
+        buffer = self.buffer
+
+        if self.closed or self._cursor == buffer.end:
+            return None
+
+        event = buffer.events[self._cursor - buffer.start]
+        self._cursor += 1
+        return event
+
+    def _catch_up(self) -> None:
+        # apply the overflow policy to what would be the queue of the
+        # stream: the events it put aside, and those it hasn't read yet
+        maxsize = self.maxsize
+        lag = self.lag
+
+        if not maxsize or lag <= maxsize:
+            return
+
+        if self.overflow == "drop-oldest":
+            self._skip(lag - maxsize)
+
+        elif self.overflow == "keep-latest":
+            # a queue which is emptied whenever it overflows
+            self._skip(lag - ((lag - 1) % maxsize + 1))
+
+        else:
+            self._put_aside(maxsize)
+
+    def _skip(self, count: int) -> None:
+        self.dropped += count
+        put_aside = min(count, len(self._pending))
+
+        for _ in range(put_aside):
+            self._pending.popleft()
+
+        self._cursor += count - put_aside
+
+    def _put_aside(self, maxsize: int) -> None:
+        # keep the oldest events, and skip over the rest
+        buffer = self.buffer
+        start = self._cursor - buffer.start
+        stop = start + maxsize - len(self._pending)
+        skipped = len(buffer.events) - stop
+        self._pending.extend(buffer.events[start:stop])
+        self._cursor = buffer.end
+
+        if self.overflow == "drop-newest":
+            self.dropped += skipped
+            latest = buffer.events[-1]
+
+            if not is_update_event(latest):
+                self._pending.popleft()
+                self._pending.append(latest)
+
+        else:
+            self.dropped += 1
+            self._unsubscribe()
+            self._overflow_error = asyncio.QueueFull(
+                f"{self!r} fell behind by more than {maxsize} events"
+            )
+
+    def _unsubscribe(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.buffer.remove_stream(self)
+
+    def _discard_queue(self) -> None:
+        self._pending.clear()
+        self._cursor = self.buffer.end
+
+
+# a subscription to a property along a path, and what drops its feeds
+_Link = (
+    Tuple["weakref.ref[Any]", SubscriptionHandle, List[Callable[[], None]]]
+    | None
+)
+
+
+class PathBinding(Bound):
+    """A read-only bound value which follows a dotted path of properties
+    from a host, such as `"customer.address.city"`.
+
+    The binding subscribes to each property along the path which belongs
+    to a [bindable][coil.protocols.Bindable] object. When one of the
+    intermediate properties changes, only the subscriptions of the
+    properties which follow it are replaced, and subscribers are notified
+    once if that changed the value at the end of the path (the old and
+    the new values are compared for equality): with an update, or with
+    a deletion if the path no longer leads anywhere. Changes of the last
+    property are forwarded as they are.
+
+    Like [computed values][coil.Computed], path bindings are their own
+    host, and their bound property is `value`; use [coil.bind][] with a
+    dotted path to create one.
+    """
+
+    def __init__(
+        self,
+        host: Bindable,
+        path: str,
+        *,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "drop-oldest",
+        weak: bool = False,
+        broadcast: bool = False,
+    ) -> None:
+        self.__coil_bindings__: Dict[str, Dict[int, DataEventHandler]] = {}
+        self.path = path
+        self._props = tuple(path.split("."))
+        self.__root = None if weak else host
+        self.__root_ref = weakref.ref(host) if weak else None
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.broadcast = broadcast
+
+        # the objects along the path (after the host), and the
+        # subscriptions to their properties, as far as the path leads
+        self.__hosts: List[Any] = [None]
+        self.__links: List[_Link] = []
+        weakref.finalize(self, _drop_links, self.__links)
+
+        self.__subscribe(0)
+        self.__follow(0)
+        self.__last = self.__leaf()
+
+    def __repr__(self) -> str:
+        try:
+            root = repr(self.root)
+        except ReferenceError:
+            root = "<dead>"
+
+        return f"{type(self).__name__}({root}, {self.path!r})"
+
+    @property
+    def host(self) -> Bindable:
+        return self
+
+    @property
+    def prop(self) -> str:
+        return "value"
+
+    @property
+    def root(self) -> Any:
+        """The host which the path starts from."""
+        root = self.__root if self.__root_ref is None else self.__root_ref()
+
+        if root is None:
+            raise ReferenceError("The bound host no longer exists.")
+
+        return root
+
+    @property
+    def value(self) -> Any:
+        """The value at the end of the path."""
+        value = self.root
+
+        for prop in self._props:
+            value = getattr(value, prop)
+
+        return value
+
+    def events(
+        self,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> "BindingEventStream":
+        # the binding is made for the stream (which keeps the path binding
+        # alive), rather than held by the path binding, which would then
+        # only be freed by the garbage collector
+        binding = Binding(
+            self,
+            "value",
+            maxsize=self.maxsize,
+            overflow=self.overflow,
+            broadcast=self.broadcast,
+        )
+        return binding.events(maxsize=maxsize, overflow=overflow)
+
+    def __host_at(self, level: int) -> Any:
+        return self.root if level == 0 else self.__hosts[level]
+
+    def __subscribe(self, level: int) -> None:
+        host = self.__host_at(level)
+        prop = self._props[level]
+
+        if not hasattr(host, "__coil_bindings__"):
+            # nothing tells when the property changes
+            self.__links.append(None)
+            return
+
+        handle = add_subscription(
+            host, prop, _link_handler(weakref.ref(self), level)
+        )
+        feeds = [add_feed(self, "value", host, prop)]
+        self.__links.append((weakref.ref(host), handle, feeds))
+        raise_rank(self, "value", 1 + rank_of(host, prop))
+
+        if level == len(self._props) - 1:
+            # what is set into the path is delivered to its last property
+            feeds.append(add_feed(host, prop, self, "value"))
+
+    def __follow(self, level: int) -> None:
+        """Replace the subscriptions which follow the one at `level`."""
+        stop = level + 1
+        _drop_links(self.__links[stop:])
+        del self.__links[stop:]
+        del self.__hosts[stop:]
+
+        for level in range(stop, len(self._props)):
+            try:
+                host = getattr(
+                    self.__host_at(level - 1), self._props[level - 1]
+                )
+            except AttributeError:
+                return  # the path is broken here, until this is assigned
+
+            self.__hosts.append(host)
+            self.__subscribe(level)
+
+    def __leaf(self) -> Any:
+        if len(self.__hosts) < len(self._props):
+            return _MISSING
+
+        return getattr(self.__host_at(-1), self._props[-1], _MISSING)
+
+    def _handle_link_event(self, level: int, data_event: DataEvent) -> None:
+        if level == len(self._props) - 1:
+            last = _MISSING
+
+            if is_update_event(data_event):
+                last = data_event.value
+
+            self.__last = last
+            self.__notify(data_event, last)
+            return
+
+        self.__follow(level)
+        leaf = self.__leaf()
+        last, self.__last = self.__last, leaf
+
+        if leaf is last or (
+            leaf is not _MISSING and last is not _MISSING and leaf == last
+        ):
+            return
+
+        self.__notify(data_event, leaf)
+
+    def __notify(self, source_event: DataEvent, value: Any) -> None:
+        event: DataEvent
+        lineage = lineage_for(source_event)
+
+        if value is _MISSING:
+            event = DataDeletedEvent(
+                source_event=lineage,
+                source=self,
+                propagation=propagation_for(self, "delete", source_event),
+            )
+        elif is_change_event(source_event) and value is source_event.value:
+            # the collection at the end of the path changed in place
+            event = DataChangedEvent(
+                source_event=lineage,
+                source=self,
+                value=value,
+                change=source_event.change,
+                version=source_event.version,
+                propagation=propagation_for(self, "update", source_event),
+            )
+        else:
+            event = DataUpdatedEvent(
+                source_event=lineage,
+                source=self,
+                value=value,
+                propagation=propagation_for(self, "update", source_event),
+            )
+
+        notify_subscribers(self, "value", event)
+
+
+class TwoWayPathBinding(PathBinding, TwoWayBound):
+    """A [PathBinding][coil._bindings.PathBinding] which can also set (and
+    unset) the property at the end of the path, which must belong to a
+    [bindable][coil.protocols.Bindable] object."""
+
+    async def set(
+        self, value: Any, source_event: DataEvent | None = None
+    ) -> None:
+        self.set_nowait(value, source_event)
+
+    def set_nowait(
+        self, value: Any, source_event: DataEvent | None = None
+    ) -> None:
+        """Set the value at the end of the path synchronously."""
+        self._leaf_binding().set_nowait(value, source_event)
+
+    async def unset(self, source_event: DataEvent | None = None) -> None:
+        await self._leaf_binding().unset(source_event)
+
+    def _leaf_binding(self) -> TwoWayBinding:
+        parent = self.root
+
+        for prop in self._props[:-1]:
+            parent = getattr(parent, prop)
+
+        if not hasattr(parent, "__coil_bindings__"):
+            raise TypeError(f"{parent!r} isn't bindable.")
+
+        return TwoWayBinding(parent, self._props[-1])
+
+
+def _link_handler(
+    path_ref: "weakref.ref[PathBinding]", level: int
+) -> DataEventHandler:
+    # a subscription which doesn't keep the path binding alive
+    def handle_event(data_event: DataEvent) -> None:
+        path = path_ref()
+
+        if path is not None:
+            path._handle_link_event(level, data_event)
+
+    return handle_event
+
+
+def _drop_links(links: List[_Link]) -> None:
+    for link in links:
+        if link is None:
+            continue
+
+        host_ref, handle, feeds = link
+        host = host_ref()
+
+        for drop_feed in feeds:
+            drop_feed()
+
+        # a collected host takes its subscriptions along with it
+        if host is not None:
+            drop_subscription(host, handle)
+
+
+class _EventReceiver(Protocol):
     def _handle_event(self, data_event: DataEvent) -> None:
-        LOG.debug("pushing next event into queue")
-        self.new_data.put_nowait(data_event)
+        pass
+
+
+def _weak_handler(receiver: _EventReceiver) -> DataEventHandler:
+    # a subscription which doesn't keep its receiver alive
+    receiver_ref = weakref.ref(receiver)
+
+    def handle_event(data_event: DataEvent) -> None:
+        receiver = receiver_ref()
+
+        if receiver is not None:
+            receiver._handle_event(data_event)
+
+    return handle_event
+
+
+def _debug_enabled() -> bool:
+    try:
+        return asyncio.get_running_loop().get_debug()
+    except RuntimeError:
+        return sys.flags.dev_mode
 
 
 @overload
 def bind(
-    target: Tuple[Bindable, str], *, readonly: Literal[True] = True
+    target: Tuple[Bindable, str],
+    *,
+    readonly: Literal[True] = True,
+    maxsize: int = 0,
+    overflow: OverflowPolicy = "drop-oldest",
+    weak: bool = False,
+    broadcast: bool = False,
 ) -> Bound:
     pass
 
 
 @overload
 def bind(
-    target: Tuple[Bindable, str], *, readonly: Literal[False]
+    target: Tuple[Bindable, str],
+    *,
+    readonly: Literal[False],
+    maxsize: int = 0,
+    overflow: OverflowPolicy = "drop-oldest",
+    weak: bool = False,
+    broadcast: bool = False,
 ) -> TwoWayBound:
     pass
 
 
-def bind(target: Tuple[Bindable, str], *, readonly: bool = True) -> Any:
+def bind(
+    target: Tuple[Bindable, str],
+    *,
+    readonly: bool = True,
+    maxsize: int = 0,
+    overflow: OverflowPolicy = "drop-oldest",
+    weak: bool = False,
+    broadcast: bool = False,
+) -> Any:
     """Return a binding for the given target
 
     Args:
         target (coil.protocols.Bindable): A tuple representing a
             [`protocols.Bindable`][coil.protocols.Bindable]
-            and attribute combination.
+            and attribute combination. The attribute can be a dotted
+            path of properties, such as `"customer.address.city"`, in
+            which case the returned binding follows the path: when a
+            property along it changes, the binding resubscribes to the
+            properties which follow, and notifies its subscribers if
+            that changed the value at the end of the path.
         readonly: Controls what you are able to do with the returned
                   binding; this is `True` be default, meaning that the returned
                   binding can only be used to watch for changes to the bound
                   value. When this is set to `False`, the returned binding can
                   also be used to set the bound value.
+        maxsize: The default maximum number of events queued by the
+                 [event streams][coil.protocols.Bound.events] of the
+                 returned binding (`0` means no limit).
+        overflow: The default [`OverflowPolicy`][coil.types.OverflowPolicy]
+                  of the event streams of the returned binding.
+        weak: Whether the returned binding should only hold a weak
+              reference to the host, so that it doesn't keep the host
+              alive. Once the host is garbage collected, accessing the
+              `host` of the binding raises a `ReferenceError`.
+        broadcast: Whether the event streams of the returned binding
+                   should share their events (and their subscription)
+                   with the other broadcast streams of the bound value,
+                   rather than queue them for themselves. This saves
+                   memory and time for bound values which have many
+                   streams. A broadcast stream which falls behind by more
+                   than `maxsize` events applies its `overflow` policy
+                   when it next reads; its interface is still that of an
+                   [`EventStream`][coil.protocols.EventStream].
     """
     (host, prop) = target
-    return Binding(host, prop) if readonly else TwoWayBinding(host, prop)
+    binding_cls: Callable[..., Bound]
+
+    if "." in prop:
+        binding_cls = PathBinding if readonly else TwoWayPathBinding
+    else:
+        binding_cls = Binding if readonly else TwoWayBinding
+
+    return binding_cls(
+        host,
+        prop,
+        maxsize=maxsize,
+        overflow=overflow,
+        weak=weak,
+        broadcast=broadcast,
+    )
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import abc
+import operator
+import weakref
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    SupportsIndex,
+    Tuple,
+    TypeVar,
+    overload,
+)
+
+from ._core import (
+    _MISSING,
+    Assignment,
+    active_batches,
+    bound_attr_name,
+    current_batch,
+    lineage_for,
+    notify_subscribers,
+    propagation_for,
+)
+from .protocols import Bindable, BindingTarget, ReverseBound
+from .types import (
+    Change,
+    DataChangedEvent,
+    DataEvent,
+    DataUpdatedEvent,
+    DictChange,
+    ListChange,
+    Propagation,
+    is_change_event,
+)
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class BindableCollection(abc.ABC):
+    """The base of the collections which notify the subscribers of the
+    bindable property holding them when they are changed in place (see
+    [coil.BindableList][] and [coil.BindableDict][]).
+
+    A collection belongs to one property at most: the one it was last
+    assigned to, for as long as the property holds it. Assigning it to
+    another property assigns a copy, so that each change is announced
+    by a single property.
+    """
+
+    # the slots are declared by the subclasses, since list and dict
+    # can't share a base with slots of its own
+    __slots__ = ()
+
+    _owner: Tuple[weakref.ref[Bindable], str] | None
+    _version: int
+
+    @abc.abstractmethod
+    def _apply(self, change: Change) -> None:
+        """Make a change, without announcing it."""
+
+    @abc.abstractmethod
+    def _copy(self) -> BindableCollection:
+        """Return an unowned copy of the collection."""
+
+    @abc.abstractmethod
+    def _replacement(self, other: BindableCollection) -> Change:
+        """Return the change which makes this collection equal to
+        `other`."""
+
+    def _attach(self, host: Bindable, prop: str) -> BindableCollection:
+        """Return the collection to assign to a property: this one, or a
+        copy if it belongs to another property."""
+        owner = self._owner_of()
+        attached = self
+
+        if owner is not None and (owner[0] is not host or owner[1] != prop):
+            attached = self._copy()
+
+        attached._owner = (weakref.ref(host), prop)  # type: ignore[misc]
+        return attached
+
+    def _owner_of(self) -> Tuple[Bindable, str] | None:
+        if self._owner is None:
+            return None
+
+        ref, prop = self._owner
+        host = ref()
+
+        # the property may hold another value since
+        if (
+            host is None
+            or getattr(host, bound_attr_name(prop), None) is not self
+        ):
+            self._owner = None  # type: ignore[misc]
+            return None
+
+        return host, prop
+
+    def _changed(self, change: Change) -> None:
+        """Announce a change which was just made to the collection."""
+        self._version += 1  # type: ignore[misc]
+        owner = self._owner_of()
+
+        if owner is None:
+            return
+
+        host, prop = owner
+
+        # like assignments, changes nobody can observe allocate no event
+        if prop in host.__coil_bindings__ or (
+            active_batches.count and current_batch.get() is not None
+        ):
+            source = Assignment(host, prop)
+            self._notify(host, prop, change, source, None)
+
+    def _receive(
+        self, change: Change, source: BindingTarget, source_event: DataEvent
+    ) -> None:
+        """Make (and announce) a change which was forwarded from another
+        collection."""
+        propagation = propagation_for(source, "update", source_event)
+
+        if propagation.cyclic:
+            # the change came back around to where it was made
+            return
+
+        self._apply(change)
+        self._version += 1  # type: ignore[misc]
+        owner = self._owner_of()
+
+        if owner is not None:
+            host, prop = owner
+            self._notify(host, prop, change, source, source_event, propagation)
+
+    def _notify(
+        self,
+        host: Bindable,
+        prop: str,
+        change: Change,
+        source: BindingTarget,
+        source_event: DataEvent | None,
+        propagation: Propagation | None = None,
+    ) -> None:
+        notify_subscribers(
+            host,
+            prop,
+            DataChangedEvent(
+                source_event=lineage_for(source_event),
+                source=source,
+                value=self,
+                change=change,
+                version=self._version,
+                propagation=propagation,
+            ),
+        )
+
+
+class _Mirror:
+    """Forwards the changes of a bindable collection to the collection
+    held by the target of a tail, in place of a copy.
+
+    The target is brought up to date by replacing its contents the
+    first time, and whenever changes were missed (because the stream
+    dropped them, or a batch coalesced them); the changes which follow
+    are applied one by one.
+    """
+
+    def __init__(self, into: ReverseBound) -> None:
+        self.into = into
+        self.source: BindableCollection | None = None
+        self.target: BindableCollection | None = None
+        self.version = 0
+
+    def forward(self, data_event: DataUpdatedEvent) -> bool:
+        """Forward an update, and return whether it could be."""
+        value = data_event.value
+        target = getattr(self.into, "current", None)
+
+        if (
+            not isinstance(value, BindableCollection)
+            or type(target) is not type(value)
+            or target is value
+        ):
+            self.source = None
+            return False
+
+        assert isinstance(target, BindableCollection)
+
+        if (
+            is_change_event(data_event)
+            and value is self.source
+            and target is self.target
+        ):
+            if data_event.version <= self.version:
+                return True  # the target got it already
+
+            if data_event.version == self.version + 1:
+                self.version = data_event.version
+                target._receive(
+                    data_event.change, self.into, data_event  # type: ignore
+                )
+                return True
+
+        self.source, self.target = value, target
+        self.version = value._version
+        target._receive(
+            target._replacement(value), self.into, data_event  # type: ignore
+        )
+        return True
+
+
+class BindableList(BindableCollection, List[T]):
+    """A list which announces the changes made to it in place.
+
+    Once assigned to a property of a [bindable class][coil.bindableclass],
+    changing the list notifies the subscribers of the property with a
+    [`DataChangedEvent`][coil.types.DataChangedEvent], which describes
+    the change as a [`ListChange`][coil.types.ListChange], rather than
+    requiring the list to be assigned again:
+
+        import asyncio
+        import coil
+
+        @coil.bindableclass
+        class Playlist:
+            tracks: coil.BindableList[str]
+
+        async def main():
+            playlist = Playlist(coil.BindableList(["intro"]))
+            copy = Playlist(coil.BindableList())
+
+            async with coil.runtime() as rt:
+                copy.tracks = Playlist.tracks.bind(playlist)
+
+                playlist.tracks.append("outro")
+                playlist.tracks.insert(1, "verse")
+
+                await rt.synchronise()
+                assert copy.tracks == ["intro", "verse", "outro"]
+
+        asyncio.run(main())
+
+    [Tails][coil.tail] apply the changes to the list of their target,
+    instead of copying the whole list for each of them. A list belongs
+    to one property at a time; assigning it to another one assigns a
+    copy.
+    """
+
+    __slots__ = ("_owner", "_version")
+
+    def __init__(self, iterable: Iterable[T] = ()) -> None:
+        super().__init__(iterable)
+        self._owner = None
+        self._version = 0
+
+    def __repr__(self) -> str:
+        return f"BindableList({list.__repr__(self)})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the owner isn't copied (nor pickled) along with the items
+        return (type(self), (list(self),))
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, value: T) -> None:
+        pass
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None:
+        pass
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if not isinstance(index, slice):
+            position = operator.index(index)
+            list.__setitem__(self, position, value)
+            position += len(self) if position < 0 else 0
+            self._changed(ListChange(position, 1, (value,)))
+            return
+
+        start, stop, step = index.indices(len(self))
+
+        if step == 1:
+            self._splice(start, max(0, stop - start), tuple(value))
+        else:
+            self._rearrange(list.__setitem__, index, value)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        if not isinstance(index, slice):
+            position = operator.index(index)
+            list.__delitem__(self, position)
+            position += len(self) + 1 if position < 0 else 0
+            self._changed(ListChange(position, 1, ()))
+            return
+
+        start, stop, step = index.indices(len(self))
+
+        if step == 1:
+            self._splice(start, max(0, stop - start), ())
+        else:
+            self._rearrange(list.__delitem__, index)
+
+    def __iadd__(self, items: Iterable[T]) -> BindableList[T]:  # type: ignore
+        self.extend(items)
+        return self
+
+    def __imul__(self, times: SupportsIndex) -> BindableList[T]:
+        times = operator.index(times)
+
+        if times > 0:
+            self._splice(len(self), 0, tuple(self) * (times - 1))
+        else:
+            self._splice(0, len(self), ())
+
+        return self
+
+    def append(self, item: T) -> None:
+        self._splice(len(self), 0, (item,))
+
+    def extend(self, items: Iterable[T]) -> None:
+        self._splice(len(self), 0, tuple(items))
+
+    def insert(self, index: SupportsIndex, item: T) -> None:
+        # like list.insert, out of range indices insert at either end
+        position = operator.index(index)
+        size = len(self)
+        position = max(0, position + size) if position < 0 else position
+        self._splice(min(position, size), 0, (item,))
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        position = operator.index(index)
+        item = list.pop(self, position)
+        position += len(self) + 1 if position < 0 else 0
+        self._changed(ListChange(position, 1, ()))
+        return item
+
+    def remove(self, item: T) -> None:
+        position = self.index(item)
+        list.__delitem__(self, position)
+        self._changed(ListChange(position, 1, ()))
+
+    def clear(self) -> None:
+        self._splice(0, len(self), ())
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._rearrange(list.sort, *args, **kwargs)
+
+    def reverse(self) -> None:
+        self._rearrange(list.reverse)
+
+    def _splice(
+        self, start: int, removed: int, inserted: Tuple[Any, ...]
+    ) -> None:
+        list.__setitem__(self, slice(start, start + removed), inserted)
+
+        if removed or inserted:
+            self._changed(ListChange(start, removed, inserted))
+
+    def _rearrange(self, method: Any, *args: Any, **kwargs: Any) -> None:
+        # changes which aren't splices are announced as a replacement
+        size = len(self)
+        method(self, *args, **kwargs)
+
+        if size or self:
+            self._changed(ListChange(0, size, tuple(self)))
+
+    def _apply(self, change: Change) -> None:
+        assert isinstance(change, ListChange)
+        stop = change.start + change.removed
+        list.__setitem__(self, slice(change.start, stop), change.inserted)
+
+    def _copy(self) -> BindableList[T]:
+        return BindableList(self)
+
+    def _replacement(self, other: BindableCollection) -> Change:
+        assert isinstance(other, BindableList)
+        return ListChange(0, len(self), tuple(other))
+
+
+class BindableDict(BindableCollection, Dict[K, V]):
+    """A dict which announces the changes made to it in place.
+
+    This is the counterpart of [coil.BindableList][] for dicts: once
+    assigned to a property of a [bindable class][coil.bindableclass],
+    changing the dict notifies the subscribers of the property with a
+    [`DataChangedEvent`][coil.types.DataChangedEvent], which describes
+    the change as a [`DictChange`][coil.types.DictChange].
+    """
+
+    __slots__ = ("_owner", "_version")
+
+    def __init__(self, *args: Any, **kwargs: V) -> None:
+        super().__init__(*args, **kwargs)
+        self._owner = None
+        self._version = 0
+
+    def __repr__(self) -> str:
+        return f"BindableDict({dict.__repr__(self)})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the owner isn't copied (nor pickled) along with the items
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, key: K, value: V) -> None:
+        dict.__setitem__(self, key, value)
+        self._changed(DictChange({key: value}, ()))
+
+    def __delitem__(self, key: K) -> None:
+        dict.__delitem__(self, key)
+        self._changed(DictChange({}, (key,)))
+
+    def __ior__(self, other: Any) -> BindableDict[K, V]:  # type: ignore
+        self.update(other)
+        return self
+
+    def pop(self, key: K, *default: Any) -> Any:
+        if key not in self:
+            return dict.pop(self, key, *default)
+
+        value = dict.pop(self, key)
+        self._changed(DictChange({}, (key,)))
+        return value
+
+    def popitem(self) -> Tuple[K, V]:
+        key, value = dict.popitem(self)
+        self._changed(DictChange({}, (key,)))
+        return key, value
+
+    def setdefault(self, key: K, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: V) -> None:
+        items = dict(*args, **kwargs)
+        dict.update(self, items)
+
+        if items:
+            self._changed(DictChange(items, ()))
+
+    def clear(self) -> None:
+        keys = tuple(self)
+        dict.clear(self)
+
+        if keys:
+            self._changed(DictChange({}, keys))
+
+    def _apply(self, change: Change) -> None:
+        assert isinstance(change, DictChange)
+
+        for key in change.deleted:
+            dict.pop(self, key, None)
+
+        dict.update(self, change.updated)
+
+    def _copy(self) -> BindableDict[K, V]:
+        return BindableDict(self)
+
+    def _replacement(self, other: BindableCollection) -> Change:
+        assert isinstance(other, BindableDict)
+        return DictChange(
+            {
+                key: value
+                for key, value in other.items()
+                if dict.get(self, key, _MISSING) is not value
+            },
+            tuple(key for key in self if key not in other),
+        )
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import weakref
+from logging import getLogger
+from typing import Callable, Dict, Generic, TypeVar
+
+from ._bindings import Binding, BindingEventStream, _weak_handler
+from ._core import (
+    add_subscription,
+    drop_subscriptions,
+    lineage_for,
+    notify_subscribers,
+    propagation_for,
+)
+from ._runtime import InFlight, current_runtime
+from ._scheduler import Scheduler, add_feed, get_scheduler, raise_rank, rank_of
+from .protocols import Bindable, Bound, DataEventHandler
+from .types import (
+    DataDeletedEvent,
+    DataEvent,
+    DataUpdatedEvent,
+    OverflowPolicy,
+    is_update_event,
+)
+
+T = TypeVar("T")
+
+LOG = getLogger("coil")
+
+
+class Computed(Bound, Generic[T]):
+    """A read-only bound value which is derived from other bound values.
+
+    The value is computed by calling a function with the current values
+    of the bound values it depends on, and then memoized. Changes to any
+    of those mark it as dirty, but it is only recomputed when it's read,
+    or when it has subscribers (such as [event streams][coil.Computed.events]
+    or [tails][coil.tail]) which need to be notified of the new value. In
+    the latter case, a burst of changes is coalesced into one
+    recomputation and one event, a loop iteration later. The deletion of
+    any of the bound values it depends on is forwarded to subscribers
+    as is.
+
+    Computed values are refreshed in the order of their `rank` in the
+    binding graph (a computed value ranks above all of its inputs, and a
+    bindable property ranks above the bound value assigned to it), and
+    only once the changes which are being delivered by tails have
+    arrived. Each computed value is refreshed at most once per wave of
+    changes, even if it depends on several values which are fed by the
+    same source (as in diamond-shaped graphs), and it never sees some of
+    those values before they were updated.
+
+    The computed value is its own host, and its bound property is
+    `value`; it can be used anywhere a [coil.protocols.Bound][] can,
+    including assignments to bindable properties.
+
+    Use [coil.computed][] to create one.
+    """
+
+    __value: T
+
+    def __init__(self, fn: Callable[..., T], *bounds: Bound) -> None:
+        self.__coil_bindings__: Dict[str, Dict[int, DataEventHandler]] = {}
+        self.__fn = fn
+        self.__bounds = bounds
+        self.__source_event: DataEvent | None = None
+        self.__refresh_pending = False
+        self.__refresh_in_flight: InFlight | None = None
+        self.dirty = True
+
+        # a computed value ranks above all of its inputs
+        self.rank = 1 + max(
+            (rank_of(bound.host, bound.prop) for bound in bounds), default=-1
+        )
+        raise_rank(self, "value", self.rank)
+
+        for bound in bounds:
+            add_feed(self, "value", bound.host, bound.prop)
+
+        # the subscriptions don't keep the computed value alive
+        handler = _weak_handler(self)
+        subscriptions = [
+            (bound.host, add_subscription(bound.host, bound.prop, handler))
+            for bound in bounds
+        ]
+        weakref.finalize(self, drop_subscriptions, subscriptions)
+
+    def __repr__(self) -> str:
+        name = getattr(self.__fn, "__qualname__", repr(self.__fn))
+        args = "".join(f", {bound!r}" for bound in self.__bounds)
+        return f"computed({name}{args})"
+
+    @property
+    def host(self) -> Bindable:
+        return self
+
+    @property
+    def prop(self) -> str:
+        return "value"
+
+    @property
+    def value(self) -> T:
+        """The computed value (which is recomputed first, if dirty)."""
+        if self.dirty:
+            self.__value = self.__fn(
+                *(bound.current for bound in self.__bounds)
+            )
+            self.dirty = False
+
+        return self.__value
+
+    def events(
+        self,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> BindingEventStream:
+        # the binding is made for the stream (which keeps the computed
+        # value alive), rather than held by the computed value, which
+        # would then only be freed by the garbage collector
+        binding = Binding(self, "value")
+        return binding.events(maxsize=maxsize, overflow=overflow)
+
+    def _handle_event(self, data_event: DataEvent) -> None:
+        self.dirty = True
+        self.__source_event = data_event
+
+        if not is_update_event(data_event):
+            self.__cancel_refresh()
+            self.__notify(
+                DataDeletedEvent(
+                    source_event=lineage_for(data_event),
+                    source=self,
+                    propagation=propagation_for(self, "delete", data_event),
+                )
+            )
+
+        elif self.__coil_bindings__ and not self.__refresh_pending:
+            # nobody is notified of the value otherwise; it's recomputed
+            # if (and when) it is read.
+            try:
+                scheduler = get_scheduler()
+            except RuntimeError:
+                self.__refresh_now()
+            else:
+                self.__schedule_refresh(scheduler)
+
+    def _refresh(self) -> None:
+        if not self.__refresh_pending:
+            return  # cancelled
+
+        try:
+            self.__refresh_now()
+        finally:
+            self.__cancel_refresh()
+
+    def __schedule_refresh(self, scheduler: Scheduler) -> None:
+        # the pending refresh is work in flight for the active runtime
+        rt = current_runtime.get(None)
+        self.__refresh_in_flight = None if rt is None else rt.in_flight
+        self.__refresh_pending = True
+        scheduler.schedule(self)
+
+        if self.__refresh_in_flight is not None:
+            self.__refresh_in_flight.add()
+
+    def __refresh_now(self) -> None:
+        if not self.__coil_bindings__:
+            return
+
+        try:
+            value = self.value
+        except Exception:
+            LOG.exception("Unhandled exception in computed value %r:", self)
+            return
+
+        source_event = self.__source_event
+        self.__notify(
+            DataUpdatedEvent(
+                source_event=lineage_for(source_event),
+                value=value,
+                source=self,
+                propagation=propagation_for(self, "update", source_event),
+            )
+        )
+
+    def __notify(self, event: DataEvent) -> None:
+        self.__source_event = None
+        notify_subscribers(self, "value", event)
+
+    def __cancel_refresh(self) -> None:
+        self.__refresh_pending = False
+
+        if self.__refresh_in_flight is not None:
+            self.__refresh_in_flight.remove()
+            self.__refresh_in_flight = None
+
+
+def computed(fn: Callable[..., T], *bounds: Bound) -> Computed[T]:
+    """Return a bound value which is computed from other bound values.
+
+        import asyncio
+        import coil
+
+        @coil.bindableclass
+        class Item:
+            price: float
+            qty: int
+
+        async def main():
+            item = Item(price=2.5, qty=4)
+            total = coil.computed(
+                lambda price, qty: price * qty,
+                Item.price.bind(item),
+                Item.qty.bind(item),
+            )
+            assert total.value == 10.0
+
+            item.qty = 2
+            assert total.value == 5.0
+
+        asyncio.run(main())
+
+    Args:
+        fn: A function computing the value from the current values of
+            `bounds` (which it receives as positional arguments).
+        bounds: The bound values which the computed value depends on.
+
+    See [coil.Computed][] for how (and when) the value is recomputed.
+    """
+    return Computed(fn, *bounds)
@@ -1,21 +1,221 @@
+from __future__ import annotations
+
 import asyncio
-from logging import getLogger
+import operator
+import threading
+from contextvars import ContextVar
+from copy import copy
+from itertools import count
+from logging import WARNING, getLogger
 from pprint import pformat
-from typing import Any, Tuple, TypeAlias
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple,
+    TypeAlias,
+)
+from weakref import WeakKeyDictionary
+
+from coil.protocols import Bindable, BindingTarget, DataEventHandler
+from coil.types import Comparator, DataEvent, EventType, Propagation
 
-from aiostream import stream
+from ._runtime import current_runtime
 
-from coil.protocols import Bindable, Bound, DataEventHandler, ReverseBound
-from coil.types import DataEvent, get_event_type
+if TYPE_CHECKING:
+    from ._batch import Batch
 
 SubscriptionHandle: TypeAlias = Tuple[str, int]
 LOG = getLogger("coil")
+current_batch: ContextVar[Batch | None] = ContextVar(
+    "current_batch", default=None
+)
+
+
+class ActiveBatches:
+    """Counts the batches which are active, in any context; while there
+    are none, changes which nobody observes can skip looking up the
+    batch of their own context."""
+
+    __slots__ = ("count", "lock")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.lock = threading.Lock()
+
+
+active_batches = ActiveBatches()
+
+_subscription_ids = count()
+
+_MISSING: Any = object()
+
+# the (read-only) subscribers of a bindable which nobody has subscribed to
+# yet; add_subscription replaces them with a table of its own on first use
+NO_SUBSCRIBERS: Dict[str, Dict[int, DataEventHandler]]
+NO_SUBSCRIBERS = MappingProxyType({})  # type: ignore[assignment]
 
 
 def bound_attr_name(name: str) -> str:
     return f"_bound__value__{name}"
 
 
+def unchanged_predicate(
+    comparator: Comparator | None,
+) -> Callable[[Any, Any], bool] | None:
+    """Return a predicate telling whether an old and a new value are the
+    same, according to a [`Comparator`][coil.types.Comparator]."""
+    if comparator == "identity":
+        return operator.is_
+    elif comparator == "equality":
+        return operator.eq
+    else:
+        return comparator
+
+
+def is_unchanged(
+    unchanged: Callable[[Any, Any], bool] | None,
+    host: object,
+    attr_name: str,
+    value: Any,
+) -> bool:
+    """Return whether assigning `value` to an attribute of `host` leaves
+    it unchanged, according to an
+    [`unchanged_predicate`][coil._core.unchanged_predicate]."""
+    if unchanged is None:
+        return False
+
+    old = getattr(host, attr_name, _MISSING)
+    return old is not _MISSING and bool(unchanged(old, value))
+
+
+class Subscribers(Dict[int, DataEventHandler]):
+    """The subscribers of a bindable property, by subscription id.
+
+    Each subscription belongs to the event loop which was running when
+    it was added (if any), and is notified on that loop; see
+    [notify_subscribers][coil._core.notify_subscribers]. `loops` holds
+    the loop of each subscription which has one, and `owners` counts
+    the subscriptions of each loop. (The tables of `__coil_bindings__`
+    are all made by [add_subscription][coil._core.add_subscription].)
+    """
+
+    __slots__ = ("loops", "owners")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        self.owners: Dict[asyncio.AbstractEventLoop, int] = {}
+
+    def add(
+        self,
+        subscription_id: int,
+        handler: DataEventHandler,
+        loop: asyncio.AbstractEventLoop | None,
+    ) -> None:
+        self[subscription_id] = handler
+
+        if loop is not None:
+            self.loops[subscription_id] = loop
+            self.owners[loop] = self.owners.get(loop, 0) + 1
+
+    def discard(self, subscription_id: int) -> None:
+        """Remove a subscription; raises `KeyError` if there is none."""
+        del self[subscription_id]
+        loop = self.loops.pop(subscription_id, None)
+
+        if loop is None:
+            return
+        elif self.owners[loop] > 1:
+            self.owners[loop] -= 1
+        else:
+            del self.owners[loop]
+
+    def notified_by(
+        self, loop: asyncio.AbstractEventLoop | None
+    ) -> Tuple[DataEventHandler, ...]:
+        """Return the handlers which `loop` notifies (or a thread which
+        runs no loop, if `None`): those of its own subscriptions, and of
+        the ones which have no loop, or a closed one."""
+        loops = self.loops
+        owned = []
+
+        # the copy is made without releasing the GIL
+        for subscription_id, handler in tuple(self.items()):
+            owner = loops.get(subscription_id)
+
+            if owner is None or owner is loop or owner.is_closed():
+                owned.append(handler)
+
+        return tuple(owned)
+
+
+class _LoopNotifications:
+    """The notifications which other threads posted to an event loop;
+    all of those which are posted before the loop gets to them are
+    delivered by a single callback."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.lock = threading.Lock()
+        self.pending: List[Tuple[Bindable, str, DataEvent]] = []
+
+    def post(self, bindable: Bindable, prop: str, event: DataEvent) -> None:
+        with self.lock:
+            self.pending.append((bindable, prop, event))
+
+            if len(self.pending) > 1:
+                return  # the callback is already scheduled
+
+        try:
+            self.loop.call_soon_threadsafe(self.deliver)
+        except RuntimeError:  # the loop was closed in the meantime
+            self.deliver()
+
+    def deliver(self) -> None:
+        with self.lock:
+            pending, self.pending = self.pending, []
+
+        for bindable, prop, event in pending:
+            handlers: Subscribers | None
+            handlers = bindable.__coil_bindings__.get(prop)  # type: ignore
+
+            if handlers is not None:
+                _notify_handlers(handlers.notified_by(self.loop), event)
+
+
+# reentrant, since finalizers (which drop subscriptions) run whenever the
+# garbage collector does, which may be while the lock is held
+_subscriptions_lock = threading.RLock()
+_loop_notifications: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, _LoopNotifications
+] = WeakKeyDictionary()
+_loop_notifications_lock = threading.Lock()
+
+
+def _notifications_for(loop: asyncio.AbstractEventLoop) -> _LoopNotifications:
+    with _loop_notifications_lock:
+        notifications = _loop_notifications.get(loop)
+
+        if notifications is None:
+            notifications = _loop_notifications[loop] = _LoopNotifications(
+                loop
+            )
+
+        return notifications
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 def add_subscription(
     bindable: Bindable, prop: str, handler: DataEventHandler
 ) -> SubscriptionHandle:
@@ -25,78 +225,175 @@ def add_subscription(
     The subscription should track both updates and deletions
     for the given property. In addition, it should return a handle
     which can be used to drop the subscription later.
+
+    Handles are never reused, so a handle can't accidentally drop a
+    subscription which was added after its own was dropped.
+
+    Subscriptions can be added (and dropped) from any thread. Each
+    subscription belongs to the event loop which is running when it is
+    added, if any.
     """
-    bindable.__coil_bindings__.setdefault(prop, []).append(handler)
-    return (prop, id(handler))
+    subscription_id = next(_subscription_ids)
+    loop = _running_loop()
+
+    with _subscriptions_lock:
+        bindings = bindable.__coil_bindings__
+
+        if bindings is NO_SUBSCRIBERS:
+            bindings = {}
+            setattr(bindable, "__coil_bindings__", bindings)
+
+        handlers: Subscribers | None = bindings.get(prop)  # type: ignore
+
+        if handlers is None:
+            handlers = bindings[prop] = Subscribers()
+
+        handlers.add(subscription_id, handler, loop)
+
+    return (prop, subscription_id)
 
 
 def drop_subscription(bindable: Bindable, handle: SubscriptionHandle) -> None:
     """Remove a subscription from a bindable."""
-    (prop_name, handler_id) = handle
+    (prop_name, subscription_id) = handle
+
+    with _subscriptions_lock:
+        bindings = bindable.__coil_bindings__
+
+        try:
+            handlers: Subscribers = bindings[prop_name]  # type: ignore
+            handlers.discard(subscription_id)
+        except KeyError:
+            raise LookupError(f"Invalid subscription: {handle}") from None
+
+        if not handlers:
+            del bindings[prop_name]
+
 
-    handlers = bindable.__coil_bindings__.get(prop_name, [])
-    handler = next((h for h in handlers if id(h) == handler_id), None)
+def drop_subscriptions(
+    subscriptions: List[Tuple[Bindable, SubscriptionHandle]]
+) -> None:
+    """Remove several subscriptions, each from its bindable (such as
+    the subscriptions of a bound value to its inputs, once it is
+    collected)."""
+    for host, handle in subscriptions:
+        drop_subscription(host, handle)
+
+
+def propagation_for(
+    source: BindingTarget, kind: EventType, source_event: DataEvent | None
+) -> Propagation:
+    """
+    Return the propagation for a new event generated from `source`.
+
+    The event joins the wave of its `source_event`, or starts a new one
+    if it doesn't have one.
+    """
+    if source_event is None:
+        return Propagation.start(source, kind)
+    else:
+        return source_event.propagation.follow(source, kind)
+
+
+def lineage_for(source_event: DataEvent | None) -> DataEvent | None:
+    """
+    Return `source_event`, with its lineage trimmed to the
+    [`lineage_depth`][coil.Runtime] of the active runtime.
+
+    The events in the lineage are copied rather than modified, since
+    other events may still refer to them.
+    """
+    rt = current_runtime.get(None)
 
-    if handler is not None:
-        handlers.remove(handler)
+    if source_event is None or rt is None or rt.lineage_depth is None:
+        return source_event
     else:
-        raise LookupError(f"Invalid subscription: {handle}")
+        return _trim_lineage(source_event, rt.lineage_depth)
+
+
+def _trim_lineage(event: DataEvent, depth: int) -> DataEvent | None:
+    if depth == 0:
+        return None
+
+    parent = event.source_event
+
+    if parent is None:
+        return event
+
+    trimmed = copy(event)
+    trimmed.source_event = _trim_lineage(parent, depth - 1)
+    return trimmed
 
 
 def notify_subscribers(
     bindable: Bindable, prop: str, event: DataEvent
 ) -> None:
 
-    if _is_cyclic_trigger(event):
-        LOG.warning(
-            "Event has a cyclic trigger. "
-            f"It will not be propagated:\n{pformat(event)}"
-        )
+    if event.propagation.cyclic:
+        if LOG.isEnabledFor(WARNING):
+            LOG.warning(
+                "Event has a cyclic trigger. "
+                "It will not be propagated:\n%s",
+                pformat(event),
+            )
         return
 
-    for receive in bindable.__coil_bindings__.get(prop, []):
-        try:
-            receive(event)
-        except Exception:
-            continue
+    batch = current_batch.get()
 
+    if batch is not None and batch.active:
+        batch.defer(bindable, prop, event)
+        return
 
-def _is_cyclic_trigger(event: DataEvent) -> bool:
-    orig_source_obj = (id(event["source"].host), event["source"].prop)
-    orig_event_type = get_event_type(event)
+    handlers: Subscribers | None
+    handlers = bindable.__coil_bindings__.get(prop)  # type: ignore
 
-    LOG.debug(f"Starting search for event with source: {orig_source_obj}")
+    if handlers is None:
+        return
 
-    while event["source_event"] is not None:
-        event = event["source_event"]
-        if (
-            orig_source_obj == (id(event["source"].host), event["source"].prop)
-            and get_event_type(event) == orig_event_type
-        ):
-            LOG.debug(f"Found: \n{pformat(event)}")
-            return True
-    else:
-        LOG.debug("Not found.")
-        return False
+    owners = handlers.owners
 
+    if owners:
+        loop = _running_loop()
 
-def tail(bound: Bound, *, into: ReverseBound) -> asyncio.Task[None]:
-    """Forward all changes from a bound value into another.
+        if len(owners) > 1 or loop not in owners:
+            _notify_across_loops(bindable, prop, handlers, loop, event)
+            return
 
-    This function returns a cancellable `asyncio.Task`, which will
-    keep running until the bound value is deleted from the host (if ever).
+    # handlers may add or drop subscriptions while they are notified (from
+    # any thread); the copy is made without releasing the GIL
+    _notify_handlers(tuple(handlers.values()), event)
 
-    Args:
-        bound: a bound value from which changes are to be streamed.
-        into: a bound value into which changes are sent
-    """
-    events_stream = stream.iterate(bound.events())
-    return asyncio.create_task(_tail(events_stream, into))
+
+def _notify_across_loops(
+    bindable: Bindable,
+    prop: str,
+    handlers: Subscribers,
+    loop: asyncio.AbstractEventLoop | None,
+    event: DataEvent,
+) -> None:
+    # the subscribers (and the queues of their streams) aren't
+    # thread-safe; they are notified by the loop which owns them
+    for owner in tuple(handlers.owners):
+        if owner is not loop and not owner.is_closed():
+            _notifications_for(owner).post(bindable, prop, event)
+
+    _notify_handlers(handlers.notified_by(loop), event)
+
+
+def _notify_handlers(
+    receivers: Tuple[DataEventHandler, ...], event: DataEvent
+) -> None:
+    for receive in receivers:
+        try:
+            receive(event)
+        except Exception:
+            continue
 
 
-async def _tail(events_stream: Any, into: ReverseBound) -> None:
-    async with events_stream.stream() as streamer:
-        async for event in streamer:
-            await into.set(event["value"], source_event=event)
+class Assignment(NamedTuple):
+    host: Bindable
+    prop: str
 
-        # fixme: if the stream is exhausted, the field was deleted
+    @property
+    def current(self) -> Any:
+        return getattr(self.host, self.prop)
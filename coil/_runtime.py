@@ -1,17 +1,67 @@
-from asyncio import CancelledError, Queue, Task, create_task, gather
-from asyncio import sleep as async_sleep
+import weakref
+from asyncio import Future, Queue, create_task, get_running_loop, wait
 from contextlib import suppress
 from contextvars import ContextVar
 from logging import getLogger
-from typing import Any, ClassVar, Dict, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 BindingMeta = Tuple[object, str]
 TaskKey = Tuple[str, int | None, str | None]
 
+CANCEL_BATCH_SIZE = 1024
+
 LOG = getLogger("coil.runtime")
 current_runtime: ContextVar["Runtime"] = ContextVar("current_runtime")
 
 
+class InFlight:
+    """A count of the units of work which are in flight in a runtime.
+
+    Whoever is waiting for the work to [settle][coil._runtime.InFlight.settled]
+    is woken up by the unit of work which brings the count down to zero;
+    so is `on_settled`, if given.
+    """
+
+    def __init__(self, on_settled: Callable[[], None] | None = None) -> None:
+        self.count = 0
+        self.on_settled = on_settled
+        self.__waiters: List[Future[None]] = []
+
+    def add(self, count: int = 1) -> None:
+        self.count += count
+
+    def remove(self, count: int = 1) -> None:
+        self.count -= count
+
+        if not self.count:
+            for waiter in self.__waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+            self.__waiters.clear()
+
+            if self.on_settled is not None:
+                self.on_settled()
+
+    async def settled(self) -> None:
+        """Wait until there is no work in flight."""
+        while self.count:
+            waiter = get_running_loop().create_future()
+            self.__waiters.append(waiter)
+            await waiter
+
+
 class Runtime:
     """
     A coil runtime
@@ -19,20 +69,72 @@ class Runtime:
     This object is a context manager capable of managing tasks by an id
     (which may or may not be scoped to a binding). When the context exits,
     all tasks which are remaining are cancelled and then awaited.
+
+    Args:
+        lineage_depth: The number of ancestors kept in the `source_event`
+            chain of events which are forwarded through bindings while
+            this runtime is active. The default (`None`) keeps the whole
+            chain, which means that every event forwarded by a long chain
+            of bindings keeps all of its predecessors alive. Cycle
+            detection doesn't depend on this chain, and the origin and hop
+            count of every event remain available from its
+            [`propagation`][coil.types.Propagation] regardless.
+        eager: Whether bound values which are assigned to bindable
+            properties while this runtime is active should be
+            [tailed][coil.tail] eagerly: that is, by setting the property
+            directly from the subscribers of the bound value, rather than
+            from a task per binding. Eager bindings are registered with
+            the runtime (and evicted from it) like any other binding.
+        shutdown_timeout: The number of seconds given to the remaining
+            tasks to finish cancelling when the runtime exits. Tasks which
+            haven't finished by then are abandoned (and logged). The
+            default (`None`) waits for all of them.
+
+    Tasks which are scoped to a binding don't outlive its host: when the
+    host is garbage collected, they are evicted, and cancelled right
+    away. (This requires that the host can be weakly referenced;
+    instances of [bindable classes][coil.bindableclass] can be.)
+    Conversely, the tails of bound values which are assigned to bindable
+    properties don't keep the host of the property alive.
     """
 
-    __tasks: Dict[TaskKey, Task[Any]]
+    __tasks: Dict[TaskKey, Future[Any]]
+    __task_keys: Dict[Future[Any], Set[TaskKey]]
+    __host_keys: Dict[int, Set[TaskKey]]
+    __host_finalizers: Dict[int, "weakref.finalize[[int], object]"]
     __registry: ClassVar[Dict[int, "Runtime"]] = {}
 
+    def __init__(
+        self,
+        *,
+        lineage_depth: int | None = None,
+        eager: bool = False,
+        shutdown_timeout: float | None = None,
+    ) -> None:
+        if lineage_depth is not None and lineage_depth < 0:
+            raise ValueError("lineage_depth must not be negative.")
+
+        if shutdown_timeout is not None and shutdown_timeout < 0:
+            raise ValueError("shutdown_timeout must not be negative.")
+
+        self.lineage_depth = lineage_depth
+        self.eager = eager
+        self.shutdown_timeout = shutdown_timeout
+
     async def __aenter__(self) -> "Runtime":
         self.__tasks = {}
+        self.__task_keys = {}
+        self.__host_keys = {}
+        self.__host_finalizers = {}
         self.__registry[id(self)] = self
         self.__reset_token = current_runtime.set(self)
-        self.__pending_cleanups = Queue[Task[Any] | None]()
+        self.__pending_cleanups = Queue[Tuple[Future[Any], ...] | None]()
+        self.in_flight = InFlight()
 
         # register a task for cleaning up the evicted
         # tasks from the runtime.
-        self.register(create_task(self.__drain_pending_cleanups()), "")
+        self.__drainer = create_task(self.__drain_pending_cleanups())
+        self.register(self.__drainer, "")
         return self
 
     async def __aexit__(
@@ -43,23 +145,71 @@ class Runtime:
     ) -> None:
         self.__registry.pop(id(self))
         current_runtime.reset(self.__reset_token)
+        deadline = (
+            None
+            if self.shutdown_timeout is None
+            else get_running_loop().time() + self.shutdown_timeout
+        )
+
+        # let the drainer finish the evictions which are still pending
         self.__pending_cleanups.put_nowait(None)
+        await wait([self.__drainer], timeout=_remaining(deadline))
+        del self.__drainer
+
+        for finalizer in self.__host_finalizers.values():
+            finalizer.detach()
+
+        tasks = list(self.__task_keys)
+        del self.__tasks, self.__task_keys, self.__host_keys
+        del self.__host_finalizers
+
+        await self.__cleanup(tasks, deadline)
+
+    async def synchronise(self) -> None:
+        """Wait until the changes propagating through the runtime settle.
 
-        while not self.__pending_cleanups.empty():
-            await async_sleep(0)
+        This returns once every event which was received by a
+        [tail][coil.tail] started while the runtime is active has been
+        forwarded (along with the events that it caused in turn), every
+        pending recomputation of a [computed value][coil.computed] has
+        notified its subscribers, and every
+        [evicted][coil.Runtime.evict] task has been cancelled.
+        It doesn't poll; the waiting task is woken up by whichever of
+        them finishes last.
 
-        tasks = [task for task in self.__tasks.values()]
-        del self.__tasks
+            import asyncio
+            import coil
 
-        await self.__cleanup(*tasks)
+            @coil.bindableclass
+            class Box:
+                value: int
+
+            async def main():
+                source, target = Box(0), Box(0)
+
+                async with coil.runtime() as rt:
+                    target.value = Box.value.bind(source)
+                    source.value = 10
+                    await rt.synchronise()
+                    assert target.value == 10
+
+                    Box.value.clear_last_binding(assigned_to=target)
+                    await rt.synchronise()
+                    source.value = 20
+                    await rt.synchronise()
+                    assert target.value == 10
+
+            asyncio.run(main())
+        """
+        await self.in_flight.settled()
 
     def register(
-        self, task: Task[Any], id: str, *, source: BindingMeta | None = None
+        self, task: Future[Any], id: str, *, source: BindingMeta | None = None
     ) -> None:
         """Register a task by an id.
 
         Args:
-            task: an asyncio task to be monitored.
+            task: an asyncio task (or future) to be monitored.
             id: a unique identifier for the task, which can be used to
                 look it up later with :meth:`find`.
             source: An optional binding to which the id is scoped.
@@ -72,16 +222,29 @@ class Runtime:
         """
         task_key = self.__get_task_key(id, source)
 
-        if task_key in self.__tasks and self.__tasks[task_key] is not task:
+        registered = self.__tasks.get(task_key)
+
+        if registered is task:
+            return
+        elif registered is not None:
             raise ValueError(
                 "Another task is already registered with this id."
             )
 
         self.__tasks[task_key] = task
+        self.__task_keys.setdefault(task, set()).add(task_key)
+
+        _, host_id, _ = task_key
+
+        if source is not None and host_id is not None:
+            if host_id not in self.__host_keys:
+                self.__track_host(source[0], host_id)
+
+            self.__host_keys.setdefault(host_id, set()).add(task_key)
 
     def find(
         self, id: str, *, source: BindingMeta | None = None
-    ) -> Task[Any] | None:
+    ) -> Future[Any] | None:
         """Retrieve a [`registered`][coil.Runtime.register] task."""
         task_key = self.__get_task_key(id, source)
         return self.__tasks.get(task_key)
@@ -100,17 +263,75 @@ class Runtime:
         If no task is found matching the search parameters, this function
         does nothing.
         """
-        task = self.find(id, source=source)
+        self.evict_many((id,), source=source)
 
-        if task is not None:
-            self.forget(task)
-            self.__pending_cleanups.put_nowait(task)
+    def evict_many(
+        self, ids: Iterable[str], *, source: BindingMeta | None = None
+    ) -> None:
+        """[Evict][coil.Runtime.evict] the tasks registered by any of the
+        given ids (and, optionally, scoped to the given binding).
+
+        All the evicted tasks are cancelled together.
+        """
+        tasks = (self.find(id, source=source) for id in ids)
+        self.__evict(task for task in tasks if task is not None)
+
+    def evict_all(self, *, source_host: object) -> None:
+        """[Evict][coil.Runtime.evict] every task scoped to a binding of
+        the given host, regardless of its id or bound property.
+
+        All the evicted tasks are cancelled together.
+        """
+        task_keys = self.__host_keys.get(id(source_host), ())
+        self.__evict(self.__tasks[key] for key in task_keys)
 
-    def forget(self, task: Task[Any]) -> None:
+    def forget(self, task: Future[Any]) -> None:
         """Purge a given task from the internal registry."""
-        self.__tasks = {
-            key: val for key, val in self.__tasks.items() if val != task
-        }
+        for task_key in self.__task_keys.pop(task, ()):
+            del self.__tasks[task_key]
+            _, host_id, _ = task_key
+
+            if host_id is not None:
+                host_keys = self.__host_keys[host_id]
+                host_keys.discard(task_key)
+
+                if not host_keys:
+                    del self.__host_keys[host_id]
+                    self.__untrack_host(host_id)
+
+    def __evict(self, tasks: Iterable[Future[Any]]) -> None:
+        # the same task may be registered by several keys
+        evicted = tuple(dict.fromkeys(tasks))
+
+        for task in evicted:
+            self.forget(task)
+
+        if evicted:
+            self.in_flight.add()
+            self.__pending_cleanups.put_nowait(evicted)
+
+    def __track_host(self, host: object, host_id: int) -> None:
+        with suppress(TypeError):  # host can't be weakly referenced
+            self.__host_finalizers[host_id] = weakref.finalize(
+                host, self.__host_collected, host_id
+            )
+
+    def __untrack_host(self, host_id: int) -> None:
+        finalizer = self.__host_finalizers.pop(host_id, None)
+
+        if finalizer is not None:
+            finalizer.detach()
+
+    def __host_collected(self, host_id: int) -> None:
+        # the tasks are evicted right away, so that they can't collide
+        # with the tasks of another host which reuses the id later on
+        tasks = [self.__tasks[key] for key in self.__host_keys[host_id]]
+        LOG.debug("evicting %d tasks of a collected host", len(tasks))
+
+        for task in tasks:
+            task.cancel()
+
+        self.__evict(tasks)
 
     def __get_task_key(self, _id: str, _source: BindingMeta | None) -> TaskKey:
         return (
@@ -122,32 +343,64 @@ class Runtime:
     async def __drain_pending_cleanups(self) -> None:
         # internal runtime task for cancelling and cleaning up
         # evicted tasks
-        while True:
-            next_task = await self.__pending_cleanups.get()
+        queue = self.__pending_cleanups
+        stopping = False
 
-            if next_task is None:
-                # stop requested
-                break
+        while not stopping:
+            next_tasks = [await queue.get()]
 
-            await self.__cleanup(next_task)
+            # clean up every eviction which is pending at once
+            while not queue.empty():
+                next_tasks.append(queue.get_nowait())
+
+            # a None item requests the drainer to stop
+            stopping = None in next_tasks
+            evictions = [tasks for tasks in next_tasks if tasks is not None]
+            await self.__cleanup(
+                [task for tasks in evictions for task in tasks]
+            )
+            self.in_flight.remove(len(evictions))
 
-    async def __cleanup(self, *tasks: Task[Any]) -> None:
-        # cancel all the given tasks and await them.
+    async def __cleanup(
+        self, tasks: Sequence[Future[Any]], deadline: float | None = None
+    ) -> None:
+        # cancel all the given tasks (a bounded batch at a time, so that
+        # the loop isn't flooded with cancellations) and await them.
         # if there are any exceptions, log them.
 
-        meta_task = gather(*tasks, return_exceptions=True)
-        meta_task.cancel()
+        for start in range(0, len(tasks), CANCEL_BATCH_SIZE):
+            end = start + CANCEL_BATCH_SIZE
+            batch = tasks[start:end]
+
+            for task in batch:
+                task.cancel()
 
-        with suppress(CancelledError):
-            results = await meta_task
+            done, pending = await wait(batch, timeout=_remaining(deadline))
 
-            for result in results:
-                if isinstance(result, Exception):
+            for task in done:
+                exc = None if task.cancelled() else task.exception()
+
+                if isinstance(exc, Exception):
                     LOG.error(
                         "Unhandled exception in registered task:",
-                        exc_info=(type(result), result, result.__traceback__),
+                        exc_info=(type(exc), exc, exc.__traceback__),
                     )
 
+            if pending:
+                LOG.warning(
+                    "Abandoned %d registered tasks which didn't finish "
+                    "cancelling before the shutdown deadline.",
+                    len(tasks) - start - len(done),
+                )
+                return
+
+
+def _remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+
+    return max(deadline - get_running_loop().time(), 0)
+
 
 def runtime(*, ensure: bool = True) -> Runtime:
     """Retrieve the currently active [coil.Runtime][].
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import weakref
+from collections import Counter
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Protocol, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from ._runtime import InFlight
+
+# ranks (and feeds) are keyed by the identity of their host, since
+# bindable classes (as dataclasses) are unhashable; they are dropped
+# with their host. a feed is counted once per binding which makes it
+_ranks: Dict[int, Dict[str, int]] = {}
+_feeds: Dict[int, Dict[str, Counter[Tuple[int, str]]]] = {}
+_tracked: Set[int] = set()
+_schedulers: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Scheduler
+] = WeakKeyDictionary()
+
+
+def _track(host: object) -> bool:
+    """Make sure that what is recorded about `host` is dropped with it;
+    return whether it can be (that is, whether `host` can be weakly
+    referenced)."""
+    if id(host) in _tracked:
+        return True
+
+    try:
+        weakref.finalize(host, _forget, id(host))
+    except TypeError:
+        return False
+
+    _tracked.add(id(host))
+    return True
+
+
+def _forget(key: int) -> None:
+    _tracked.discard(key)
+    _ranks.pop(key, None)
+    _feeds.pop(key, None)
+
+
+def rank_of(host: object, prop: str) -> int:
+    """Return the rank of a bindable property in the binding graph.
+
+    Properties which aren't fed by anything have rank `0`; otherwise, a
+    property ranks above everything it is fed by, as far as was known
+    when its bindings were made (see [raise_rank][coil._scheduler.raise_rank]).
+    """
+    return _ranks.get(id(host), {}).get(prop, 0)
+
+
+def raise_rank(host: object, prop: str, rank: int) -> None:
+    """Record that a property is fed by a property of the given rank
+    minus one; ranks are only ever raised."""
+    if not _track(host):
+        return
+
+    ranks = _ranks.setdefault(id(host), {})
+    ranks[prop] = max(ranks.get(prop, 0), rank)
+
+
+def add_feed(
+    host: object, prop: str, source_host: object, source_prop: str
+) -> Callable[[], None]:
+    """Record that a property is fed by another (by a tail, or as the
+    input of a computed value), so that the scheduler can tell which
+    nodes a delivery may reach.
+
+    Returns:
+        a function which drops the feed again, once whatever made it is
+        done; it doesn't keep either host alive.
+    """
+    if not _track(host):
+        return lambda: None
+
+    source = (id(source_host), source_prop)
+    feeds = _feeds.setdefault(id(host), {})
+    feeds.setdefault(prop, Counter())[source] += 1
+    host_ref = weakref.ref(host)
+
+    def drop() -> None:
+        # a collected host took its feeds along with it
+        alive = host_ref()
+        sources = _feeds.get(id(alive), {}).get(prop, Counter())
+
+        if alive is not None and source in sources:
+            sources[source] -= 1
+
+            if not sources[source]:
+                del sources[source]
+
+    return drop
+
+
+def _fed_by(key: Tuple[int, str]) -> Iterable[Tuple[int, str]]:
+    host_id, prop = key
+    return _feeds.get(host_id, {}).get(prop, ())
+
+
+class Refreshable(Protocol):
+    @property
+    def host(self) -> object:
+        pass
+
+    @property
+    def prop(self) -> str:
+        pass
+
+    @property
+    def rank(self) -> int:
+        pass
+
+    def _refresh(self) -> None:
+        pass
+
+
+class _Deliveries(InFlight):
+    """The changes which tails are delivering into a property; they are
+    counted in the `total` of the scheduler too."""
+
+    def __init__(self, total: InFlight, on_settled: Callable[[], None]):
+        super().__init__(on_settled)
+        self.total = total
+
+    def add(self, count: int = 1) -> None:
+        super().add(count)
+        self.total.add(count)
+
+    def remove(self, count: int = 1) -> None:
+        super().remove(count)
+        self.total.remove(count)
+
+
+class Scheduler:
+    """Refreshes the nodes of the binding graph which depend on several
+    others (such as [computed values][coil.Computed]) in the order of
+    their rank, so that each of them is refreshed at most once per
+    propagation wave, once everything it depends on is up to date.
+
+    The refresh of a node is held back while [tails][coil.tail] are
+    delivering changes into any of the properties which it depends on,
+    however indirectly (as far as the feeds recorded with
+    [add_feed][coil._scheduler.add_feed] tell). Deliveries into targets
+    which aren't bound properties hold back every node.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.total = InFlight()
+        self.__anywhere = _Deliveries(self.total, self.__wake)
+        self.__deliveries: Dict[Tuple[int, str], _Deliveries] = {}
+        self.__pending: List[Tuple[int, int, Refreshable]] = []
+        self.__order = count()
+        self.__drain_handle: asyncio.Handle | None = None
+
+    def deliveries(self, into: object) -> InFlight:
+        """Return the count of the changes which tails are delivering
+        into a target (which is a bound property if it has a `host` and
+        a `prop`)."""
+        host = getattr(into, "host", None)
+        prop = getattr(into, "prop", None)
+
+        if host is None or not isinstance(prop, str):
+            return self.__anywhere
+
+        key = (id(host), prop)
+        deliveries = self.__deliveries.get(key)
+
+        if deliveries is None:
+            deliveries = _Deliveries(self.total, self.__wake)
+
+            try:
+                weakref.finalize(host, self.__deliveries.pop, key, None)
+            except TypeError:  # host can't be weakly referenced
+                return self.__anywhere
+
+            self.__deliveries[key] = deliveries
+
+        return deliveries
+
+    def schedule(self, node: Refreshable) -> None:
+        """Refresh a node (once) after everything ranked below it."""
+        heapq.heappush(self.__pending, (node.rank, next(self.__order), node))
+        self.__wake()
+
+    def __wake(self) -> None:
+        if self.__pending and self.__drain_handle is None:
+            self.__drain_handle = self.loop.call_soon(self.__drain)
+
+    def __drain(self) -> None:
+        self.__drain_handle = None
+        pending = self.__pending
+        held_back = []
+
+        # refreshing a node may schedule the nodes that depend on it, or
+        # start the delivery of its changes to them
+        while pending:
+            entry = heapq.heappop(pending)
+
+            if self.__awaits_delivery(entry[2]):
+                held_back.append(entry)
+            else:
+                entry[2]._refresh()
+
+        for entry in held_back:
+            heapq.heappush(pending, entry)
+
+    def __awaits_delivery(self, node: Refreshable) -> bool:
+        if not self.total.count:
+            return False
+        elif self.__anywhere.count:
+            return True
+
+        # look for pending deliveries upstream of the node
+        stack = [(id(node.host), node.prop)]
+        seen = set(stack)
+
+        while stack:
+            key = stack.pop()
+            deliveries = self.__deliveries.get(key)
+
+            if deliveries is not None and deliveries.count:
+                return True
+
+            for source in _fed_by(key):
+                if source not in seen:
+                    seen.add(source)
+                    stack.append(source)
+
+        return False
+
+
+def get_scheduler() -> Scheduler:
+    """Return the scheduler of the running event loop.
+
+    Raises:
+        RuntimeError: if there is no running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+
+    if scheduler is None:
+        scheduler = _schedulers[loop] = Scheduler(loop)
+
+    return scheduler
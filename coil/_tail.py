@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from asyncio import FIRST_COMPLETED
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import suppress
+from functools import partial
+from typing import Any, Callable, Deque, List, Protocol, Set, Tuple
+
+from coil.protocols import Bound, EventStream, ReverseBound
+from coil.types import DataEvent, DataUpdatedEvent, is_update_event
+
+from ._bindings import BindingEventStream
+from ._collections import _Mirror
+from ._core import SubscriptionHandle, add_subscription, drop_subscription
+from ._runtime import InFlight, current_runtime
+from ._scheduler import add_feed, get_scheduler
+
+
+def tail(
+    bound: Bound,
+    *,
+    into: ReverseBound,
+    eager: bool = False,
+    transform: Callable[[Any], Any] | None = None,
+    executor: Executor | None = None,
+) -> asyncio.Future[None]:
+    """Forward all changes from a bound value into another.
+
+    This function returns a cancellable `asyncio.Task`, which will
+    keep running until the bound value is deleted from the host (if ever).
+
+    With `eager=True`, no task is created; instead, `into` is set directly
+    by a subscriber to `bound`, while `bound` notifies its subscribers.
+    Changes are then forwarded immediately, rather than a few iterations
+    of the event loop later: by the time the assignment which started a
+    wave of changes returns, the wave has gone through every eager tail
+    it reaches. The tails which a wave reaches are run one after the
+    other (breadth-first), not within one another, so chains of eager
+    tails can be arbitrarily long. In this case, the returned `asyncio.Future`
+    represents the subscription: it is resolved when the bound value is
+    deleted, and cancelling it drops the subscription. This requires that
+    `into` can be set synchronously, as two-way bindings can be.
+
+    Changes which are still being forwarded by tasks that were started
+    while a runtime is active can be awaited with
+    [coil.Runtime.synchronise][].
+
+    With a `transform`, changes are forwarded as the result of calling
+    it with the new value. Transforms which would block the event loop
+    can be run by an `executor` (a thread or process pool, which needs
+    to be able to pickle the transform and the values in the latter
+    case). Only the latest change is transformed: when a change arrives
+    while an earlier one is still being transformed, the earlier result
+    is discarded (and its computation cancelled, if it hasn't started
+    yet). Cancelling the task discards the pending result in the same
+    way, but deleting the bound value doesn't: like the changes which
+    are forwarded without an executor, the last one is still delivered
+    before the task ends. While a transform runs in an executor, the
+    nodes which `into` feeds aren't held back; only its delivery is.
+
+    Changes of a bindable collection (such as [coil.BindableList][]) are
+    applied in place to the collection of the same type which `into`
+    holds, if any, rather than copied into it: the first change replaces
+    its contents, and the ones which follow are applied one by one
+    (unless a transform is given).
+
+    Args:
+        bound: a bound value from which changes are to be streamed.
+        into: a bound value into which changes are sent
+        eager: whether changes should be forwarded synchronously.
+        transform: a function which the changes are forwarded through.
+        executor: the executor which runs `transform`; without it,
+            `transform` is called on the event loop.
+
+    Raises:
+        ValueError: if `executor` is given for an eager tail.
+    """
+    if eager and executor is not None:
+        raise ValueError("Eager tails can't run transforms elsewhere.")
+
+    if eager:
+        return _feeding(_eager_tail(bound, into, transform), bound, into)
+
+    # the changes delivered by tails hold back the refreshes of the nodes
+    # which they may feed (though not while executors transform them),
+    # and the synchronisation of the runtime
+    deliveries = get_scheduler().deliveries(into)
+    in_flight = [] if executor is not None else [deliveries]
+    rt = current_runtime.get(None)
+
+    if rt is not None:
+        in_flight.append(rt.in_flight)
+
+    return _feeding(
+        _tracked_tail(bound, into, in_flight, deliveries, transform, executor),
+        bound,
+        into,
+    )
+
+
+def _feeding(
+    future: asyncio.Future[None], bound: Bound, into: ReverseBound
+) -> asyncio.Future[None]:
+    # record that the tail feeds into for as long as it runs, so that
+    # rebinding a target over and over doesn't pile up the feeds of its
+    # former sources
+    into_host = getattr(into, "host", None)
+    into_prop = getattr(into, "prop", None)
+
+    if into_host is not None and isinstance(into_prop, str):
+        drop = add_feed(into_host, into_prop, bound.host, bound.prop)
+        future.add_done_callback(lambda _: drop())
+
+    return future
+
+
+class _ReverseBoundNowait(ReverseBound, Protocol):
+    def set_nowait(
+        self, value: Any, source_event: DataEvent | None = None
+    ) -> None:
+        pass
+
+
+class _EagerWave(threading.local):
+    # the deliveries of eager tails which are waiting for the one that
+    # is running in this thread (if any) to return
+    pending: Deque[Callable[[], None]] | None = None
+
+
+_eager_wave = _EagerWave()
+
+
+def _run_eagerly(delivery: Callable[[], None]) -> None:
+    """Run the delivery of an eager tail.
+
+    The deliveries which it sets off (by notifying the subscribers of
+    the value it sets) are queued, and run in turn by the outermost
+    delivery, rather than within one another; so a wave of changes goes
+    through a chain of eager tails one link after the other, however
+    long the chain is.
+    """
+    pending = _eager_wave.pending
+
+    if pending is not None:
+        pending.append(delivery)
+        return
+
+    pending = _eager_wave.pending = deque([delivery])
+
+    try:
+        while pending:
+            pending.popleft()()
+    finally:
+        _eager_wave.pending = None
+
+
+def _eager_tail(
+    bound: Bound,
+    into: ReverseBound,
+    transform: Callable[[Any], Any] | None = None,
+) -> asyncio.Future[None]:
+    if not hasattr(into, "set_nowait"):
+        raise TypeError(f"{into!r} can't be set synchronously.")
+
+    into_nowait: _ReverseBoundNowait = into  # type: ignore
+    done = asyncio.get_running_loop().create_future()
+    mirror = _Mirror(into)
+
+    def forward(data_event: DataEvent) -> None:
+        _run_eagerly(partial(deliver, data_event))
+
+    def deliver(data_event: DataEvent) -> None:
+        if done.done():
+            # evicted, but the subscription isn't dropped yet
+            return
+
+        if not is_update_event(data_event):
+            done.set_result(None)
+            return
+
+        try:
+            value = data_event.value
+
+            if transform is not None:
+                value = transform(value)
+            elif mirror.forward(data_event):
+                return
+
+            into_nowait.set_nowait(value, source_event=data_event)
+        except Exception as exc:
+            done.set_exception(exc)
+
+    def unsubscribe(_: asyncio.Future[None]) -> None:
+        # a collected host takes its subscriptions along with it
+        with suppress(ReferenceError):
+            drop_subscription(bound.host, handle)
+
+    handle = add_subscription(bound.host, bound.prop, forward)
+    done.add_done_callback(unsubscribe)
+    return done
+
+
+def _tracked_tail(
+    bound: Bound,
+    into: ReverseBound,
+    in_flight: List[InFlight],
+    deliveries: InFlight,
+    transform: Callable[[Any], Any] | None = None,
+    executor: Executor | None = None,
+) -> asyncio.Task[None]:
+    # the events received by the tail are in flight until they are
+    # forwarded (or dropped by the stream, or left behind by the task).
+    # the streams of bindings count them as they receive them; other
+    # streams need a subscription of their own for it
+    events = bound.events()
+    handle: SubscriptionHandle | None = None
+    received = forwarded = settled = 0
+
+    def receive() -> None:
+        nonlocal received
+        received += 1
+
+        for counter in in_flight:
+            counter.add()
+
+    def settle(count: int) -> None:
+        nonlocal settled
+
+        for counter in in_flight:
+            counter.remove(count - settled)
+
+        settled = count
+
+    def forward() -> None:
+        nonlocal forwarded
+        forwarded += 1
+        settle(forwarded + events.dropped)
+
+    def finish(_: asyncio.Task[None]) -> None:
+        # a collected host takes its subscriptions along with it
+        if handle is not None:
+            with suppress(ReferenceError):
+                drop_subscription(bound.host, handle)
+
+        settle(received)
+
+    if isinstance(events, BindingEventStream):
+        events.on_received(receive)
+    else:
+        handle = add_subscription(bound.host, bound.prop, lambda _: receive())
+
+    if executor is not None:
+        assert transform is not None, "executors run transforms"
+        tailing = _offloaded_tail(
+            events, into, forward, deliveries, transform, executor
+        )
+    else:
+        tailing = _tail(events, into, forward, transform)
+
+    task = asyncio.create_task(tailing)
+    task.add_done_callback(finish)
+    return task
+
+
+async def _tail(
+    events: EventStream,
+    into: ReverseBound,
+    on_forwarded: Callable[[], None],
+    transform: Callable[[Any], Any] | None = None,
+) -> None:
+    mirror = _Mirror(into)
+
+    async with events:
+        async for event in events:
+            value = event.value
+
+            if transform is not None:
+                value = transform(value)
+                await into.set(value, source_event=event)
+            elif not mirror.forward(event):
+                await into.set(value, source_event=event)
+
+            # don't hold on to the event (and the hosts in its lineage)
+            # while waiting for the next one
+            del event
+
+            on_forwarded()
+
+        # fixme: if the stream is exhausted, the field was deleted
+
+
+async def _offloaded_tail(
+    events: EventStream,
+    into: ReverseBound,
+    on_forwarded: Callable[[], None],
+    deliveries: InFlight,
+    transform: Callable[[Any], Any],
+    executor: Executor,
+) -> None:
+    loop = asyncio.get_running_loop()
+    iterator = events.__aiter__()
+    latest: Tuple[DataUpdatedEvent, asyncio.Future[Any]] | None = None
+
+    def discard_latest() -> None:
+        nonlocal latest
+
+        if latest is not None:
+            _, computation = latest
+            latest = None
+
+            # a computation which has already finished can't be cancelled;
+            # its result (or its exception) is left unused
+            if not computation.cancel() and not computation.cancelled():
+                computation.exception()
+
+            on_forwarded()
+
+    async def deliver_latest() -> None:
+        nonlocal latest
+        assert latest is not None
+        event, computation = latest
+        value = await computation
+        latest = None
+        deliveries.add()
+
+        try:
+            await into.set(value, source_event=event)
+        finally:
+            deliveries.remove()
+
+        on_forwarded()
+
+    async with events:
+        next_event = asyncio.ensure_future(iterator.__anext__())
+
+        try:
+            while True:
+                waiting: Set[asyncio.Future[Any]] = {next_event}
+
+                if latest is not None:
+                    waiting.add(latest[1])
+
+                await asyncio.wait(waiting, return_when=FIRST_COMPLETED)
+
+                # a newer change makes the pending result stale, even if
+                # it is ready
+                if next_event.done():
+                    try:
+                        event = next_event.result()
+                    except StopAsyncIteration:
+                        # the bound value was deleted; the change which
+                        # is being transformed is the last one
+                        if latest is not None:
+                            await deliver_latest()
+
+                        break
+
+                    discard_latest()
+                    latest = (
+                        event,
+                        loop.run_in_executor(executor, transform, event.value),
+                    )
+                    next_event = asyncio.ensure_future(iterator.__anext__())
+                    del event
+
+                elif latest is not None and latest[1].done():
+                    await deliver_latest()
+        finally:
+            next_event.cancel()
+            discard_latest()
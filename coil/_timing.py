@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import weakref
+from typing import Any, ClassVar, Dict
+
+from ._bindings import Binding, BindingEventStream, _weak_handler
+from ._core import (
+    add_subscription,
+    drop_subscriptions,
+    lineage_for,
+    notify_subscribers,
+    propagation_for,
+)
+from ._runtime import InFlight, current_runtime
+from ._scheduler import add_feed
+from .protocols import Bindable, Bound, DataEventHandler
+from .types import (
+    DataDeletedEvent,
+    DataEvent,
+    DataUpdatedEvent,
+    OverflowPolicy,
+    is_update_event,
+)
+
+_UNSET: Any = object()
+
+
+class TimedBound(Bound, abc.ABC):
+    """A read-only bound value which forwards the updates of another
+    bound value on a schedule.
+
+    Its `value` is the value it forwarded last (or the value of the other
+    bound value when it was created, until it forwards one). Updates
+    which are held back are forwarded by a timer of the event loop, and
+    count as work in flight for [coil.Runtime.synchronise][]. Deletions
+    are forwarded immediately, and discard the update which is held
+    back, if any.
+
+    Like [computed values][coil.Computed], timed bound values are their
+    own host, and their bound property is `value`; see [coil.debounce][],
+    [coil.throttle][] and [coil.sample][] to create one.
+    """
+
+    operator: ClassVar[str]
+
+    def __init__(self, bound: Bound, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError("seconds must not be negative.")
+
+        self.__coil_bindings__: Dict[str, Dict[int, DataEventHandler]] = {}
+        self.bound = bound
+        self.seconds = seconds
+        self.__value = getattr(bound.host, bound.prop, _UNSET)
+        self.__in_flight: InFlight | None = None
+        self.pending: DataUpdatedEvent | None = None
+        self.timer: asyncio.TimerHandle | None = None
+
+        add_feed(self, "value", bound.host, bound.prop)
+
+        # the subscription doesn't keep the timed value alive
+        handle = add_subscription(bound.host, bound.prop, _weak_handler(self))
+        weakref.finalize(self, drop_subscriptions, [(bound.host, handle)])
+
+    def __repr__(self) -> str:
+        return f"{self.operator}({self.bound!r}, {self.seconds!r})"
+
+    @property
+    def host(self) -> Bindable:
+        return self
+
+    @property
+    def prop(self) -> str:
+        return "value"
+
+    @property
+    def value(self) -> Any:
+        """The value forwarded last."""
+        if self.__value is _UNSET:
+            return self.bound.current
+
+        return self.__value
+
+    def events(
+        self,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> BindingEventStream:
+        # the binding is made for the stream (which keeps the timed value
+        # alive), rather than held by the timed value, which would then
+        # only be freed by the garbage collector
+        binding = Binding(self, "value")
+        return binding.events(maxsize=maxsize, overflow=overflow)
+
+    def _handle_event(self, data_event: DataEvent) -> None:
+        if is_update_event(data_event):
+            self.hold(data_event)
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # there is no timer to forward it later
+                self.forward()
+            else:
+                self.schedule(loop)
+
+        else:
+            self.cancel()
+            self.__value = _UNSET
+            notify_subscribers(
+                self,
+                "value",
+                DataDeletedEvent(
+                    source_event=lineage_for(data_event),
+                    source=self,
+                    propagation=propagation_for(self, "delete", data_event),
+                ),
+            )
+
+    @abc.abstractmethod
+    def schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Schedule the update which was just held back to be forwarded."""
+
+    def hold(self, data_event: DataUpdatedEvent) -> None:
+        """Hold back an update, in place of the one held back before."""
+        if self.pending is None:
+            rt = current_runtime.get(None)
+            self.__in_flight = None if rt is None else rt.in_flight
+
+            if self.__in_flight is not None:
+                self.__in_flight.add()
+
+        self.pending = data_event
+
+    def forward(self) -> None:
+        """Forward the update which is held back (if any)."""
+        source_event, self.pending = self.pending, None
+
+        if source_event is None:
+            return
+
+        try:
+            self.__value = source_event.value
+            notify_subscribers(
+                self,
+                "value",
+                DataUpdatedEvent(
+                    source_event=lineage_for(source_event),
+                    value=source_event.value,
+                    source=self,
+                    propagation=propagation_for(self, "update", source_event),
+                ),
+            )
+        finally:
+            self.__release()
+
+    def cancel(self) -> None:
+        """Discard the update which is held back, and stop the timer."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        if self.pending is not None:
+            self.pending = None
+            self.__release()
+
+    def __release(self) -> None:
+        if self.__in_flight is not None:
+            self.__in_flight.remove()
+            self.__in_flight = None
+
+
+class Debounced(TimedBound):
+    """A [TimedBound][coil._timing.TimedBound] which forwards the latest
+    update once no other update has followed it for `seconds`."""
+
+    operator = "debounce"
+    __deadline = 0.0
+
+    def schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        # the timer is moved lazily, rather than replaced on every update
+        self.__deadline = loop.time() + self.seconds
+
+        if self.timer is None:
+            self.timer = loop.call_at(self.__deadline, self.__expire, loop)
+
+    def __expire(self, loop: asyncio.AbstractEventLoop) -> None:
+        if loop.time() < self.__deadline:
+            self.timer = loop.call_at(self.__deadline, self.__expire, loop)
+        else:
+            self.timer = None
+            self.forward()
+
+
+class Throttled(TimedBound):
+    """A [TimedBound][coil._timing.TimedBound] which forwards an update
+    immediately, and then holds back the updates which follow it for
+    `seconds`; the latest of them is forwarded when the time is up (which
+    holds back the ones that follow it in turn)."""
+
+    operator = "throttle"
+
+    def schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.timer is None:
+            self.__forward_and_wait(loop)
+
+    def __forward_and_wait(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.forward()
+        self.timer = loop.call_later(self.seconds, self.__expire, loop)
+
+    def __expire(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.timer = None
+
+        if self.pending is not None:
+            self.__forward_and_wait(loop)
+
+
+class Sampled(TimedBound):
+    """A [TimedBound][coil._timing.TimedBound] which forwards the latest
+    update every `seconds`, for as long as there are updates."""
+
+    operator = "sample"
+
+    def schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.timer is None:
+            self.timer = loop.call_later(self.seconds, self.__expire)
+
+    def __expire(self) -> None:
+        self.timer = None
+        self.forward()
+
+
+def debounce(bound: Bound, seconds: float) -> Debounced:
+    """Return a bound value which forwards the latest update of `bound`
+    once it has stopped updating for `seconds`.
+
+        import asyncio
+        import coil
+
+        @coil.bindableclass
+        class Sensor:
+            reading: float
+
+        async def main():
+            sensor = Sensor(0.0)
+            target = Sensor(0.0)
+
+            async with coil.runtime() as rt:
+                target.reading = coil.debounce(
+                    Sensor.reading.bind(sensor), 0.01
+                )
+
+                for i in range(1000):
+                    sensor.reading = float(i)
+
+                await rt.synchronise()
+                assert target.reading == 999.0
+
+        asyncio.run(main())
+
+    The returned bound value can be [tailed][coil.tail], and assigned to
+    bindable properties.
+    """
+    return Debounced(bound, seconds)
+
+
+def throttle(bound: Bound, seconds: float) -> Throttled:
+    """Return a bound value which forwards the updates of `bound` at
+    most once every `seconds`.
+
+    The first update is forwarded immediately; the latest update which
+    follows within `seconds` is forwarded when they have elapsed. Like
+    that of [coil.debounce][], the returned bound value can be
+    [tailed][coil.tail], and assigned to bindable properties.
+    """
+    return Throttled(bound, seconds)
+
+
+def sample(bound: Bound, interval: float) -> Sampled:
+    """Return a bound value which forwards the latest update of `bound`
+    every `interval` seconds, while `bound` keeps updating.
+
+    Unlike [coil.debounce][], updates are forwarded while `bound` keeps
+    updating; unlike [coil.throttle][], the first one is held back too.
+    """
+    return Sampled(bound, interval)
@@ -1,12 +1,14 @@
 from ._bindable import Bindable, BindingTarget
 from ._bound import Bound, ReverseBound, TwoWayBound
 from ._data_event_handler import DataEventHandler
+from ._event_stream import EventStream
 
 __all__ = [
     "Bindable",
     "BindingTarget",
     "Bound",
     "DataEventHandler",
+    "EventStream",
     "ReverseBound",
     "TwoWayBound",
 ]
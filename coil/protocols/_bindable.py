@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Protocol, runtime_checkable
+from typing import Any, Dict, Protocol, runtime_checkable
 
 from ._data_event_handler import DataEventHandler
 
@@ -14,8 +14,9 @@ class Bindable(Protocol):
     """
 
     @property
-    def __coil_bindings__(self) -> Dict[str, List[DataEventHandler]]:
-        """Return a mapping of subscribers"""
+    def __coil_bindings__(self) -> Dict[str, Dict[int, DataEventHandler]]:
+        """Return a mapping of subscribers, by property and then by
+        subscription id (in the order they were added)."""
 
 
 class BindingTarget(Protocol):
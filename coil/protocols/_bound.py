@@ -2,20 +2,39 @@
 Protocol for bound values.
 """
 
-from typing import Any, AsyncIterable, Awaitable, Protocol, runtime_checkable
+from typing import Any, Awaitable, Protocol, runtime_checkable
 
-from ..types import DataEvent, DataUpdatedEvent
+from ..types import DataEvent, OverflowPolicy
 from ._bindable import BindingTarget
+from ._event_stream import EventStream
 
 
 @runtime_checkable
 class Bound(BindingTarget, Protocol):
     """An abstraction of a readable bound value."""
 
-    def events(self) -> AsyncIterable[DataUpdatedEvent]:
+    def events(
+        self,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> EventStream:
         """Return an asynchronous stream of value change events.
 
         If the underlying value is destroyed, then the stream will be closed.
+
+        Args:
+            maxsize: The maximum number of events which the stream queues
+                up for its consumer. `0` means no limit.
+            overflow: What to do with new events when the queue is full
+                (see [`OverflowPolicy`][coil.types.OverflowPolicy]).
+
+        Arguments which are not given default to those of the bound value.
+
+        Consumers which are only interested in the latest value should use
+        `maxsize=1` (with the `"drop-oldest"` or `"keep-latest"` policy);
+        such streams keep a single event, and wake their consumer up once
+        per burst of updates rather than once per update.
         """
 
 
@@ -0,0 +1,53 @@
+"""
+Protocol for streams of data events.
+"""
+
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+from ..types import DataUpdatedEvent
+
+S = TypeVar("S", bound="EventStream")
+
+
+@runtime_checkable
+class EventStream(Protocol):
+    """An asynchronous stream of value change events.
+
+    Streams hold on to a subscription for as long as they are open, so
+    they should be closed once they are no longer needed, either
+    explicitly with [`aclose()`][coil.protocols.EventStream.aclose], or by
+    using the stream as an asynchronous context manager:
+
+        async with bind((box, "value")).events() as stream:
+            async for event in stream:
+                ...
+    """
+
+    @property
+    def dropped(self) -> int:
+        """The number of events which were discarded because the stream's
+        queue was full."""
+
+    def __aiter__(self: S) -> S:
+        """Return the stream itself."""
+
+    async def __anext__(self) -> DataUpdatedEvent:
+        """Wait for the next update event.
+
+        Raises `StopAsyncIteration` once the stream is closed, or once the
+        bound value is deleted. Raises `asyncio.QueueFull` if the stream
+        stopped because its queue overflowed.
+        """
+
+    async def aclose(self) -> None:
+        """Stop receiving events, and end the stream.
+
+        Events which were received but not consumed yet are discarded.
+        Closing a stream which is already closed does nothing.
+        """
+
+    async def __aenter__(self: S) -> S:
+        """Return the stream itself."""
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """[Close][coil.protocols.EventStream.aclose] the stream."""
@@ -1,19 +1,36 @@
+from ._changes import Change, Comparator, DictChange, ListChange
 from ._events import (
+    DataChangedEvent,
     DataDeletedEvent,
     DataEvent,
     DataUpdatedEvent,
+    EventType,
+    Propagation,
     get_event_type,
+    get_propagation,
+    is_change_event,
     is_data_event,
     is_delete_event,
     is_update_event,
 )
+from ._streams import OverflowPolicy
 
 __all__ = [
+    "Change",
+    "Comparator",
+    "DataChangedEvent",
     "DataDeletedEvent",
     "DataEvent",
     "DataUpdatedEvent",
+    "DictChange",
+    "EventType",
+    "is_change_event",
     "is_data_event",
     "is_delete_event",
     "is_update_event",
     "get_event_type",
+    "get_propagation",
+    "ListChange",
+    "OverflowPolicy",
+    "Propagation",
 ]
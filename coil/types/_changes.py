@@ -0,0 +1,66 @@
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    NamedTuple,
+    Tuple,
+)
+
+Comparator = Literal["identity", "equality"] | Callable[[Any, Any], bool]
+"""How to tell that an assignment doesn't change the value of a bindable
+property, so that subscribers aren't notified about it.
+
+`"identity"`
+:   The new value is the old value (`new is old`).
+
+`"equality"`
+:   The new value is equal to the old value (`new == old`).
+
+A callable
+:   Called with the old value and the new value, and returns whether
+    they should be considered the same.
+
+The value is assigned either way; only the notification is suppressed.
+Deletions, and assignments to properties which have no value yet, are
+never suppressed.
+"""
+
+
+class ListChange(NamedTuple):
+    """A change of a [bindable list][coil.BindableList]: `removed` items
+    were replaced with the `inserted` ones, starting at `start`.
+
+    Every mutation of a list can be described as such a splice; an
+    `append` is `ListChange(len(before), 0, (item,))`, for instance.
+    """
+
+    start: int
+    removed: int
+    inserted: Tuple[Any, ...]
+
+    def apply(self, target: MutableSequence[Any]) -> None:
+        """Make the same change to another list."""
+        target[slice(self.start, self.start + self.removed)] = self.inserted
+
+
+class DictChange(NamedTuple):
+    """A change of a [bindable dict][coil.BindableDict]: the `deleted`
+    keys were removed, and then the `updated` items were set."""
+
+    updated: Mapping[Any, Any]
+    deleted: Tuple[Any, ...]
+
+    def apply(self, target: MutableMapping[Any, Any]) -> None:
+        """Make the same change to another dict."""
+        for key in self.deleted:
+            target.pop(key, None)
+
+        target.update(self.updated)
+
+
+Change = ListChange | DictChange
+"""A change of a bindable collection, as carried by a
+[`DataChangedEvent`][coil.types.DataChangedEvent]."""
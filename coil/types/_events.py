@@ -1,14 +1,109 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeGuard
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Iterator,
+    List,
+    Literal,
+    Set,
+    Tuple,
+    TypeGuard,
+    overload,
+)
+
+from ._changes import Change
 
 if TYPE_CHECKING:
     from coil.protocols import BindingTarget
 
+EventType = Literal["update", "delete"]
+
+_propagation_ids = count()
+
+
+class Propagation:
+    """Bookkeeping shared by every event of a single propagation wave.
+
+    A wave starts with an event that has no `source_event` (typically an
+    assignment to a bindable property), and includes every event that
+    is derived from it, however deep the chain of bindings goes. Each
+    event records the wave it belongs to, so that cycles can be detected
+    without walking the `source_event` chain.
+
+    `origin`
+    :   A number which uniquely identifies the wave.
+
+    `hops`
+    :   How many bindings the event has travelled through since the start
+        of the wave.
+
+    `cyclic`
+    :   Whether the event was generated for a property which had already
+        received an event of the same type on the way to it (that is,
+        earlier in its own `source_event` chain). Events which reach a
+        property along several paths of the same wave (as in
+        diamond-shaped graphs) aren't cyclic.
+    """
+
+    __slots__ = ("origin", "hops", "cyclic", "_path", "_keys")
+
+    origin: int
+    hops: int
+    cyclic: bool
+
+    # the properties on the way to the event, in order, and as a set; the
+    # events of a chain share them, and each event owns the first
+    # `hops + 1` of them
+    _path: List[Tuple[int, str, EventType]]
+    _keys: Set[Tuple[int, str, EventType]]
+
+    @classmethod
+    def start(cls, source: BindingTarget, kind: EventType) -> Propagation:
+        """Begin a new wave with an event generated from `source`."""
+        key = (id(source.host), source.prop, kind)
+        propagation = cls()
+        propagation.origin = next(_propagation_ids)
+        propagation.hops = 0
+        propagation.cyclic = False
+        propagation._path = [key]
+        propagation._keys = {key}
+        return propagation
+
+    def follow(self, source: BindingTarget, kind: EventType) -> Propagation:
+        """Continue this wave with an event generated from `source`."""
+        key = (id(source.host), source.prop, kind)
+        path, keys = self._path, self._keys
+        length = self.hops + 1
+
+        if len(path) != length:
+            # another event continued the wave from this one already;
+            # this one branches off with a copy of the path up to here
+            path = path[:length]
+            keys = set(path)
 
-class DataEvent(TypedDict):
-    """A typed dict representing a data-event generated from a bound value.
+        propagation = Propagation()
+        propagation.origin = self.origin
+        propagation.hops = length
+        propagation.cyclic = key in keys
+        propagation._path = path
+        propagation._keys = keys
+        path.append(key)
+        keys.add(key)
+        return propagation
+
+    def __repr__(self) -> str:
+        return (
+            f"<Propagation origin={self.origin} hops={self.hops}"
+            f"{' cyclic' if self.cyclic else ''}>"
+        )
+
+
+class DataEvent:
+    """A data-event generated from a bound value.
 
     [`DataUpdatedEvent`][coil.types.DataUpdatedEvent] and
     [`DataDeletedEvent`][coil.types.DataDeletedEvent] are
@@ -31,57 +126,200 @@ class DataEvent(TypedDict):
 
     `value`
     :   This is only present in
-        [`DataUpdatedEvent`][coil.types.DataUpdatedEvent] dicts.
+        [`DataUpdatedEvent`][coil.types.DataUpdatedEvent] events.
 
+    Events are compact objects, so the fields above are available as
+    attributes (`event.source_event`). For compatibility with older
+    versions of coil, in which events were dictionaries, they are also
+    read-only [mappings][collections.abc.Mapping] of the same fields
+    (`event["source_event"]`).
 
-    It is important to bear in mind that these are dictionaries, and not
-    objects. In other words, you can retrieve an event's source using
-    `event["source_event"]`, but not with `event.source_event`.
+    Events also have a `kind` (either `"update"` or `"delete"`), and a
+    `propagation`, which refers to the [`Propagation`][coil.types.Propagation]
+    wave which the event belongs to. These are not part of the mapping.
     """
 
-    source_event: Any
+    __slots__ = ("source_event", "source", "propagation")
+
+    kind: ClassVar[EventType]
+    _fields: ClassVar[Tuple[str, ...]] = ("source_event", "source")
+
+    source_event: DataEvent | None
     source: BindingTarget
+    propagation: Propagation
+
+    def __init__(
+        self,
+        *,
+        source_event: DataEvent | None,
+        source: BindingTarget,
+        propagation: Propagation | None = None,
+    ) -> None:
+        self.source_event = source_event
+        self.source = source
+
+        if propagation is not None:
+            self.propagation = propagation
+        elif source_event is None:
+            self.propagation = Propagation.start(source, self.kind)
+        else:
+            self.propagation = source_event.propagation.follow(
+                source, self.kind
+            )
+
+    @overload
+    def __getitem__(self, key: Literal["source"]) -> BindingTarget:
+        pass
+
+    @overload
+    def __getitem__(self, key: Literal["source_event"]) -> DataEvent | None:
+        pass
+
+    @overload
+    def __getitem__(self, key: str) -> Any:
+        pass
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, key) for key in self._fields)
+
+    def items(self) -> Tuple[Tuple[str, Any], ...]:
+        return tuple((key, getattr(self, key)) for key in self._fields)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DataEvent):
+            return self.kind == other.kind and self.values() == other.values()
+        elif isinstance(other, Mapping):
+            return dict(self.items()) == dict(other)
+        else:
+            return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={val!r}" for key, val in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+Mapping.register(DataEvent)
 
 
 class DataUpdatedEvent(DataEvent):
+    __slots__ = ("value",)
+
+    kind: ClassVar[EventType] = "update"
+    _fields: ClassVar[Tuple[str, ...]] = ("source_event", "source", "value")
+
     value: Any
 
+    def __init__(
+        self,
+        *,
+        source_event: DataEvent | None,
+        source: BindingTarget,
+        value: Any,
+        propagation: Propagation | None = None,
+    ) -> None:
+        self.value = value
+        super().__init__(
+            source_event=source_event, source=source, propagation=propagation
+        )
+
+
+class DataChangedEvent(DataUpdatedEvent):
+    """A [`DataUpdatedEvent`][coil.types.DataUpdatedEvent] for a change
+    made in place to a bindable collection (such as
+    [coil.BindableList][]), rather than an assignment.
+
+    `value` is the collection itself (which may have changed further by
+    the time the event is received), and `change` describes what
+    changed: a [`ListChange`][coil.types.ListChange] or a
+    [`DictChange`][coil.types.DictChange]. Consumers which only care
+    about the value can treat it as any other update.
+
+    `version` counts the changes made to the collection up to (and
+    including) this one, so that a consumer which keeps a copy of the
+    collection can tell whether it missed any. It is not part of the
+    mapping.
+    """
+
+    __slots__ = ("change", "version")
+
+    _fields = ("source_event", "source", "value", "change")
+
+    change: Change
+    version: int
+
+    def __init__(
+        self,
+        *,
+        source_event: DataEvent | None,
+        source: BindingTarget,
+        value: Any,
+        change: Change,
+        version: int,
+        propagation: Propagation | None = None,
+    ) -> None:
+        self.change = change
+        self.version = version
+        super().__init__(
+            source_event=source_event,
+            source=source,
+            value=value,
+            propagation=propagation,
+        )
+
 
 class DataDeletedEvent(DataEvent):
-    pass
+    __slots__ = ()
+
+    kind: ClassVar[EventType] = "delete"
 
 
 def is_data_event(obj: Any) -> TypeGuard[DataEvent]:
     """Check whether an object is a data event."""
-    return (
-        isinstance(obj, Mapping)
-        and "source" in obj
-        and {
-            "source_event",
-            "source",
-            "value",
-        }.issuperset(obj.keys())
-    )
+    return isinstance(obj, DataEvent)
 
 
 def is_delete_event(obj: Any) -> TypeGuard[DataDeletedEvent]:
     """Check whether an object is a DataDeletedEvent"""
-    return isinstance(obj, Mapping) and {"source_event", "source"} == set(
-        obj.keys()
-    )
+    return isinstance(obj, DataDeletedEvent)
 
 
 def is_update_event(obj: Any) -> TypeGuard[DataUpdatedEvent]:
     """Return whether an object is a DataUpdatedEvent"""
-    return isinstance(obj, Mapping) and {
-        "source_event",
-        "source",
-        "value",
-    } == set(obj.keys())
-
-
-def get_event_type(event: DataEvent) -> Literal["update", "delete"]:
-    if "value" in event:
-        return "update"
-    else:
-        return "delete"
+    return isinstance(obj, DataUpdatedEvent)
+
+
+def is_change_event(obj: Any) -> TypeGuard[DataChangedEvent]:
+    """Return whether an object is a DataChangedEvent"""
+    return isinstance(obj, DataChangedEvent)
+
+
+def get_event_type(event: DataEvent) -> EventType:
+    return event.kind
+
+
+def get_propagation(event: DataEvent) -> Propagation:
+    """Return the [`Propagation`][coil.types.Propagation] of an event."""
+    return event.propagation
@@ -0,0 +1,21 @@
+from typing import Literal
+
+OverflowPolicy = Literal["drop-oldest", "drop-newest", "keep-latest", "raise"]
+"""What an event stream does with a new event when its queue is full.
+
+`"drop-oldest"`
+:   Discard the oldest queued event to make room for the new one.
+
+`"drop-newest"`
+:   Discard the new event.
+
+`"keep-latest"`
+:   Discard every queued event, and keep only the new one.
+
+`"raise"`
+:   Stop receiving events. The consumer receives the events which were
+    queued so far, followed by an `asyncio.QueueFull` exception.
+
+Deletion events are never discarded, since they end the stream; the
+oldest queued event is discarded to make room for one instead.
+"""
@@ -0,0 +1,119 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from coil import BindableValue, batch, bind, bindableclass, runtime
+from coil._core import active_batches, add_subscription
+from coil.types import DataEvent, is_delete_event
+
+from .conftest import Box
+
+
+@bindableclass
+class Rect:
+    width: BindableValue[int]
+    height: BindableValue[int]
+
+
+def subscribe(rect: Rect, prop: str) -> List[DataEvent]:
+    received: List[DataEvent] = []
+    add_subscription(rect, prop, received.append)
+    return received
+
+
+def test_batch_sends_final_value_once() -> None:
+    rect = Rect(0, 0)
+    widths = subscribe(rect, "width")
+    heights = subscribe(rect, "height")
+
+    with batch():
+        for i in range(10):
+            rect.width = i
+            rect.height = i * 2
+
+        assert rect.width == 9
+        assert widths == [] and heights == []
+
+    assert [event["value"] for event in widths] == [9]
+    assert [event["value"] for event in heights] == [18]
+
+
+def test_nested_batches_send_on_outermost_exit() -> None:
+    rect = Rect(0, 0)
+    widths = subscribe(rect, "width")
+
+    with batch():
+        rect.width = 1
+
+        with batch():
+            rect.width = 2
+
+        assert widths == []
+        rect.width = 3
+
+    assert [event["value"] for event in widths] == [3]
+
+
+def test_batch_sends_deletions() -> None:
+    rect = Rect(0, 0)
+    widths = subscribe(rect, "width")
+
+    with batch():
+        rect.width = 1
+        del rect.width
+
+    (event,) = widths
+    assert is_delete_event(event)
+
+
+def test_batch_sends_notifications_on_error() -> None:
+    rect = Rect(0, 0)
+    widths = subscribe(rect, "width")
+
+    with pytest.raises(ValueError):
+        with batch():
+            rect.width = 1
+            raise ValueError()
+
+    assert [event["value"] for event in widths] == [1]
+
+
+def test_batches_defer_assignments_before_subscriptions() -> None:
+    rect = Rect(0, 0)
+    assert active_batches.count == 0
+
+    with pytest.raises(ValueError):
+        with batch():
+            with batch():
+                rect.width = 1
+
+            # the assignment wasn't observed, but it was deferred
+            assert active_batches.count == 1
+            widths = subscribe(rect, "width")
+            raise ValueError
+
+    assert active_batches.count == 0
+    assert [event["value"] for event in widths] == [1]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_defers_two_way_binding_updates() -> None:
+    source = Box(0)
+    target = Box(0)
+
+    async with runtime():
+        target.value = Box.value.bind(source)
+        received = subscribe(target, "value")  # type: ignore
+
+        async with batch():
+            binding = bind((source, "value"), readonly=False)
+            for i in range(10):
+                await binding.set(i)
+            await asyncio.sleep(0)
+            assert received == []
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    assert [event["value"] for event in received] == [9]
@@ -1,10 +1,25 @@
 import asyncio
+import copy
+import gc
+import pickle
+import sys
+import weakref
+from typing import Any, List
 from unittest import mock
 
 import pytest
 
-from coil import BindableValue, bindableclass, runtime
-from coil._core import notify_subscribers
+from coil import (
+    BindableValue,
+    Runtime,
+    batch,
+    bind,
+    bindableclass,
+    field,
+    runtime,
+)
+from coil._bindableclass import TAIL_BINDING_TASK_ID
+from coil._core import add_subscription, notify_subscribers
 from coil.protocols import Bindable
 
 from .conftest import Box
@@ -176,3 +191,330 @@ async def wait_for_value(box: Box, value: int) -> None:
 async def long_sleep() -> None:
     for i in range(10):
         await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lineage_depth", [0, 1, 3])
+async def test_runtime_lineage_depth_bounds_forwarded_events(
+    lineage_depth: int,
+) -> None:
+    boxes = [Box(0) for _ in range(10)]
+    received = []
+
+    async with Runtime(lineage_depth=lineage_depth):
+        for box, next_box in zip(boxes, boxes[1:]):
+            next_box.value = Box.value.bind(box)
+
+        add_subscription(boxes[-1], "value", received.append)
+        boxes[0].value = 42
+        await asyncio.wait_for(wait_for_value(boxes[-1], 42), timeout=1)
+
+    (event,) = received
+    assert event.propagation.hops == len(boxes) - 1
+
+    lineage = []
+    while event["source_event"] is not None:
+        event = event["source_event"]
+        lineage.append(event)
+
+    assert len(lineage) == lineage_depth
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ro_bind", [True, False])
+async def test_eager_runtime_propagates_synchronously(ro_bind: bool) -> None:
+    source = Box(0)
+    target = Box(101)
+
+    async with Runtime(eager=True) as rt:
+        target.value = Box.value.bind(source, readonly=ro_bind)
+        assert target.value == source.value
+
+        for i in range(100):
+            source.value = i
+            assert target.value == i
+
+        target.value = -1
+        assert source.value == (i if ro_bind else -1)
+
+        # there are no tasks other than the runtime's own
+        task = rt.find(TAIL_BINDING_TASK_ID, source=(target, "value"))
+        assert task is not None and not isinstance(task, asyncio.Task)
+
+        Box.value.clear_last_binding(assigned_to=target)
+        await long_sleep()
+        assert task.cancelled()
+
+        source.value = 1000
+        assert target.value != source.value
+
+
+@pytest.mark.asyncio
+async def test_eager_bindings_eliminate_cyclic_events() -> None:
+    source = Box(0)
+    target = Box(100)
+    back_feeder = Box(1)
+
+    async with Runtime(eager=True):
+        target.value = Box.value.bind(source, readonly=True)
+        back_feeder.value = Box.value.bind(target, readonly=True)
+        source.value = Box.value.bind(back_feeder, readonly=True)
+
+        source.value = 10
+        assert target.value == back_feeder.value == 10
+
+        back_feeder.value = 50
+        assert source.value == target.value == 50
+
+
+@pytest.mark.asyncio
+async def test_long_eager_chains_dont_recurse() -> None:
+    boxes = [Box(0) for _ in range(sys.getrecursionlimit())]
+
+    async with Runtime(eager=True):
+        for box, next_box in zip(boxes, boxes[1:]):
+            next_box.value = Box.value.bind(box)  # type: ignore
+
+        for i in range(1, 4):
+            boxes[0].value = i
+            assert [box.value for box in boxes] == [i] * len(boxes)
+
+
+@pytest.mark.asyncio
+async def test_eager_binding_ends_when_value_deleted() -> None:
+    source = Box(0)
+    target = Box(101)
+
+    async with Runtime(eager=True) as rt:
+        target.value = Box.value.bind(source)
+        task = rt.find(TAIL_BINDING_TASK_ID, source=(target, "value"))
+        assert task is not None
+
+        del source.value
+        assert task.done() and not task.cancelled()
+
+        await long_sleep()
+        assert "value" not in source.__coil_bindings__
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+@pytest.mark.parametrize("ro_bind", [True, False])
+async def test_binding_tasks_end_when_target_is_collected(
+    eager: bool, ro_bind: bool
+) -> None:
+    source = Box(0)
+    target = Box(101)
+
+    async with Runtime(eager=eager) as rt:
+        target.value = Box.value.bind(source, readonly=ro_bind)
+        source.value = 1
+        target.value = 2
+        await long_sleep()
+
+        task = rt.find(TAIL_BINDING_TASK_ID, source=(target, "value"))
+        assert task is not None
+
+        target_ref = weakref.ref(target)
+        del target
+        gc.collect()
+
+        assert target_ref() is None
+        await long_sleep()
+        assert task.cancelled()
+        assert len(rt._Runtime__tasks) == 1  # type: ignore
+
+        source.value = 3
+        await long_sleep()
+        assert "value" not in source.__coil_bindings__
+
+
+@bindableclass(suppress="equality")
+class Suppressed:
+    equal: BindableValue[List[int]]
+    same: BindableValue[List[int]] = field(
+        default_factory=list, suppress="identity"
+    )
+    close: BindableValue[float] = field(
+        default=0.0, suppress=lambda old, new: abs(old - new) < 0.5
+    )
+    every: BindableValue[int] = field(default=0, suppress=None)
+
+
+def updates_of(host: Any, prop: str) -> List[Any]:
+    received: List[Any] = []
+    add_subscription(
+        host, prop, lambda event: received.append(event.get("value"))
+    )
+    return received
+
+
+@pytest.mark.parametrize(
+    "prop, assigned, expected",
+    [
+        ("equal", [[1], [1], [2], [2]], [[1], [2]]),
+        ("same", [[1], [1], [2], [2]], [[1], [1], [2], [2]]),
+        ("close", [0.2, 0.9, 1.0, 1.6], [0.9, 1.6]),
+        ("every", [0, 0, 1, 1], [0, 0, 1, 1]),
+    ],
+)
+def test_suppressed_assignments_dont_notify(
+    prop: str, assigned: List[Any], expected: List[Any]
+) -> None:
+    obj = Suppressed([0])
+    received = updates_of(obj, prop)
+
+    for value in assigned:
+        setattr(obj, prop, value)
+        assert getattr(obj, prop) is value
+
+    assert received == expected
+
+
+def test_identical_assignments_dont_allocate_events() -> None:
+    value = [1]
+    obj = Suppressed([0], same=value)
+
+    with mock.patch(
+        "coil._bindableclass.DataUpdatedEvent"
+    ) as event_cls, mock.patch(
+        "coil._bindableclass.notify_subscribers"
+    ) as notify:
+        obj.same = value
+        obj.equal = [0]
+
+    event_cls.assert_not_called()
+    notify.assert_not_called()
+
+
+def test_suppressed_two_way_binding_sets() -> None:
+    obj = Suppressed([0])
+    received = updates_of(obj, "equal")
+    binding = bind((obj, "equal"), readonly=False)
+
+    binding.set_nowait([0])
+    binding.set_nowait([1])
+    binding.set_nowait([1])
+
+    assert received == [[1]]
+    assert Box.value.suppress is None
+
+
+@bindableclass(slots=True)
+class Slotted:
+    value: BindableValue[int]
+    label: BindableValue[str] = "slotted"
+
+
+@bindableclass(slots=True)
+class SlottedChild(Slotted):
+    extra: BindableValue[int] = 0
+
+
+class Named:
+    def describe(self) -> str:
+        return type(self).__name__
+
+
+class Outer:
+    @bindableclass(slots=True)
+    class Nested(Named):
+        value: BindableValue[int]
+
+        def describe(self) -> str:
+            return f"{super().describe()}({self.value})"
+
+
+def test_subscriber_tables_are_created_on_first_subscription(box: Box) -> None:
+    assert "__coil_bindings__" not in vars(box)
+    assert box.__coil_bindings__ == {}
+    assert isinstance(box, Bindable)
+
+    received = updates_of(box, "value")
+    box.value = 11
+
+    assert received == [11]
+    assert vars(box)["__coil_bindings__"] == box.__coil_bindings__
+
+
+@pytest.mark.parametrize("cls", [Slotted, SlottedChild])
+def test_slotted_bindable_classes(cls: Any) -> None:
+    obj = cls(1)
+
+    assert not hasattr(obj, "__dict__")
+    assert isinstance(obj, Bindable)
+    assert weakref.ref(obj)() is obj
+    assert obj.__coil_bindings__ == {}
+    assert (obj.value, obj.label) == (1, "slotted")
+
+    received = updates_of(obj, "value")
+    obj.value = 2
+    del obj.value
+
+    assert received == [2, None]
+    assert "value" in obj.__coil_bindings__
+
+
+@pytest.mark.parametrize("cls", [Slotted, SlottedChild])
+def test_slotted_bindable_classes_can_be_pickled(cls: Any) -> None:
+    obj = cls(1)
+    updates_of(obj, "value")
+
+    for clone in (pickle.loads(pickle.dumps(obj)), copy.copy(obj)):
+        assert clone == obj and clone.label == "slotted"
+
+        # subscribers stay with the original
+        assert clone.__coil_bindings__ == {}
+        received = updates_of(clone, "value")
+        clone.value = 2
+        assert received == [2] and obj.value == 1
+
+
+def test_nested_slotted_bindable_classes_can_be_pickled() -> None:
+    obj = Outer.Nested(1)
+    clone = pickle.loads(pickle.dumps(obj))
+
+    assert Outer.Nested.__qualname__ == "Outer.Nested"
+    assert clone == obj
+
+
+def test_slotted_bindable_classes_can_call_super() -> None:
+    assert Outer.Nested(1).describe() == "Nested(1)"
+
+
+@pytest.mark.asyncio
+async def test_slotted_bindable_classes_can_be_bound() -> None:
+    source, target = Slotted(1), Slotted(0)
+
+    async with Runtime() as rt:
+        target.value = Slotted.value.bind(source)  # type: ignore
+        source.value = 2
+        await rt.synchronise()
+
+        assert target.value == 2
+
+
+def test_unobserved_assignments_dont_allocate_events(box: Box) -> None:
+    assert type(Box.value).__set__ is not BindableValue.__set__
+
+    notify = mock.Mock()
+
+    # the generated accessors are bound to the globals they were made with
+    with mock.patch.dict(
+        type(Box.value).__set__.__globals__, notify_subscribers=notify
+    ):
+        box.value = 11
+        assert box.value == 11
+        notify.assert_not_called()
+
+        add_subscription(box, "value", lambda event: None)
+        box.value = 12
+        notify.assert_called_once()
+
+
+def test_batched_assignments_notify_later_subscribers(box: Box) -> None:
+    with batch():
+        box.value = 11
+        received = updates_of(box, "value")
+
+    assert received == [11]
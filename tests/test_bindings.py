@@ -1,13 +1,23 @@
 import asyncio
+import gc
+import weakref
 from typing import Any, AsyncIterable, List, Tuple, cast
 
 import pytest
 from aiostream import pipe, stream
 
-from coil import bind
-from coil.protocols import Bindable, Bound, TwoWayBound
+from coil import BindableValue, bind, bindableclass, runtime
+from coil._core import add_subscription
+from coil._scheduler import _feeds
+from coil.protocols import Bindable, Bound, EventStream, TwoWayBound
+from coil.types import (
+    DataEvent,
+    OverflowPolicy,
+    is_delete_event,
+    is_update_event,
+)
 
-from .conftest import Size, Window
+from .conftest import Box, Size, Window
 
 
 @pytest.mark.asyncio
@@ -21,10 +31,6 @@ async def test_bind_produces_result_stream(
     await asyncio.sleep(0)
 
     sent_sizes = []
-
-    async def drain(s: AsyncIterable[Any]) -> List[Any]:
-        return await stream.list(s)
-
     task = asyncio.create_task(drain(event_stream))
 
     for i in range(num_values):
@@ -64,3 +70,400 @@ async def test_binding_types(bindargs: Tuple[Bindable, str]) -> None:
     assert not isinstance(bind(bindargs, readonly=True), TwoWayBound)
     assert isinstance(bind(bindargs, readonly=False), Bound)
     assert isinstance(bind(bindargs, readonly=False), TwoWayBound)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_unsubscribes_on_exit(box: Box) -> None:
+    async with bind((box, "value")).events() as events:
+        assert isinstance(events, EventStream)
+        assert box.__coil_bindings__["value"]
+
+        box.value = 11
+        box.value = 12
+        assert (await events.__anext__())["value"] == 11
+
+    assert "value" not in box.__coil_bindings__
+
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_closing_event_stream_ends_pending_iteration(box: Box) -> None:
+    events = bind((box, "value")).events()
+    consumer = asyncio.create_task(drain(events))
+    await asyncio.sleep(0)
+
+    box.value = 11
+    await asyncio.sleep(0)
+    await events.aclose()
+    await events.aclose()
+
+    assert [event["value"] for event in await consumer] == [11]
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_event_stream_closes_when_value_deleted(box: Box) -> None:
+    events = bind((box, "value")).events()
+    del box.value
+
+    assert await drain(events) == []
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_unclosed_event_stream_warns_in_debug_mode(box: Box) -> None:
+    asyncio.get_running_loop().set_debug(True)
+    events = bind((box, "value")).events()
+
+    with pytest.warns(ResourceWarning, match="unclosed event stream"):
+        del events
+        gc.collect()
+
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_weak_binding_does_not_keep_host_alive() -> None:
+    box = Box(0)
+    binding = bind((box, "value"), weak=True)
+    events = binding.events()
+
+    assert binding.weak and binding.host is box
+    assert repr(binding) == f"Binding({box!r}, 'value')"
+
+    del box
+    gc.collect()
+
+    with pytest.raises(ReferenceError):
+        binding.host
+
+    assert repr(binding) == "Binding(<collected>, 'value')"
+    await events.aclose()
+    assert await drain(events) == []
+
+
+async def drain(s: AsyncIterable[Any]) -> List[Any]:
+    return await stream.list(s)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overflow,expected,dropped",
+    [
+        # the deletion event always makes room for itself
+        ("drop-oldest", [4], 4),
+        ("drop-newest", [1], 4),
+        ("keep-latest", [4], 4),
+    ],
+)
+@pytest.mark.parametrize("broadcast", [False, True])
+async def test_event_stream_overflow_policies(
+    box: Box,
+    overflow: OverflowPolicy,
+    expected: List[int],
+    dropped: int,
+    broadcast: bool,
+) -> None:
+    events = bind((box, "value"), broadcast=broadcast).events(
+        maxsize=2, overflow=overflow
+    )
+
+    for i in range(5):
+        box.value = i
+    del box.value
+
+    assert [event["value"] for event in await drain(events)] == expected
+    assert events.dropped == dropped
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("broadcast", [False, True])
+async def test_event_stream_overflow_policy_raise(
+    box: Box, broadcast: bool
+) -> None:
+    events = Box.value.bind(
+        box, maxsize=2, overflow="raise", broadcast=broadcast
+    ).events()
+
+    for i in range(5):
+        box.value = i
+
+    assert (await events.__anext__())["value"] == 0
+    assert (await events.__anext__())["value"] == 1
+
+    with pytest.raises(asyncio.QueueFull):
+        await events.__anext__()
+
+    assert events.dropped == 1
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_event_stream_options_default_to_binding(box: Box) -> None:
+    binding = bind((box, "value"), maxsize=1, overflow="drop-newest")
+
+    async with binding.events() as events:
+        assert events.new_data.maxsize == 1
+        assert events.overflow == "drop-newest"
+
+    async with binding.events(maxsize=3, overflow="raise") as events:
+        assert events.new_data.maxsize == 3
+        assert events.overflow == "raise"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("overflow", ["drop-oldest", "keep-latest"])
+@pytest.mark.parametrize("broadcast", [False, True])
+async def test_latest_only_event_stream_conflates_bursts(
+    box: Box, overflow: OverflowPolicy, broadcast: bool
+) -> None:
+    events = bind((box, "value"), broadcast=broadcast).events(
+        maxsize=1, overflow=overflow
+    )
+    received = []
+
+    async def consume() -> None:
+        async for event in events:
+            received.append(event["value"])
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+
+    for burst in range(3):
+        for i in range(1000):
+            box.value = burst * 1000 + i
+        await asyncio.sleep(0)
+
+    del box.value
+    await consumer
+
+    assert received == [999, 1999, 2999]
+    assert events.dropped == 2997
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_latest_only_event_stream_deletion_ends_stream(box: Box) -> None:
+    events = bind((box, "value")).events(maxsize=1)
+
+    box.value = 11
+    del box.value
+
+    assert await drain(events) == []
+    assert events.dropped == 1
+
+    events = bind((box, "value")).events(maxsize=1)
+    consumer = asyncio.create_task(drain(events))
+    await asyncio.sleep(0)
+    await events.aclose()
+
+    assert await consumer == []
+
+
+@pytest.mark.asyncio
+async def test_broadcast_streams_share_one_subscription(box: Box) -> None:
+    binding = bind((box, "value"), broadcast=True)
+    streams = [binding.events() for _ in range(100)]
+    other = Box.value.bind(box, broadcast=True).events()
+
+    assert len(box.__coil_bindings__["value"]) == 1
+    buffers = {id(events.buffer) for events in [*streams, other]}
+    assert buffers == {id(other.buffer)}
+
+    consumers = [asyncio.create_task(drain(events)) for events in streams]
+    await asyncio.sleep(0)
+
+    for i in range(3):
+        box.value = i
+    del box.value
+
+    for consumer in consumers:
+        assert [event["value"] for event in await consumer] == [0, 1, 2]
+
+    assert "value" in box.__coil_bindings__
+    await other.aclose()
+    assert "value" not in box.__coil_bindings__
+
+
+@pytest.mark.asyncio
+async def test_broadcast_buffer_releases_events_behind_all_streams(
+    box: Box,
+) -> None:
+    binding = bind((box, "value"), broadcast=True)
+    slow = binding.events(maxsize=10)
+    unbounded = binding.events()
+
+    for i in range(1000):
+        box.value = i
+
+        if i % 2:
+            await unbounded.__anext__()
+
+    # the buffer was compacted while the slow stream lagged behind
+    assert 10 < slow.lag < 1000
+    assert len(slow.buffer.events) <= 1000
+    assert (await slow.__anext__())["value"] == 990
+    assert slow.dropped == 990
+
+    await unbounded.aclose()
+
+    for i in range(1000):
+        box.value = i
+
+    assert len(slow.buffer.events) < 100
+    await slow.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_broadcast_reader_leaves_others_waiting(
+    box: Box,
+) -> None:
+    binding = bind((box, "value"), broadcast=True)
+    cancelled, waiting = binding.events(), binding.events()
+    tasks = [
+        asyncio.create_task(cancelled.__anext__()),
+        asyncio.create_task(waiting.__anext__()),
+    ]
+    await asyncio.sleep(0)
+
+    tasks[0].cancel()
+    await asyncio.sleep(0)
+    box.value = 1
+
+    assert (await tasks[1])["value"] == 1
+    assert tasks[0].cancelled()
+
+
+@bindableclass
+class Address:
+    city: BindableValue[str]
+
+
+@bindableclass
+class Customer:
+    address: BindableValue[Address]
+
+
+@bindableclass
+class Order:
+    customer: BindableValue[Customer]
+
+
+def order(city: str) -> Order:
+    return Order(Customer(Address(city)))
+
+
+def path_events(path: Bound) -> List[DataEvent]:
+    received: List[DataEvent] = []
+    add_subscription(path.host, path.prop, received.append)
+    return received
+
+
+def subscriptions(obj: Bindable) -> int:
+    return sum(map(len, obj.__coil_bindings__.values()))
+
+
+def test_path_bindings_follow_replaced_links() -> None:
+    obj = order("Paris")
+    path = bind((obj, "customer.address.city"))
+    received = path_events(path)
+    old_customer = obj.customer
+
+    assert isinstance(path, Bound) and path.current == "Paris"
+
+    obj.customer.address.city = "Rome"
+    obj.customer = Customer(Address("Oslo"))
+    obj.customer.address = Address("Oslo")  # the city didn't change
+    old_customer.address.city = "Lima"  # no longer on the path
+
+    assert [event["value"] for event in received] == ["Rome", "Oslo"]
+    assert all(event.source is path for event in received)
+    assert received[-1].source_event is not None
+
+    # only the links which follow the replaced one are resubscribed
+    assert subscriptions(obj) == 1
+    assert subscriptions(old_customer) == 0
+    assert subscriptions(old_customer.address) == 0
+    assert subscriptions(obj.customer.address) == 1
+
+    # and the feeds of the replaced links are dropped along with them
+    assert len(_feeds[id(path)]["value"]) == 3
+
+
+def test_path_bindings_forward_broken_paths() -> None:
+    obj = order("Paris")
+    path = Order.customer.bind(obj, "address.city")
+    received = path_events(path)
+
+    del obj.customer.address
+    obj.customer.address = Address("Rome")
+    del obj.customer.address.city
+
+    assert is_delete_event(received[0]) and is_delete_event(received[2])
+    assert received[1]["value"] == "Rome"
+
+    with pytest.raises(AttributeError):
+        path.current
+
+
+def test_path_bindings_dont_keep_path_alive() -> None:
+    obj = order("Paris")
+    path = bind((obj, "customer.address.city"))
+    path_events(path)
+    assert subscriptions(obj.customer.address) == 1
+
+    del path
+    gc.collect()
+    assert subscriptions(obj) == subscriptions(obj.customer.address) == 0
+
+    weak = bind((obj, "customer.address.city"), weak=True)
+    del obj
+    gc.collect()
+
+    with pytest.raises(ReferenceError):
+        weak.current
+
+
+def test_unreferenced_path_bindings_are_freed_promptly() -> None:
+    obj = order("Paris")
+    path = bind((obj, "customer.address.city"))
+    path_events(path)
+    path_ref = weakref.ref(path)
+    gc.disable()
+
+    try:
+        # without the garbage collector, unlike values in reference cycles
+        del path
+        assert path_ref() is None
+        assert subscriptions(obj) == subscriptions(obj.customer.address) == 0
+    finally:
+        gc.enable()
+
+
+@pytest.mark.asyncio
+async def test_two_way_path_bindings() -> None:
+    obj, other = order("Paris"), order("Oslo")
+    path = bind((obj, "customer.address.city"), readonly=False)
+    received = path_events(path)
+
+    assert isinstance(path, TwoWayBound)
+    await path.set("Rome")
+    assert obj.customer.address.city == "Rome"
+    assert [event["value"] for event in received] == ["Rome"]
+
+    async with runtime() as rt:
+        other.customer.address.city = path  # type: ignore
+        await rt.synchronise()
+        assert other.customer.address.city == "Rome"
+
+        obj.customer = Customer(Address("Lima"))
+        await rt.synchronise()
+        assert other.customer.address.city == "Lima"
+
+        other.customer.address.city = "Kyiv"
+        await rt.synchronise()
+        assert obj.customer.address.city == "Kyiv"
+
+    assert all(is_update_event(event) for event in received)
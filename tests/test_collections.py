@@ -0,0 +1,283 @@
+import pickle
+from typing import Any, Callable, List
+
+import pytest
+
+from coil import (
+    BindableDict,
+    BindableList,
+    BindableValue,
+    Runtime,
+    batch,
+    bind,
+    bindableclass,
+    runtime,
+    tail,
+)
+from coil._core import add_subscription
+from coil.types import (
+    DataEvent,
+    DictChange,
+    ListChange,
+    is_change_event,
+    is_update_event,
+)
+
+
+@bindableclass
+class Inventory:
+    items: BindableValue[BindableList[Any]]
+    stock: BindableValue[BindableDict[str, int]]
+
+
+@bindableclass(slots=True)
+class SlottedInventory:
+    items: BindableValue[BindableList[Any]]
+    stock: BindableValue[BindableDict[str, int]]
+
+
+def inventory(*items: Any, **stock: int) -> Inventory:
+    return Inventory(BindableList(items), BindableDict(stock))
+
+
+def subscribe(obj: Any, prop: str) -> List[DataEvent]:
+    received: List[DataEvent] = []
+    add_subscription(obj, prop, received.append)
+    return received
+
+
+def changes(received: List[DataEvent]) -> List[Any]:
+    return [event.change for event in received if is_change_event(event)]
+
+
+@pytest.mark.parametrize(
+    "mutate, expected",
+    [
+        (lambda items: items.append(4), ListChange(3, 0, (4,))),
+        (lambda items: items.extend([4, 5]), ListChange(3, 0, (4, 5))),
+        (lambda items: items.insert(-1, 0), ListChange(2, 0, (0,))),
+        (lambda items: items.insert(10, 0), ListChange(3, 0, (0,))),
+        (lambda items: items.pop(), ListChange(2, 1, ())),
+        (lambda items: items.pop(0), ListChange(0, 1, ())),
+        (lambda items: items.remove(2), ListChange(1, 1, ())),
+        (lambda items: items.__setitem__(-1, 0), ListChange(2, 1, (0,))),
+        (
+            lambda items: items.__setitem__(slice(1, None), [0]),
+            ListChange(1, 2, (0,)),
+        ),
+        (lambda items: items.__delitem__(-2), ListChange(1, 1, ())),
+        (lambda items: items.__delitem__(slice(2)), ListChange(0, 2, ())),
+        (lambda items: items.__iadd__([4]), ListChange(3, 0, (4,))),
+        (lambda items: items.__imul__(2), ListChange(3, 0, (1, 2, 3))),
+        (lambda items: items.clear(), ListChange(0, 3, ())),
+        (lambda items: items.reverse(), ListChange(0, 3, (3, 2, 1))),
+        (lambda items: items.sort(reverse=True), ListChange(0, 3, (3, 2, 1))),
+        (
+            lambda items: items.__delitem__(slice(None, None, 2)),
+            ListChange(0, 3, (2,)),
+        ),
+    ],
+)
+def test_list_mutations_announce_changes(
+    mutate: Callable[[BindableList[int]], Any], expected: ListChange
+) -> None:
+    obj = inventory(1, 2, 3)
+    received = subscribe(obj, "items")
+    before = list(obj.items)
+
+    mutate(obj.items)
+
+    assert changes(received) == [expected]
+    assert received[0]["value"] is obj.items
+    assert received[0].version == obj.items._version == 1
+
+    expected.apply(before)
+    assert before == obj.items
+
+
+@pytest.mark.parametrize(
+    "mutate, expected",
+    [
+        (lambda stock: stock.__setitem__("b", 3), DictChange({"b": 3}, ())),
+        (lambda stock: stock.__delitem__("a"), DictChange({}, ("a",))),
+        (lambda stock: stock.pop("a"), DictChange({}, ("a",))),
+        (lambda stock: stock.popitem(), DictChange({}, ("b",))),
+        (lambda stock: stock.update(c=0), DictChange({"c": 0}, ())),
+        (lambda stock: stock.setdefault("c", 0), DictChange({"c": 0}, ())),
+        (lambda stock: stock.__ior__({"a": 0}), DictChange({"a": 0}, ())),
+        (lambda stock: stock.clear(), DictChange({}, ("a", "b"))),
+    ],
+)
+def test_dict_mutations_announce_changes(
+    mutate: Callable[[BindableDict[str, int]], Any], expected: DictChange
+) -> None:
+    obj = inventory(a=1, b=2)
+    received = subscribe(obj, "stock")
+    before = dict(obj.stock)
+
+    mutate(obj.stock)
+
+    assert changes(received) == [expected]
+    expected.apply(before)
+    assert before == obj.stock
+
+
+def test_unchanged_collections_announce_nothing() -> None:
+    obj = inventory(1, a=1)
+    received = subscribe(obj, "items") + subscribe(obj, "stock")
+
+    obj.items.extend([])
+    obj.items[5:] = []
+    obj.stock.update({})
+    obj.stock.pop("b", None)
+    obj.stock.setdefault("a", 0)
+
+    assert received == []
+
+
+@pytest.mark.parametrize("cls", [Inventory, SlottedInventory])
+def test_collections_are_announced_by_their_property(cls: Any) -> None:
+    items = BindableList([1])
+    obj = cls(items, BindableDict())
+    other = cls(BindableList(), BindableDict())
+    received = subscribe(obj, "items")
+
+    # a collection belongs to a single property; the other gets a copy
+    other.items = items
+    assert other.items == items and other.items is not items
+
+    items.append(2)
+    other.items.append(3)
+    assert changes(received) == [ListChange(1, 0, (2,))]
+
+    # ...until the property holds another value
+    obj.items = BindableList()
+    items.append(3)
+    assert len(received) == 2
+
+    other.items = items
+    assert other.items is items
+
+
+def test_unowned_collections_are_plain() -> None:
+    items = BindableList([1, 2])
+    items.append(3)
+
+    assert items == [1, 2, 3] and isinstance(items, list)
+    assert repr(items) == "BindableList([1, 2, 3])"
+    assert repr(BindableDict(a=1)) == "BindableDict({'a': 1})"
+    assert pickle.loads(pickle.dumps(items)) == items
+
+
+def test_two_way_bindings_take_ownership() -> None:
+    obj = inventory()
+    received = subscribe(obj, "items")
+
+    bind((obj, "items"), readonly=False).set_nowait(BindableList([1]))
+    obj.items.append(2)
+
+    assert [event["value"] for event in received] == [[1, 2]] * 2
+    assert is_change_event(received[-1])
+
+
+def test_batch_replaces_changes_with_final_value() -> None:
+    obj = inventory()
+    received = subscribe(obj, "items")
+
+    with batch():
+        obj.items.append(1)
+        obj.items.append(2)
+
+    assert len(received) == 1
+    assert is_update_event(received[0]) and not is_change_event(received[0])
+    assert received[0]["value"] == [1, 2]
+
+    with batch():
+        obj.items.append(3)
+
+    assert changes(received) == [ListChange(2, 0, (3,))]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_tails_apply_changes_in_place(eager: bool) -> None:
+    source = inventory(1, 2, a=1)
+    target = inventory()
+    target_items = target.items
+    received = subscribe(target, "items")
+
+    async with Runtime(eager=eager) as rt:
+        tail(
+            bind((source, "items")),
+            into=bind((target, "items"), readonly=False),
+            eager=eager,
+        )
+        tail(
+            bind((source, "stock")),
+            into=bind((target, "stock"), readonly=False),
+            eager=eager,
+        )
+
+        source.items.append(3)
+        source.items.pop(0)
+        source.stock["b"] = 2
+        del source.stock["a"]
+        await rt.synchronise()
+
+    assert target.items is target_items
+    assert target.items == [2, 3] and target.stock == {"b": 2}
+
+    # the first change brings the target up to date; the rest is applied
+    # (an eager tail gets each change as it's made, while a task finds
+    # the later ones already included by then)
+    if eager:
+        assert changes(received) == [
+            ListChange(0, 0, (1, 2, 3)),
+            ListChange(0, 1, ()),
+        ]
+    else:
+        assert changes(received) == [ListChange(0, 0, (2, 3))]
+
+    assert all(event.source_event is not None for event in received)
+
+
+@pytest.mark.asyncio
+async def test_tails_catch_up_with_missed_changes() -> None:
+    source = inventory(1)
+    target = inventory()
+
+    async with runtime() as rt:
+        # a conflating stream drops all but the latest change
+        tail(
+            bind((source, "items"), maxsize=1),
+            into=bind((target, "items"), readonly=False),
+        )
+        source.items.append(2)
+        await rt.synchronise()
+
+        for i in range(3, 6):
+            source.items.append(i)
+
+        await rt.synchronise()
+
+    assert target.items == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_assigned_bindings_mirror_collections(eager: bool) -> None:
+    source = inventory(1)
+    target = inventory()
+
+    async with Runtime(eager=eager) as rt:
+        bound = Inventory.items.bind(source, readonly=False)
+        target.items = bound  # type: ignore
+        target_items = target.items
+
+        source.items.append(2)
+        await rt.synchronise()
+        target.items.append(3)
+        await rt.synchronise()
+
+    assert source.items == target.items == [1, 2, 3]
+    assert target.items is target_items
@@ -0,0 +1,323 @@
+import asyncio
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterable, List
+from unittest import mock
+
+import pytest
+
+from coil import BindableValue, Runtime, bindableclass, computed, runtime, tail
+from coil._core import add_subscription
+from coil._scheduler import _feeds
+from coil.protocols import Bound
+from coil.types import DataEvent, is_update_event
+
+from .conftest import Box
+
+
+@bindableclass
+class Item:
+    price: BindableValue[float]
+    qty: BindableValue[int]
+
+
+def total_of(item: Item, fn: Any = None) -> Any:
+    return computed(
+        fn or (lambda price, qty: price * qty),
+        Item.price.bind(item),
+        Item.qty.bind(item),
+    )
+
+
+def test_computed_is_bound() -> None:
+    total = total_of(Item(2.5, 4))
+
+    assert isinstance(total, Bound)
+    assert total.host is total and total.prop == "value"
+    assert total.current == total.value == 10.0
+
+
+def test_computed_value_is_lazy_and_memoized() -> None:
+    item = Item(2.5, 4)
+    fn = mock.Mock(side_effect=lambda price, qty: price * qty)
+    total = total_of(item, fn)
+
+    fn.assert_not_called()
+    assert total.value == total.value == 10.0
+    fn.assert_called_once_with(2.5, 4)
+
+    item.qty = 1
+    item.price = 3.0
+    assert total.dirty
+    assert fn.call_count == 1
+
+    assert total.value == total.value == 3.0
+    assert fn.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_computed_notifies_subscribers_once_per_burst() -> None:
+    item = Item(2.5, 4)
+    fn = mock.Mock(side_effect=lambda price, qty: price * qty)
+    total = total_of(item, fn)
+    received = subscribe(total)
+
+    for qty in range(10):
+        item.qty = qty
+    item.price = 1.0
+
+    assert received == []
+    await asyncio.sleep(0)
+
+    assert [event["value"] for event in received] == [9.0]
+    assert fn.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_computed_forwards_deletions() -> None:
+    item = Item(2.5, 4)
+    total = total_of(item)
+    events = total.events()
+
+    item.qty = 5
+    del item.price
+
+    assert await drain(events) == []
+    await asyncio.sleep(0)
+    assert total.dirty
+
+
+@pytest.mark.asyncio
+async def test_computed_can_be_tailed_and_assigned() -> None:
+    item = Item(2.5, 4)
+    tailed = Box(0)
+    assigned = Box(0)
+
+    async with runtime() as rt:
+        task = tail(
+            total_of(item), into=Box.value.bind(tailed, readonly=False)
+        )
+        assigned.value = total_of(item)  # type: ignore
+        assert assigned.value == 10.0
+
+        item.qty = 2
+        await rt.synchronise()
+        assert tailed.value == assigned.value == 5.0
+
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_computed_events_join_the_propagation_wave() -> None:
+    item = Item(2.5, 4)
+    total = total_of(item)
+    received = subscribe(total)
+
+    item.qty = 2
+    await asyncio.sleep(0)
+    [event] = received
+
+    assert is_update_event(event)
+    assert event.propagation.hops == 1
+    assert event.source_event is not None
+    assert event.source_event["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_computed_diamonds_refresh_once_per_change() -> None:
+    item = Item(1.0, 1)
+    price = Item.price.bind(item)
+    doubled = computed(lambda p: p * 2, price)
+    plus_one = computed(lambda p: p + 1, price)
+    plus_two = computed(lambda p: p + 1, plus_one)
+    seen: List[Any] = []
+
+    def combine(*args: float) -> float:
+        seen.append(args)
+        return sum(args)
+
+    total = computed(combine, price, doubled, plus_two)
+    received = subscribe(total)
+    assert total.rank == 3
+
+    for i in range(2, 5):
+        item.price = float(i)
+        await asyncio.sleep(0)
+
+    assert seen == [(i, i * 2, i + 2) for i in (2.0, 3.0, 4.0)]
+    assert [event["value"] for event in received] == [10.0, 14.0, 18.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_diamonds_through_assigned_properties_are_glitch_free(
+    eager: bool,
+) -> None:
+    source, left, right = Box(0), Box(0), Box(0)
+    seen: List[Any] = []
+
+    def combine(left: int, right: int) -> int:
+        seen.append((left, right))
+        return left + right
+
+    async with Runtime(eager=eager) as rt:
+        left.value = computed(  # type: ignore
+            lambda value: value * 2, Box.value.bind(source)
+        )
+        right.value = Box.value.bind(source)  # type: ignore
+        total = computed(combine, Box.value.bind(left), Box.value.bind(right))
+        received = subscribe(total)
+        await rt.synchronise()
+
+        for i in range(1, 4):
+            source.value = i
+            await rt.synchronise()
+
+    assert seen == [(2, 1), (4, 2), (6, 3)]
+    assert [event["value"] for event in received] == [3, 6, 9]
+
+
+@pytest.mark.asyncio
+async def test_assigned_properties_rank_above_what_feeds_them() -> None:
+    source, target = Box(0), Box(0)
+    doubled = computed(lambda value: value * 2, Box.value.bind(source))
+
+    async with runtime():
+        target.value = doubled  # type: ignore
+
+        assert doubled.rank == 1
+        assert computed(lambda v: v, Box.value.bind(target)).rank == 3
+
+
+class SlowTarget:
+    """A bound property which takes until `done` to be set."""
+
+    def __init__(self, host: Box) -> None:
+        self.host = host
+        self.prop = "value"
+        self.done = asyncio.Event()
+
+    async def set(self, value: Any, source_event: Any = None) -> None:
+        await self.done.wait()
+        self.host.value = value
+
+
+@pytest.mark.asyncio
+async def test_deliveries_only_hold_back_what_they_feed() -> None:
+    source, target, other = Box(0), Box(0), Box(0)
+    slow = SlowTarget(target)
+    derived = [
+        computed(lambda value: value, Box.value.bind(box))
+        for box in (target, other)
+    ]
+    fed, unrelated = map(subscribe, derived)
+
+    async with runtime() as rt:
+        tail(Box.value.bind(source), into=slow)
+        await asyncio.sleep(0)
+
+        source.value = 1
+        await asyncio.sleep(0)
+        other.value = 1
+        target.value = 2
+        await asyncio.sleep(0.01)
+
+        # the delivery into target is pending
+        assert [event["value"] for event in unrelated] == [1]
+        assert fed == []
+
+        slow.done.set()
+        await rt.synchronise()
+        assert [event["value"] for event in fed] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_rebinding_drops_the_feeds_of_former_sources(
+    eager: bool,
+) -> None:
+    target = Box(0)
+    sources = [Box(n) for n in range(100)]
+
+    async with Runtime(eager=eager) as rt:
+        for source in sources:
+            target.value = Box.value.bind(source)  # type: ignore
+
+        await rt.synchronise()
+        assert list(_feeds[id(target)]["value"]) == [
+            (id(sources[-1]), "value")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_executors_dont_hold_back_what_they_feed() -> None:
+    source, target = Box(0), Box(0)
+    release = threading.Event()
+    derived = computed(lambda value: value, Box.value.bind(target))
+    fed = subscribe(derived)
+
+    def transform(value: int) -> int:
+        release.wait(5)
+        return value
+
+    with ThreadPoolExecutor(1) as executor:
+        try:
+            async with runtime() as rt:
+                tail(
+                    Box.value.bind(source),
+                    into=Box.value.bind(target, readonly=False),
+                    transform=transform,
+                    executor=executor,
+                )
+                await asyncio.sleep(0)
+
+                source.value = 1
+                await asyncio.sleep(0)
+                target.value = 2
+                await asyncio.sleep(0.01)
+
+                # the transform is still running
+                assert [event["value"] for event in fed] == [2]
+
+                release.set()
+                await rt.synchronise()
+                assert [event["value"] for event in fed] == [2, 1]
+        finally:
+            release.set()
+
+
+def test_unreferenced_computed_is_freed_promptly() -> None:
+    item = Item(2.5, 4)
+    total = total_of(item)
+    total_ref = weakref.ref(total)
+    gc.disable()
+
+    try:
+        # without the garbage collector, unlike values in reference cycles
+        del total
+        assert total_ref() is None
+        assert item.__coil_bindings__ == {}
+    finally:
+        gc.enable()
+
+
+def test_collected_computed_drops_its_subscriptions() -> None:
+    item = Item(2.5, 4)
+    total = total_of(item)
+    assert "price" in item.__coil_bindings__
+
+    del total
+    gc.collect()
+    assert item.__coil_bindings__ == {}
+
+
+def subscribe(bound: Bound) -> List[DataEvent]:
+    received: List[DataEvent] = []
+    add_subscription(bound.host, bound.prop, received.append)
+    return received
+
+
+async def drain(s: AsyncIterable[Any]) -> List[Any]:
+    return [event async for event in s]
@@ -1,18 +1,17 @@
 import asyncio
-from typing import Iterator, Protocol
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Protocol, Tuple
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
-from coil import bind
-from coil._core import (
-    add_subscription,
-    drop_subscription,
-    notify_subscribers,
-    tail,
-)
+from coil import Runtime, bind
+from coil._core import add_subscription, drop_subscription, notify_subscribers
+from coil._tail import tail
 from coil.protocols import BindingTarget
-from coil.types import DataUpdatedEvent
+from coil.types import DataEvent, DataUpdatedEvent
 
 from .conftest import Box, Size, Window
 
@@ -95,3 +94,326 @@ async def test_cyclic_events_are_not_notified(
     assert last_coil_record.message.startswith(
         "Event has a cyclic trigger. It will not be propagated:"
     )
+
+
+@pytest.mark.asyncio
+async def test_diamonds_of_eager_tails_deliver_every_path() -> None:
+    top, left, right, bottom = Box(0), Box(0), Box(0), Box(0)
+
+    def link(source: Box, target: Box, transform: Any = None) -> None:
+        tail(
+            Box.value.bind(source),
+            into=Box.value.bind(target, readonly=False),
+            eager=True,
+            transform=transform,
+        )
+
+    link(top, left, lambda value: value + 1)
+    link(top, right, lambda value: value * 2)
+    link(left, bottom)
+    link(right, bottom)
+    received = []
+    add_subscription(bottom, "value", lambda e: received.append(e["value"]))
+
+    top.value = 5
+
+    # the update which comes second along its own path isn't a cycle
+    assert received == [6, 10]
+    assert bottom.value == 10
+
+
+@pytest.mark.asyncio
+async def test_forwarded_events_share_propagation(
+    subscribe: Subscriber,
+) -> None:
+    box1 = Box(1)
+    box2 = Box(2)
+    mock1 = subscribe(Box.value.bind(box1))
+    mock2 = subscribe(Box.value.bind(box2))
+
+    box1.value = 10
+    (evt1,), _ = mock1.call_args
+    await bind((box2, "value"), readonly=False).set(10, source_event=evt1)
+    (evt2,), _ = mock2.call_args
+
+    assert evt2.propagation.origin == evt1.propagation.origin
+    assert evt2.propagation.hops == evt1.propagation.hops + 1
+    assert not evt2.propagation.cyclic
+
+    # feeding the event back into its origin completes a cycle
+    await bind((box1, "value"), readonly=False).set(10, source_event=evt2)
+    assert mock1.call_count == 1
+
+
+def test_subscription_handles_are_unique(box: Box) -> None:
+    handler = MagicMock()
+    handle1 = add_subscription(box, "value", handler)
+    handle2 = add_subscription(box, "value", handler)
+    assert handle1 != handle2
+
+    drop_subscription(box, handle1)
+    box.value = 11
+    assert handler.call_count == 1
+
+    with pytest.raises(LookupError):
+        drop_subscription(box, handle1)
+
+    drop_subscription(box, handle2)
+    box.value = 12
+    assert handler.call_count == 1
+
+
+def test_subscriptions_notified_in_insertion_order(box: Box) -> None:
+    received = []
+    handles = [
+        add_subscription(box, "value", lambda evt, i=i: received.append(i))
+        for i in range(5)
+    ]
+    drop_subscription(box, handles[2])
+
+    box.value = 11
+    assert received == [0, 1, 3, 4]
+
+
+def test_handlers_can_drop_subscriptions_while_notified(box: Box) -> None:
+    received = []
+
+    def drop_self(evt: DataEvent) -> None:
+        received.append(evt)
+        drop_subscription(box, handle)
+
+    handle = add_subscription(box, "value", drop_self)
+    other = MagicMock()
+    add_subscription(box, "value", other)
+
+    box.value = 11
+    box.value = 12
+    assert len(received) == 1
+    assert other.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_from_other_threads_are_notified_on_the_loop(
+    box: Box,
+) -> None:
+    loop = asyncio.get_running_loop()
+    received: List[int] = []
+    threads = set()
+
+    def receive(event: DataEvent) -> None:
+        received.append(event["value"])
+        threads.add(threading.get_ident())
+
+    def write() -> None:
+        for i in range(1000):
+            box.value = i
+
+    add_subscription(box, "value", receive)
+
+    with mock.patch.object(
+        loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+    ) as call_soon_threadsafe:
+        await loop.run_in_executor(None, write)
+        await asyncio.sleep(0)
+
+    assert received == list(range(1000))
+    assert threads == {threading.get_ident()}
+    assert call_soon_threadsafe.call_count < 1000
+
+
+@pytest.mark.asyncio
+async def test_subscribers_are_notified_on_their_own_loops(box: Box) -> None:
+    other_loop = asyncio.new_event_loop()
+    other_thread = threading.Thread(target=other_loop.run_forever)
+    threads: Dict[str, int] = {}
+    notified_there = threading.Event()
+
+    def receive_as(name: str) -> Any:
+        def receive(event: DataEvent) -> None:
+            threads[name] = threading.get_ident()
+
+            if name == "there":
+                notified_there.set()
+
+        return receive
+
+    async def subscribe_there() -> None:
+        add_subscription(box, "value", receive_as("there"))
+
+    other_thread.start()
+
+    try:
+        add_subscription(box, "value", receive_as("here"))
+        asyncio.run_coroutine_threadsafe(subscribe_there(), other_loop).result(
+            5
+        )
+
+        box.value = 1
+        assert threads["here"] == threading.get_ident()
+        assert notified_there.wait(5)
+        assert threads["there"] == other_thread.ident
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        other_thread.join()
+        other_loop.close()
+
+
+def test_subscriptions_can_be_changed_from_several_threads(box: Box) -> None:
+    def churn(_: int) -> None:
+        for _ in range(1000):
+            handle = add_subscription(box, "value", lambda event: None)
+            box.value = 1
+            drop_subscription(box, handle)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(churn, range(8)))
+
+    assert "value" not in box.__coil_bindings__
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def tail_squares(source: Box, target: Box, **kwargs: Any) -> Any:
+    return tail(
+        Box.value.bind(source),
+        into=Box.value.bind(target, readonly=False),
+        transform=square,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager", [False, True])
+async def test_tail_transforms_changes(box: Box, eager: bool) -> None:
+    target = Box(0)
+
+    async with Runtime() as rt:
+        task = tail_squares(box, target, eager=eager)
+        box.value = 3
+        await rt.synchronise()
+
+        assert target.value == 9
+        task.cancel()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor]
+)
+async def test_tail_runs_transforms_in_executors(
+    box: Box, executor_cls: Any
+) -> None:
+    target = Box(0)
+
+    with executor_cls(1) as executor:
+        async with Runtime() as rt:
+            task = tail_squares(box, target, executor=executor)
+            box.value = 3
+            await rt.synchronise()
+
+            assert target.value == 9
+            task.cancel()
+
+
+def test_eager_tail_cant_offload_transforms(box: Box) -> None:
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            tail_squares(box, Box(0), eager=True, executor=executor)
+
+
+@pytest.fixture
+def blocked_square() -> Iterator[Tuple[threading.Event, Any]]:
+    release = threading.Event()
+
+    def transform(value: int) -> int:
+        if value == 1:
+            release.wait(5)
+        return value * value
+
+    yield release, transform
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_offloaded_tail_discards_stale_results(
+    box: Box, blocked_square: Tuple[threading.Event, Any]
+) -> None:
+    release, transform = blocked_square
+    target = Box(0)
+    received: List[int] = []
+    add_subscription(target, "value", lambda e: received.append(e["value"]))
+
+    with ThreadPoolExecutor(2) as executor:
+        async with Runtime() as rt:
+            task = tail(
+                Box.value.bind(box),
+                into=Box.value.bind(target, readonly=False),
+                transform=transform,
+                executor=executor,
+            )
+            box.value = 1
+            await asyncio.sleep(0.01)
+            box.value = 2
+            await rt.synchronise()
+
+            release.set()
+            await asyncio.sleep(0.01)
+            assert received == [4]
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_evicted_offloaded_tail_discards_pending_result(
+    box: Box, blocked_square: Tuple[threading.Event, Any]
+) -> None:
+    release, transform = blocked_square
+    target = Box(0)
+
+    with ThreadPoolExecutor(1) as executor:
+        async with Runtime() as rt:
+            task = tail(
+                Box.value.bind(box),
+                into=Box.value.bind(target, readonly=False),
+                transform=transform,
+                executor=executor,
+            )
+            rt.register(task, "tail")
+            box.value = 1
+            await asyncio.sleep(0.01)
+
+            rt.evict("tail")
+            await rt.synchronise()
+            release.set()
+            await asyncio.sleep(0.01)
+
+            assert task.cancelled()
+            assert target.value == 0
+
+
+@pytest.mark.asyncio
+async def test_offloaded_tail_delivers_last_result_on_deletion(
+    box: Box, blocked_square: Tuple[threading.Event, Any]
+) -> None:
+    release, transform = blocked_square
+    target = Box(0)
+
+    with ThreadPoolExecutor(1) as executor:
+        async with Runtime():
+            task = tail(
+                Box.value.bind(box),
+                into=Box.value.bind(target, readonly=False),
+                transform=transform,
+                executor=executor,
+            )
+            box.value = 1
+            await asyncio.sleep(0.01)
+
+            # like a tail without an executor, the last change is delivered
+            del box.value
+            await asyncio.sleep(0.01)
+            release.set()
+            await task
+
+            assert target.value == 1
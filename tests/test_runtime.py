@@ -1,10 +1,12 @@
 import asyncio
 import contextlib
-from typing import Any, AsyncIterator, Callable
+import gc
+from typing import Any, AsyncIterator, Callable, Dict
 
 import pytest
 import pytest_asyncio
 
+from coil import bind, tail
 from coil._runtime import Runtime, runtime
 from tests.conftest import Box
 
@@ -232,3 +234,235 @@ async def test_exceptions_in_registered_tasks_are_suppressed_and_logged(
     )
     assert type(exc) is last_error_record.exc_info[0]
     assert exc is last_error_record.exc_info[1]
+
+
+@pytest.mark.asyncio
+async def test_evict_many_tasks_of_a_binding(
+    box: Box, task_factory: TaskFactory
+) -> None:
+    task1 = task_factory()
+    task2 = task_factory()
+    task3 = task_factory()
+
+    async with runtime() as rt:
+        rt.register(task1, "foo", source=(box, "value"))
+        rt.register(task2, "bar", source=(box, "value"))
+        rt.register(task3, "foo")
+
+        rt.evict_many(["foo", "bar", "baz"], source=(box, "value"))
+
+        assert rt.find("foo", source=(box, "value")) is None
+        assert rt.find("bar", source=(box, "value")) is None
+        assert rt.find("foo") is task3
+
+        for i in range(10):
+            await asyncio.sleep(0)
+
+        assert task1.cancelled()
+        assert task2.cancelled()
+        assert not task3.done()
+
+
+@pytest.mark.asyncio
+async def test_evict_all_tasks_of_a_host(
+    task_factory: TaskFactory,
+) -> None:
+    box1 = Box(0)
+    box2 = Box(0)
+    box1_tasks = [task_factory() for _ in range(3)]
+    box2_task = task_factory()
+
+    async with runtime() as rt:
+        rt.register(box1_tasks[0], "foo", source=(box1, "value"))
+        rt.register(box1_tasks[1], "bar", source=(box1, "value"))
+        rt.register(box1_tasks[2], "foo", source=(box1, "other"))
+        rt.register(box2_task, "foo", source=(box2, "value"))
+
+        rt.evict_all(source_host=box1)
+        rt.evict_all(source_host=box1)
+
+        assert rt.find("foo", source=(box1, "value")) is None
+        assert rt.find("bar", source=(box1, "value")) is None
+        assert rt.find("foo", source=(box1, "other")) is None
+        assert rt.find("foo", source=(box2, "value")) is box2_task
+
+        for i in range(10):
+            await asyncio.sleep(0)
+
+        assert all(task.cancelled() for task in box1_tasks)
+        assert not box2_task.done()
+
+
+@pytest.mark.asyncio
+async def test_forget_task_registered_by_several_ids(
+    box: Box, task_factory: TaskFactory
+) -> None:
+    task = task_factory()
+
+    async with runtime() as rt:
+        rt.register(task, "foo")
+        rt.register(task, "foo", source=(box, "value"))
+        rt.forget(task)
+
+        assert rt.find("foo") is None
+        assert rt.find("foo", source=(box, "value")) is None
+
+        rt.evict_all(source_host=box)
+
+    assert not task.done()
+
+
+@pytest.mark.asyncio
+async def test_tasks_of_collected_host_are_evicted(
+    task_factory: TaskFactory,
+) -> None:
+    box = Box(0)
+    task1 = task_factory()
+    task2 = task_factory()
+    task3 = task_factory()
+
+    async with runtime() as rt:
+        rt.register(task1, "foo", source=(box, "value"))
+        rt.register(task2, "bar", source=(box, "other"))
+        rt.register(task3, "foo")
+
+        del box
+        gc.collect()
+
+        assert rt.find("foo") is task3
+        assert len(rt._Runtime__tasks) == 2  # type: ignore
+
+        await asyncio.sleep(0)
+
+        assert task1.cancelled() and task2.cancelled()
+        assert not task3.done()
+
+
+def test_shutdown_timeout_must_not_be_negative() -> None:
+    with pytest.raises(ValueError):
+        Runtime(shutdown_timeout=-1)
+
+
+@pytest.mark.asyncio
+async def test_pending_evictions_are_cancelled_on_context_exit(
+    box: Box, task_factory: TaskFactory
+) -> None:
+    tasks = [task_factory() for _ in range(3000)]
+
+    async with runtime() as rt:
+        for i, task in enumerate(tasks):
+            rt.register(task, f"{i}", source=(box, "value"))
+
+        for i in range(0, len(tasks), 2):
+            rt.evict(f"{i}", source=(box, "value"))
+
+    assert all(task.cancelled() for task in tasks)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_timeout_abandons_stubborn_tasks(
+    caplog: pytest.LogCaptureFixture, task_factory: TaskFactory
+) -> None:
+    release = asyncio.Event()
+
+    async def _stubborn() -> None:
+        while not release.is_set():
+            with contextlib.suppress(asyncio.CancelledError):
+                await release.wait()
+
+    stubborn_task = asyncio.create_task(_stubborn())
+    task = task_factory()
+    await asyncio.sleep(0)
+
+    async with Runtime(shutdown_timeout=0.01) as rt:
+        rt.register(stubborn_task, "stubborn")
+        rt.register(task, "task")
+
+    assert task.cancelled()
+    assert not stubborn_task.done()
+    assert any(
+        record.levelname == "WARNING"
+        and record.name == "coil.runtime"
+        and "shutdown deadline" in record.message
+        for record in caplog.records
+    )
+
+    release.set()
+    await stubborn_task
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ro_bind", [True, False])
+async def test_synchronise_waits_for_tails_to_settle(ro_bind: bool) -> None:
+    boxes = [Box(0) for _ in range(20)]
+
+    async with runtime() as rt:
+        await rt.synchronise()
+
+        for source, target in zip(boxes, boxes[1:]):
+            target.value = Box.value.bind(source, readonly=ro_bind)
+
+        await rt.synchronise()
+
+        for i in range(10):
+            boxes[0].value = i
+
+        await rt.synchronise()
+        assert [box.value for box in boxes] == [9] * len(boxes)
+        assert rt.in_flight.count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"broadcast": True}, {"maxsize": 1, "overflow": "keep-latest"}],
+)
+async def test_tails_count_in_flight_events_without_resubscribing(
+    options: Dict[str, Any]
+) -> None:
+    source, target = Box(0), Box(0)
+
+    async with runtime() as rt:
+        task = tail(
+            bind((source, "value"), **options),
+            into=bind((target, "value"), readonly=False),
+        )
+        assert len(source.__coil_bindings__["value"]) == 1
+
+        for i in range(10):
+            source.value = i
+
+        assert rt.in_flight.count > 0
+        await rt.synchronise()
+        assert target.value == 9
+        assert rt.in_flight.count == 0
+
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_synchronise_waits_for_evictions(
+    box: Box, task_factory: TaskFactory
+) -> None:
+    release = asyncio.Event()
+
+    async def _slow_to_cancel() -> None:
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            await release.wait()
+
+    task = asyncio.create_task(_slow_to_cancel())
+    await asyncio.sleep(0)
+
+    async with runtime() as rt:
+        rt.register(task, "slow", source=(box, "value"))
+        rt.evict("slow", source=(box, "value"))
+
+        synchronised = asyncio.create_task(rt.synchronise())
+        await asyncio.sleep(0.01)
+        assert not synchronised.done()
+
+        release.set()
+        await synchronised
+        assert task.cancelled()
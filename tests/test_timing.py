@@ -0,0 +1,210 @@
+import asyncio
+import gc
+import weakref
+from typing import Any, AsyncIterator, List
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+from coil import Runtime, debounce, runtime, sample, tail, throttle
+from coil._core import add_subscription
+from coil._timing import TimedBound
+from coil.protocols import Bound
+from coil.types import DataEvent, is_delete_event
+
+from .conftest import Box
+
+WAIT = 0.02
+
+
+class Clock:
+    """Stands in for the clock of the event loop, so that timers expire
+    when the tests advance the time, rather than after real delays."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    async def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+        # a few iterations of the loop run the timers which are due, and
+        # what they set off
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture
+async def clock() -> AsyncIterator[Clock]:
+    loop = asyncio.get_running_loop()
+    clock = Clock(loop.time())
+
+    with mock.patch.object(loop, "time", clock.time):
+        yield clock
+
+
+def subscribe(bound: Bound) -> List[DataEvent]:
+    received: List[DataEvent] = []
+    add_subscription(bound.host, bound.prop, received.append)
+    return received
+
+
+def values(received: List[DataEvent]) -> List[Any]:
+    return [event["value"] for event in received]
+
+
+@pytest.mark.parametrize("operator", [debounce, throttle, sample])
+def test_timed_bounds_are_bound(box: Box, operator: Any) -> None:
+    timed = operator(Box.value.bind(box), WAIT)
+
+    assert isinstance(timed, Bound)
+    assert timed.host is timed and timed.prop == "value"
+    assert timed.current == timed.value == 10
+
+    with pytest.raises(ValueError):
+        operator(Box.value.bind(box), -1)
+
+
+@pytest.mark.parametrize("operator", [debounce, throttle, sample])
+def test_unreferenced_timed_bounds_are_freed_promptly(
+    box: Box, operator: Any
+) -> None:
+    timed = operator(Box.value.bind(box), WAIT)
+    timed_ref = weakref.ref(timed)
+    gc.disable()
+
+    try:
+        # without the garbage collector, unlike values in reference cycles
+        del timed
+        assert timed_ref() is None
+        assert box.__coil_bindings__ == {}
+    finally:
+        gc.enable()
+
+
+def test_timed_bounds_must_schedule_updates(box: Box) -> None:
+    with pytest.raises(TypeError):
+        TimedBound(Box.value.bind(box), WAIT)  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_debounce_forwards_latest_update_when_quiet(
+    box: Box, clock: Clock
+) -> None:
+    debounced = debounce(Box.value.bind(box), WAIT)
+    received = subscribe(debounced)
+
+    for i in range(5):
+        box.value = i
+        await clock.advance(WAIT / 4)
+
+    assert received == []
+    assert debounced.value == 10
+
+    await clock.advance(WAIT * 2)
+    assert values(received) == [4]
+    assert debounced.value == 4
+
+
+@pytest.mark.asyncio
+async def test_throttle_forwards_first_and_latest_updates(
+    box: Box, clock: Clock
+) -> None:
+    throttled = throttle(Box.value.bind(box), WAIT)
+    received = subscribe(throttled)
+
+    for i in range(100):
+        box.value = i
+
+    assert values(received) == [0]
+
+    await clock.advance(WAIT * 1.5)
+    assert values(received) == [0, 99]
+
+    await clock.advance(WAIT)
+    box.value = 100
+    assert values(received) == [0, 99, 100]
+
+
+@pytest.mark.asyncio
+async def test_sample_forwards_latest_update_every_interval(
+    box: Box, clock: Clock
+) -> None:
+    sampled = sample(Box.value.bind(box), WAIT)
+    received = subscribe(sampled)
+
+    for i in range(100):
+        box.value = i
+
+    assert received == []
+
+    await clock.advance(WAIT * 1.5)
+    assert values(received) == [99]
+    assert sampled.timer is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operator", [debounce, throttle, sample])
+async def test_timed_bounds_forward_deletions(
+    box: Box, clock: Clock, operator: Any
+) -> None:
+    timed = operator(Box.value.bind(box), WAIT)
+    received = subscribe(timed)
+
+    box.value = 1
+    box.value = 2
+    del box.value
+
+    assert is_delete_event(received[-1])
+    assert timed.pending is None and timed.timer is None
+
+    await clock.advance(WAIT * 1.5)
+    assert is_delete_event(received[-1])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operator", [debounce, throttle, sample])
+async def test_timed_bounds_can_be_tailed_and_assigned(
+    box: Box, clock: Clock, operator: Any
+) -> None:
+    tailed = Box(0)
+    assigned = Box(0)
+
+    async with runtime() as rt:
+        task = tail(
+            operator(Box.value.bind(box), WAIT),
+            into=Box.value.bind(tailed, readonly=False),
+        )
+        assigned.value = operator(Box.value.bind(box), WAIT)  # type: ignore
+        assert assigned.value == 10
+
+        for i in range(100):
+            box.value = i
+
+        await clock.advance(WAIT)
+        await rt.synchronise()
+        assert tailed.value == assigned.value == 99
+
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_synchronise_waits_for_held_back_updates(
+    box: Box, clock: Clock
+) -> None:
+    async with Runtime() as rt:
+        debounced = debounce(Box.value.bind(box), WAIT)
+        received = subscribe(debounced)
+        box.value = 1
+
+        assert rt.in_flight.count == 1
+        synchronised = asyncio.ensure_future(rt.synchronise())
+        await clock.advance(WAIT / 2)
+        assert not synchronised.done()
+
+        await clock.advance(WAIT / 2)
+        await synchronised
+        assert values(received) == [1]
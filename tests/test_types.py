@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import Any, Callable
 
 import pytest
@@ -5,6 +6,7 @@ import pytest
 from coil.types import (
     DataDeletedEvent,
     DataUpdatedEvent,
+    get_propagation,
     is_data_event,
     is_delete_event,
     is_update_event,
@@ -72,3 +74,66 @@ def test_predicate_functions(
     func: Callable[[Any], bool], obj: Any, expected: bool
 ) -> None:
     assert func(obj) == expected
+
+
+def test_propagation_of_events_without_one() -> None:
+    box = Box(10)
+    evt1 = DataUpdatedEvent(
+        source_event=None, source=Box.value.bind(box), value=11
+    )
+    evt2 = DataDeletedEvent(source_event=evt1, source=Box.value.bind(box))
+    evt3 = DataUpdatedEvent(
+        source_event=evt2, source=Box.value.bind(box), value=11
+    )
+
+    assert get_propagation(evt1).hops == 0
+    assert not get_propagation(evt1).cyclic
+    assert get_propagation(evt2).hops == 1
+    assert not get_propagation(evt2).cyclic
+    assert get_propagation(evt3).hops == 2
+    assert get_propagation(evt3).cyclic
+
+
+def test_propagation_cycles_follow_the_path_of_events() -> None:
+    top, left, right, bottom = (Box.value.bind(Box(0)) for _ in range(4))
+    start = DataUpdatedEvent(source_event=None, source=top, value=1)
+
+    def follow(event: DataUpdatedEvent, source: Any) -> DataUpdatedEvent:
+        return DataUpdatedEvent(source_event=event, source=source, value=1)
+
+    # a diamond reaches the bottom twice, along different paths
+    via_left = follow(follow(start, left), bottom)
+    via_right = follow(follow(start, right), bottom)
+    assert not get_propagation(via_left).cyclic
+    assert not get_propagation(via_right).cyclic
+    assert get_propagation(via_right).hops == 2
+
+    # ...while a cycle comes back to where its path started
+    assert get_propagation(follow(via_right, top)).cyclic
+    assert not get_propagation(follow(via_right, left)).cyclic
+
+
+def test_events_are_read_only_mappings() -> None:
+    source = Box.value.bind(Box(10))
+    updated = DataUpdatedEvent(source_event=None, source=source, value=11)
+    deleted = DataDeletedEvent(source_event=updated, source=source)
+
+    assert isinstance(updated, Mapping)
+    assert dict(updated) == {
+        "source_event": None,
+        "source": source,
+        "value": 11,
+    }
+    assert dict(deleted) == {"source_event": updated, "source": source}
+    assert deleted["source_event"]["value"] == 11
+    assert "value" in updated and "value" not in deleted
+    assert deleted.get("value") is None
+
+    with pytest.raises(KeyError):
+        deleted["value"]
+
+    assert updated == dict(updated)
+    assert updated == DataUpdatedEvent(
+        source_event=None, source=source, value=11
+    )
+    assert updated != DataDeletedEvent(source_event=None, source=source)